@@ -13,10 +13,19 @@ else:
 # Monkeypatch BaseSubprocessTransport.__del__ to handle closed event loops gracefully
 from asyncio import base_subprocess
 
+from browser_use.agent.pool import AgentPool
 from browser_use.agent.prompts import SystemPrompt
 from browser_use.agent.service import Agent
 from browser_use.agent.views import ActionModel, ActionResult, AgentHistoryList
-from browser_use.browser import Browser, BrowserConfig, BrowserContext, BrowserContextConfig, BrowserProfile, BrowserSession
+from browser_use.browser import (
+	Browser,
+	BrowserConfig,
+	BrowserContext,
+	BrowserContextConfig,
+	BrowserPool,
+	BrowserProfile,
+	BrowserSession,
+)
 from browser_use.controller.service import Controller
 from browser_use.dom.service import DomService
 from browser_use.llm import (
@@ -52,10 +61,12 @@ base_subprocess.BaseSubprocessTransport.__del__ = _patched_del
 
 __all__ = [
 	'Agent',
+	'AgentPool',
 	'Browser',
 	'BrowserConfig',
 	'BrowserSession',
 	'BrowserProfile',
+	'BrowserPool',
 	'Controller',
 	'DomService',
 	'SystemPrompt',
@@ -8,6 +8,8 @@ from bubus import BaseEvent
 from pydantic import Field, field_validator
 from uuid_extensions import uuid7str
 
+from browser_use.llm.messages import get_base64_image_media_type
+
 MAX_STRING_LENGTH = 100000  # 100K chars ~ 25k tokens should be enough
 MAX_URL_LENGTH = 100000
 MAX_TASK_LENGTH = 100000
@@ -155,7 +157,8 @@ class CreateAgentStepEvent(BaseEvent):
 		# Capture screenshot as base64 data URL if available
 		screenshot_url = None
 		if browser_state_summary.screenshot:
-			screenshot_url = f'data:image/png;base64,{browser_state_summary.screenshot}'
+			media_type = get_base64_image_media_type(browser_state_summary.screenshot)
+			screenshot_url = f'data:{media_type};base64,{browser_state_summary.screenshot}'
 
 		return cls(
 			user_id='',  # To be filled by cloud handler
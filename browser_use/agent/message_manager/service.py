@@ -22,7 +22,7 @@ from browser_use.llm.messages import (
 	SystemMessage,
 )
 from browser_use.observability import observe_debug
-from browser_use.utils import match_url_with_domain_pattern, time_execution_sync
+from browser_use.utils import DomainMatcher, SensitiveDataRedactor, time_execution_sync
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +129,19 @@ class MessageManager:
 		if len(self.state.history.get_messages()) == 0:
 			self._add_message_with_type(self.system_prompt, 'system')
 
+	@property
+	def sensitive_data(self) -> dict[str, str | dict[str, str]] | None:
+		return self._sensitive_data
+
+	@sensitive_data.setter
+	def sensitive_data(self, sensitive_data: dict[str, str | dict[str, str]] | None) -> None:
+		# compile the secret values once here instead of for every message (assign a new dict to change the secrets)
+		self._sensitive_data = sensitive_data
+		self._sensitive_data_redactor = SensitiveDataRedactor(sensitive_data)
+		self._sensitive_data_domain_matcher = DomainMatcher(
+			(key for key, value in (sensitive_data or {}).items() if isinstance(value, dict)), log_warnings=True
+		)
+
 	@property
 	def agent_history_description(self) -> str:
 		"""Build agent history description from list of items, respecting max_history_items limit"""
@@ -228,10 +241,12 @@ class MessageManager:
 		# Collect placeholders for sensitive data
 		placeholders: set[str] = set()
 
+		matching_domains = set(self._sensitive_data_domain_matcher.matching_patterns(current_page_url))
+
 		for key, value in sensitive_data.items():
 			if isinstance(value, dict):
 				# New format: {domain: {key: value}}
-				if match_url_with_domain_pattern(current_page_url, key, True):
+				if key in matching_domains:
 					placeholders.update(value.keys())
 			else:
 				# Old format: {key: value}
@@ -364,30 +379,13 @@ class MessageManager:
 			if not self.sensitive_data:
 				return value
 
-			# Collect all sensitive values, immediately converting old format to new format
-			sensitive_values: dict[str, str] = {}
-
-			# Process all sensitive data entries
-			for key_or_domain, content in self.sensitive_data.items():
-				if isinstance(content, dict):
-					# Already in new format: {domain: {key: value}}
-					for key, val in content.items():
-						if val:  # Skip empty values
-							sensitive_values[key] = val
-				elif content:  # Old format: {key: value} - convert to new format internally
-					# We treat this as if it was {'http*://*': {key_or_domain: content}}
-					sensitive_values[key_or_domain] = content
-
 			# If there are no valid sensitive data entries, just return the original value
-			if not sensitive_values:
+			if not self._sensitive_data_redactor:
 				logger.warning('No valid entries found in sensitive_data dictionary')
 				return value
 
-			# Replace all valid sensitive data values with their placeholder tags
-			for key, val in sensitive_values.items():
-				value = value.replace(val, f'<secret>{key}</secret>')
-
-			return value
+			# Replace all valid sensitive data values with their placeholder tags, in a single pass over the text
+			return self._sensitive_data_redactor.redact(value)
 
 		if isinstance(message.content, str):
 			message.content = replace_sensitive(message.content)
@@ -0,0 +1,141 @@
+"""
+Run many agents concurrently in one event loop, sharing a bounded number of browser processes.
+"""
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from typing import Any, Self
+
+from browser_use.agent.service import Agent
+from browser_use.agent.views import AgentHistoryList
+from browser_use.browser import BrowserProfile
+from browser_use.browser.pool import BrowserPool
+from browser_use.llm.base import BaseChatModel
+from browser_use.llm.clients import release_shared_clients, use_shared_clients
+from browser_use.llm.messages import BaseMessage
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledLLM:
+	"""The view an agent in the pool has of the shared LLM: everything is delegated to it, but calls wait for their turn.
+
+	Every agent gets its own instance, so wrappers that agents install on their llm (e.g. token cost tracking)
+	only see the calls of that agent.
+	"""
+
+	def __init__(self, llm: BaseChatModel, semaphore: asyncio.Semaphore | None):
+		self._llm = llm
+		self._semaphore = semaphore
+
+	def __getattr__(self, name: str) -> Any:
+		return getattr(self._llm, name)
+
+	async def ainvoke(self, messages: list[BaseMessage], output_format: Any = None) -> Any:
+		if self._semaphore is None:
+			return await self._llm.ainvoke(messages, output_format)
+		# asyncio.Semaphore wakes up waiters in FIFO order, so no agent can be starved by the others
+		async with self._semaphore:
+			return await self._llm.ainvoke(messages, output_format)
+
+
+class AgentPool:
+	"""
+	Runs many agents concurrently in one event loop, over a bounded pool of shared browser processes.
+
+	The browsers are kept in a BrowserPool, launched on first use: max_browsers browsers with max_agents_per_browser
+	browser contexts each. Every agent gets one of these contexts to itself, cleaned up (cookies, storage, tabs) before
+	the next agent gets it; tasks beyond that wait in a queue. With max_queued_tasks set,
+	submitting more tasks than that blocks the caller until there is room (admission control). LLM calls of all
+	agents can be limited with max_concurrent_llm_calls, and are served first come, first served.
+
+	Usage:
+		async with AgentPool(llm=llm, max_browsers=2, max_agents_per_browser=5) as pool:
+			histories = await pool.run_tasks(['task 1', 'task 2', ...])
+	"""
+
+	def __init__(
+		self,
+		llm: BaseChatModel,
+		browser_profile: BrowserProfile | None = None,
+		max_browsers: int = 1,
+		max_agents_per_browser: int = 4,
+		max_concurrent_llm_calls: int | None = None,
+		max_queued_tasks: int | None = None,
+		**agent_kwargs: Any,
+	):
+		assert max_browsers >= 1, 'max_browsers must be at least 1'
+		assert max_agents_per_browser >= 1, 'max_agents_per_browser must be at least 1'
+
+		self.llm = llm
+		self.max_browsers = max_browsers
+		self.max_agents_per_browser = max_agents_per_browser
+		self.agent_kwargs = agent_kwargs
+
+		self.browser_pool = BrowserPool(
+			browser_profile=browser_profile, size=max_browsers, contexts_per_browser=max_agents_per_browser
+		)
+		self._llm_semaphore = asyncio.Semaphore(max_concurrent_llm_calls) if max_concurrent_llm_calls else None
+		# tasks that are queued or running, see max_queued_tasks
+		self._admission = asyncio.Semaphore(max_queued_tasks) if max_queued_tasks else None
+		# the pool keeps the shared LLM clients open between its agents until it is closed, see use_shared_clients()
+		self._uses_shared_clients = False
+
+	async def __aenter__(self) -> Self:
+		return self
+
+	async def __aexit__(self, *args: Any) -> None:
+		await self.close()
+
+	@property
+	def browser_profile(self) -> BrowserProfile:
+		return self.browser_pool.browser_profile
+
+	@property
+	def n_browsers(self) -> int:
+		return self.browser_pool.n_browsers
+
+	@property
+	def n_running_agents(self) -> int:
+		return self.browser_pool.n_in_use
+
+	async def submit(self, task: str, max_steps: int = 100, **agent_kwargs: Any) -> asyncio.Task[AgentHistoryList]:
+		"""Queue a task, waiting until the pool admits it if max_queued_tasks is reached, and return the running task"""
+		if self._admission is not None:
+			await self._admission.acquire()
+		if not self._uses_shared_clients:
+			use_shared_clients()
+			self._uses_shared_clients = True
+
+		run = asyncio.create_task(self._run_task(task, max_steps, **agent_kwargs))
+		if self._admission is not None:
+			run.add_done_callback(lambda _: self._admission.release())  # type: ignore[union-attr]
+		return run
+
+	async def run_task(self, task: str, max_steps: int = 100, **agent_kwargs: Any) -> AgentHistoryList:
+		"""Run one task with a new agent in the pool and return its history. agent_kwargs override the pool's agent_kwargs"""
+		return await (await self.submit(task, max_steps, **agent_kwargs))
+
+	async def run_tasks(self, tasks: Iterable[str], max_steps: int = 100, **agent_kwargs: Any) -> list[AgentHistoryList]:
+		"""Run all tasks concurrently in the pool, and return their histories in the same order"""
+		runs = [await self.submit(task, max_steps, **agent_kwargs) for task in tasks]
+		return list(await asyncio.gather(*runs))
+
+	async def close(self) -> None:
+		"""Close all the browsers of the pool, and release the LLM clients its agents shared (closed if nobody else uses them)"""
+		await self.browser_pool.close()
+		if self._uses_shared_clients:
+			self._uses_shared_clients = False
+			await release_shared_clients()
+
+	async def _run_task(self, task: str, max_steps: int, **agent_kwargs: Any) -> AgentHistoryList:
+		# the pool owns the browser and the context, the agent's session is keep_alive so it doesn't close them
+		async with self.browser_pool.session() as browser_session:
+			agent = Agent(
+				task=task,
+				llm=_PooledLLM(self.llm, self._llm_semaphore),  # type: ignore[arg-type]
+				browser_session=browser_session,
+				**{**self.agent_kwargs, **agent_kwargs},
+			)
+			return await agent.run(max_steps=max_steps)
@@ -2,7 +2,14 @@ import importlib.resources
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from browser_use.llm.messages import ContentPartImageParam, ContentPartTextParam, ImageURL, SystemMessage, UserMessage
+from browser_use.llm.messages import (
+	ContentPartImageParam,
+	ContentPartTextParam,
+	ImageURL,
+	SystemMessage,
+	UserMessage,
+	get_base64_image_media_type,
+)
 from browser_use.observability import observe_debug
 from browser_use.utils import is_new_tab_page
 
@@ -136,7 +143,11 @@ class AgentMessagePrompt:
 
 	@observe_debug(ignore_input=True, ignore_output=True, name='_get_browser_state_description')
 	def _get_browser_state_description(self) -> str:
-		elements_text = self.browser_state.element_tree.clickable_elements_to_string(include_attributes=self.include_attributes)
+		# serialize at most one character past the budget, that is enough to know whether it had to be truncated
+		elements_text = self.browser_state.element_tree.clickable_elements_to_string(
+			include_attributes=self.include_attributes,
+			max_length=self.max_clickable_elements_length + 1,
+		)
 
 		if len(elements_text) > self.max_clickable_elements_length:
 			elements_text = elements_text[: self.max_clickable_elements_length]
@@ -282,12 +293,13 @@ Interactive elements from top layer of the current page inside the viewport{trun
 				# Add label as text content
 				content_parts.append(ContentPartTextParam(text=label))
 
-				# Add the screenshot
+				# Add the screenshot (in whatever format BrowserProfile.screenshot_format it was taken in)
+				media_type = get_base64_image_media_type(screenshot)
 				content_parts.append(
 					ContentPartImageParam(
 						image_url=ImageURL(
-							url=f'data:image/png;base64,{screenshot}',
-							media_type='image/png',
+							url=f'data:{media_type};base64,{screenshot}',
+							media_type=media_type,
 						),
 					)
 				)
@@ -8,7 +8,7 @@ import re
 import sys
 import tempfile
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable, Sized
 from pathlib import Path
 from typing import Any, Generic, TypeVar
 
@@ -24,6 +24,7 @@ from browser_use.agent.cloud_events import (
 from browser_use.agent.message_manager.utils import save_conversation
 from browser_use.dom.views import DEFAULT_INCLUDE_ATTRIBUTES
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.clients import release_shared_clients, use_shared_clients
 from browser_use.llm.messages import BaseMessage, UserMessage
 from browser_use.tokens.service import TokenCost
 
@@ -60,10 +61,11 @@ from browser_use.controller.registry.views import ActionModel
 from browser_use.controller.service import Controller
 from browser_use.dom.history_tree_processor.service import (
 	DOMHistoryElement,
-	HistoryTreeProcessor,
+	HistoryTreeIndex,
 )
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.observability import observe, observe_debug
+from browser_use.screenshots.service import ScreenshotStore
 from browser_use.sync import CloudSync
 from browser_use.telemetry.service import ProductTelemetry
 from browser_use.telemetry.views import AgentTelemetryEvent
@@ -154,6 +156,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		use_vision_for_planner: bool = False,  # Deprecated
 		save_conversation_path: str | Path | None = None,
 		save_conversation_path_encoding: str | None = 'utf-8',
+		save_history_path: str | Path | None = None,
 		max_failures: int = 3,
 		retry_delay: int = 10,
 		override_system_message: str | None = None,
@@ -238,6 +241,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			use_vision_for_planner=False,  # Always False now (deprecated)
 			save_conversation_path=save_conversation_path,
 			save_conversation_path_encoding=save_conversation_path_encoding,
+			save_history_path=save_history_path,
 			max_failures=max_failures,
 			retry_delay=retry_delay,
 			override_system_message=override_system_message,
@@ -272,6 +276,9 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		# Initialize file system
 		self._set_file_system(file_system_path)
 
+		# Screenshots in the history are kept on disk, next to the agent's files, instead of in memory
+		self.screenshot_store = ScreenshotStore(Path(self.file_system_path) / 'screenshots')
+
 		# Action setup
 		self._setup_action_models()
 		self._set_browser_use_version_and_source(source)
@@ -452,6 +459,10 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			self.settings.save_conversation_path = Path(self.settings.save_conversation_path).expanduser().resolve()
 			self.logger.info(f'💬 Saving conversation to {_log_pretty_path(self.settings.save_conversation_path)}')
 
+		if self.settings.save_history_path:
+			self.settings.save_history_path = Path(self.settings.save_history_path).expanduser().resolve()
+			self.logger.info(f'📜 Saving history to {_log_pretty_path(self.settings.save_history_path)}')
+
 		# Initialize download tracking
 		assert self.browser_session is not None, 'BrowserSession is not set up'
 		self.has_downloads_path = self.browser_session.browser_profile.downloads_path is not None
@@ -495,7 +506,11 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		assert self.browser_session is not None, 'BrowserSession is not set up'
 
 		try:
-			current_downloads = self.browser_session.downloaded_files
+			if self.browser_session.has_pending_downloads:
+				# downloads still in progress after the timeout are picked up in a later step
+				current_downloads = await self.browser_session.wait_for_downloads(timeout=30)
+			else:
+				current_downloads = self.browser_session.downloaded_files
 			if current_downloads != self._last_known_downloads:
 				self._update_available_file_paths(current_downloads)
 				self._last_known_downloads = current_downloads
@@ -849,7 +864,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			)
 
 			# Use _make_history_item like main branch
-			self._make_history_item(self.state.last_model_output, browser_state_summary, self.state.last_result, metadata)
+			await self._make_history_item(self.state.last_model_output, browser_state_summary, self.state.last_result, metadata)
+			await self._save_last_history_item()
 
 		# Log step completion summary
 		self._log_step_completion_summary(self.step_start_time, self.state.last_result)
@@ -942,7 +958,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				self.settings.save_conversation_path_encoding,
 			)
 
-	def _make_history_item(
+	async def _make_history_item(
 		self,
 		model_output: AgentOutput | None,
 		browser_state_summary: BrowserStateSummary,
@@ -956,12 +972,17 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		else:
 			interacted_elements = [None]
 
+		screenshot_path = None
+		if browser_state_summary.screenshot:
+			screenshot_path = await asyncio.to_thread(self.screenshot_store.store, browser_state_summary.screenshot)
+
 		state_history = BrowserStateHistory(
 			url=browser_state_summary.url,
 			title=browser_state_summary.title,
 			tabs=browser_state_summary.tabs,
 			interacted_element=interacted_elements,
-			screenshot=browser_state_summary.screenshot,
+			screenshot_path=screenshot_path,
+			screenshot_store=self.screenshot_store,
 		)
 
 		history_item = AgentHistory(
@@ -973,6 +994,14 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 		self.state.history.history.append(history_item)
 
+	async def _save_last_history_item(self) -> None:
+		"""Append the history item just added to save_history_path (if set)"""
+		if self.settings.save_history_path:
+			# append only the new item, so saving doesn't get slower as the history grows
+			await asyncio.to_thread(
+				AgentHistoryList.append_to_file, self.settings.save_history_path, self.state.history.history[-1:]
+			)
+
 	def _remove_think_tags(self, text: str) -> str:
 		THINK_TAGS = re.compile(r'<think>.*?</think>', re.DOTALL)
 		STRAY_CLOSE_TAG = re.compile(r'.*?</think>', re.DOTALL)
@@ -1181,6 +1210,10 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		)
 		signal_handler.register()
 
+		# the LLM clients and their connections are shared with the other agents, the last agent to close closes them
+		use_shared_clients()
+		self._uses_shared_clients = True
+
 		try:
 			self._log_agent_run()
 
@@ -1284,6 +1317,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 						metadata=None,
 					)
 				)
+				await self._save_last_history_item()
 
 				self.logger.info(f'❌ {agent_run_error}')
 
@@ -1361,6 +1395,10 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			# Use longer timeout to avoid deadlocks in tests with multiple agents
 			await self.eventbus.stop(timeout=10.0)
 
+			# Send the events still queued for cloud sync, without holding up the end of the run if the backend is slow
+			if hasattr(self, 'cloud_sync'):
+				await self.cloud_sync.close(timeout=2.0)
+
 			await self.close()
 
 	@observe_debug(ignore_input=True, ignore_output=True)
@@ -1467,19 +1505,22 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 	async def rerun_history(
 		self,
-		history: AgentHistoryList,
+		history: AgentHistoryList | Iterable[AgentHistory],
 		max_retries: int = 3,
 		skip_failures: bool = True,
 		delay_between_actions: float = 2.0,
+		fuzzy_element_matching: bool = False,
 	) -> list[ActionResult]:
 		"""
 		Rerun a saved history of actions with error handling and retry logic.
 
 		Args:
-		                history: The history to replay
+		                history: The history to replay, or an iterable of its steps (e.g. from AgentHistoryList.iter_from_file)
 		                max_retries: Maximum number of retries per action
 		                skip_failures: Whether to skip failed actions or stop execution
 		                delay_between_actions: Delay between actions in seconds
+		                fuzzy_element_matching: If an element has no exact match on the page anymore, accept the element
+		                        with the same attributes or the same xpath (if unambiguous) instead of failing the step
 
 		Returns:
 		                List of action results
@@ -1491,9 +1532,12 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 		results = []
 
-		for i, history_item in enumerate(history.history):
+		history_items = history.history if isinstance(history, AgentHistoryList) else history
+		n_steps = len(history_items) if isinstance(history_items, Sized) else '?'
+
+		for i, history_item in enumerate(history_items):
 			goal = history_item.model_output.current_state.next_goal if history_item.model_output else ''
-			self.logger.info(f'Replaying step {i + 1}/{len(history.history)}: goal: {goal}')
+			self.logger.info(f'Replaying step {i + 1}/{n_steps}: goal: {goal}')
 
 			if (
 				not history_item.model_output
@@ -1507,7 +1551,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			retry_count = 0
 			while retry_count < max_retries:
 				try:
-					result = await self._execute_history_step(history_item, delay_between_actions)
+					result = await self._execute_history_step(history_item, delay_between_actions, fuzzy_element_matching)
 					results.extend(result)
 					break
 
@@ -1525,18 +1569,24 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 		return results
 
-	async def _execute_history_step(self, history_item: AgentHistory, delay: float) -> list[ActionResult]:
+	async def _execute_history_step(
+		self, history_item: AgentHistory, delay: float, fuzzy_element_matching: bool = False
+	) -> list[ActionResult]:
 		"""Execute a single step from history with element validation"""
 		assert self.browser_session is not None, 'BrowserSession is not set up'
 		state = await self.browser_session.get_state_summary(cache_clickable_elements_hashes=False)
 		if not state or not history_item.model_output:
 			raise ValueError('Invalid state or model output')
+		# index the page once, all actions of the step are resolved against the same state
+		tree_index = HistoryTreeIndex(state.element_tree) if state.element_tree else None
 		updated_actions = []
 		for i, action in enumerate(history_item.model_output.action):
 			updated_action = await self._update_action_indices(
 				history_item.state.interacted_element[i],
 				action,
 				state,
+				tree_index=tree_index,
+				fuzzy=fuzzy_element_matching,
 			)
 			updated_actions.append(updated_action)
 
@@ -1553,6 +1603,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		historical_element: DOMHistoryElement | None,
 		action: ActionModel,  # Type this properly based on your action model
 		browser_state_summary: BrowserStateSummary,
+		tree_index: HistoryTreeIndex | None = None,
+		fuzzy: bool = False,
 	) -> ActionModel | None:
 		"""
 		Update action indices based on current page state.
@@ -1561,9 +1613,9 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		if not historical_element or not browser_state_summary.element_tree:
 			return action
 
-		current_element = HistoryTreeProcessor.find_history_element_in_tree(
-			historical_element, browser_state_summary.element_tree
-		)
+		if tree_index is None:
+			tree_index = HistoryTreeIndex(browser_state_summary.element_tree)
+		current_element = tree_index.find(historical_element, fuzzy=fuzzy)
 
 		if not current_element or current_element.highlight_index is None:
 			return None
@@ -1579,13 +1631,18 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		"""
 		Load history from file and rerun it.
 
+		Steps of JSONL history files (see save_history_path) are loaded one at a time as they are replayed.
+
 		Args:
 		                history_file: Path to the history file
 		                **kwargs: Additional arguments passed to rerun_history
 		"""
 		if not history_file:
 			history_file = 'AgentHistory.json'
-		history = AgentHistoryList.load_from_file(history_file, self.AgentOutput)
+		if Path(history_file).suffix == '.jsonl':
+			history = AgentHistoryList.iter_from_file(history_file, self.AgentOutput)
+		else:
+			history = AgentHistoryList.load_from_file(history_file, self.AgentOutput)
 		return await self.rerun_history(history, **kwargs)
 
 	def save_history(self, file_path: str | Path | None = None) -> None:
@@ -1688,6 +1745,10 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		except Exception as e:
 			self.logger.error(f'Error during cleanup: {e}')
 
+		if getattr(self, '_uses_shared_clients', False):
+			self._uses_shared_clients = False
+			await release_shared_clients()
+
 	async def _update_action_models_for_page(self, page) -> None:
 		"""Update action models with page-specific actions"""
 		# Create new action model with current page's filtered actions
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import json
+import logging
+import os
 import traceback
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Generic
 
@@ -24,6 +28,8 @@ from browser_use.filesystem.file_system import FileSystemState
 from browser_use.llm.base import BaseChatModel
 from browser_use.tokens.views import UsageSummary
 
+logger = logging.getLogger(__name__)
+
 
 class AgentSettings(BaseModel):
 	"""Configuration options for the Agent"""
@@ -32,6 +38,7 @@ class AgentSettings(BaseModel):
 	use_vision_for_planner: bool = False
 	save_conversation_path: str | Path | None = None
 	save_conversation_path_encoding: str | None = 'utf-8'
+	save_history_path: str | Path | None = None  # JSONL file every step is appended to, see AgentHistoryList.append_to_file
 	max_failures: int = 3
 	retry_delay: int = 10
 	validate_output: bool = False
@@ -182,8 +189,13 @@ class AgentOutput(BaseModel):
 		)
 
 	@staticmethod
+	@lru_cache(maxsize=128)
 	def type_with_custom_actions(custom_actions: type[ActionModel]) -> type[AgentOutput]:
-		"""Extend actions with custom actions"""
+		"""Extend actions with custom actions
+
+		The output models are cached per action model (and mode), so the same output model and JSON schema is
+		used for every step that has the same actions available.
+		"""
 
 		model_ = create_model(
 			'AgentOutput',
@@ -198,6 +210,7 @@ class AgentOutput(BaseModel):
 		return model_
 
 	@staticmethod
+	@lru_cache(maxsize=128)
 	def type_with_custom_actions_no_thinking(custom_actions: type[ActionModel]) -> type[AgentOutput]:
 		"""Extend actions with custom actions and exclude thinking field"""
 
@@ -223,6 +236,7 @@ class AgentOutput(BaseModel):
 		return model
 
 	@staticmethod
+	@lru_cache(maxsize=128)
 	def type_with_custom_actions_flash_mode(custom_actions: type[ActionModel]) -> type[AgentOutput]:
 		"""Extend actions with custom actions for flash mode - memory and action fields only"""
 
@@ -378,23 +392,72 @@ class AgentHistoryList(BaseModel, Generic[AgentStructuredOutput]):
 			'history': [h.model_dump(**kwargs) for h in self.history],
 		}
 
+	@staticmethod
+	def append_to_file(filepath: str | Path, history: Iterable[AgentHistory]) -> None:
+		"""Append history items to a JSONL file, one compact JSON record per step.
+
+		Unlike save_to_file, the cost of saving a step doesn't grow with the length of the run, and the file is
+		flushed to disk after every write so it can be used as a checkpoint: a crash loses at most the step being written.
+		"""
+		Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+		lines = ''.join(json.dumps(h.model_dump(), separators=(',', ':')) + '\n' for h in history)
+		with open(filepath, 'ab+') as f:
+			# if a previous write was cut off by a crash, start a new line instead of corrupting the next record too
+			if f.tell() > 0:
+				f.seek(-1, os.SEEK_END)
+				if f.read(1) != b'\n':
+					lines = '\n' + lines
+			f.write(lines.encode('utf-8'))
+			f.flush()
+			os.fsync(f.fileno())
+
+	@staticmethod
+	def _prepare_history_item_data(h: dict[str, Any], output_model: type[AgentOutput]) -> dict[str, Any]:
+		"""Validate the saved model_output against output_model, to enrich it with the custom actions"""
+		if h['model_output']:
+			if isinstance(h['model_output'], dict):
+				h['model_output'] = output_model.model_validate(h['model_output'])
+			else:
+				h['model_output'] = None
+		if 'interacted_element' not in h['state']:
+			h['state']['interacted_element'] = None
+		return h
+
 	@classmethod
 	def load_from_file(cls, filepath: str | Path, output_model: type[AgentOutput]) -> AgentHistoryList:
-		"""Load history from JSON file"""
+		"""Load history from JSON file, or from a JSONL file written by append_to_file"""
+		if Path(filepath).suffix == '.jsonl':
+			return cls(history=list(cls.iter_from_file(filepath, output_model)))
+
 		with open(filepath, encoding='utf-8') as f:
 			data = json.load(f)
 		# loop through history and validate output_model actions to enrich with custom actions
 		for h in data['history']:
-			if h['model_output']:
-				if isinstance(h['model_output'], dict):
-					h['model_output'] = output_model.model_validate(h['model_output'])
-				else:
-					h['model_output'] = None
-			if 'interacted_element' not in h['state']:
-				h['state']['interacted_element'] = None
+			cls._prepare_history_item_data(h, output_model)
 		history = cls.model_validate(data)
 		return history
 
+	@classmethod
+	def iter_from_file(cls, filepath: str | Path, output_model: type[AgentOutput]) -> Iterator[AgentHistory]:
+		"""Lazily load the history items from a JSONL file written by append_to_file, one step at a time.
+
+		Incomplete records (the process crashed while writing them) are skipped. JSON files are loaded in full.
+		"""
+		if Path(filepath).suffix != '.jsonl':
+			yield from cls.load_from_file(filepath, output_model).history
+			return
+
+		with open(filepath, encoding='utf-8') as f:
+			for line_number, line in enumerate(f, 1):
+				if not line.strip():
+					continue
+				try:
+					data = json.loads(line)
+				except json.JSONDecodeError:
+					logger.warning(f'⚠️ Skipping incomplete step on line {line_number} of history file {filepath}')
+					continue
+				yield AgentHistory.model_validate(cls._prepare_history_item_data(data, output_model))
+
 	def last_action(self) -> None | dict:
 		"""Last action in history"""
 		if self.history and self.history[-1].model_output:
@@ -444,16 +507,12 @@ class AgentHistoryList(BaseModel, Generic[AgentStructuredOutput]):
 		"""Get all screenshots from history"""
 		if n_last == 0:
 			return []
-		if n_last is None:
-			if return_none_if_not_screenshot:
-				return [h.state.screenshot if h.state.screenshot is not None else None for h in self.history]
-			else:
-				return [h.state.screenshot for h in self.history if h.state.screenshot is not None]
-		else:
-			if return_none_if_not_screenshot:
-				return [h.state.screenshot if h.state.screenshot is not None else None for h in self.history[-n_last:]]
-			else:
-				return [h.state.screenshot for h in self.history[-n_last:] if h.state.screenshot is not None]
+
+		history = self.history if n_last is None else self.history[-n_last:]
+		screenshots = [h.state.get_screenshot() for h in history]
+		if return_none_if_not_screenshot:
+			return screenshots
+		return [screenshot for screenshot in screenshots if screenshot is not None]
 
 	def action_names(self) -> list[str]:
 		"""Get all action names from history"""
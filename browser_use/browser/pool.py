@@ -0,0 +1,360 @@
+"""
+Pool of pre-launched browsers with pre-created, clean browser contexts, so sessions start without waiting for a browser launch.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Self
+from urllib.parse import urlparse
+
+import psutil
+
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import DEFAULT_BROWSER_PROFILE, BrowserSession
+from browser_use.browser.types import Page
+from browser_use.browser.views import BrowserError
+
+logger = logging.getLogger(__name__)
+
+RECYCLE_TIMEOUT = 10  # seconds, a context that takes longer to clean up is replaced by a new one
+LAUNCH_RETRY_DELAYS = (1, 2, 4)  # seconds to wait before each retry of a failed browser launch
+
+
+@dataclass(eq=False)
+class _WarmBrowser:
+	browser_session: BrowserSession  # the session that launched the browser and owns its process
+	uses: int = 0
+	in_use: int = 0
+	retiring: bool = False
+
+	@property
+	def is_connected(self) -> bool:
+		browser = self.browser_session.browser
+		return browser is not None and browser.is_connected()
+
+
+@dataclass(eq=False)
+class _WarmContext:
+	browser_session: BrowserSession  # the session handed out, wraps one browser_context of warm_browser
+	warm_browser: _WarmBrowser
+	visited_origins: set[str] = field(default_factory=set)  # origins whose storage must be cleared when recycling
+
+	def track_page(self, page: Page) -> None:
+		page.on('framenavigated', lambda frame: self._track_url(frame.url))
+
+	def _track_url(self, url: str) -> None:
+		parsed = urlparse(url)
+		if parsed.scheme in ('http', 'https') and parsed.netloc:
+			self.visited_origins.add(f'{parsed.scheme}://{parsed.netloc}')
+
+
+class BrowserPool:
+	"""
+	Keeps `size` browsers launched ahead of time, each with `contexts_per_browser` browser contexts that are already set up
+	(viewport, listeners, storage_state, ...), so acquire() hands out a ready BrowserSession without waiting for a launch.
+
+	Released sessions are recycled for the next task: their tabs are replaced by one blank tab, and cookies, permissions
+	and the storage of every origin the context visited are cleared before the profile's storage_state is loaded again.
+	Browsers are retired and replaced by a freshly launched one after max_uses_per_browser sessions, or as soon as
+	the browser processes use more than max_browser_memory_mb of memory.
+
+	Usage:
+		async with BrowserPool(browser_profile=profile, size=2) as pool:
+			async with pool.session() as browser_session:
+				agent = Agent(task=task, llm=llm, browser_session=browser_session)
+				await agent.run()
+	"""
+
+	def __init__(
+		self,
+		browser_profile: BrowserProfile | None = None,
+		size: int = 1,
+		contexts_per_browser: int = 1,
+		max_uses_per_browser: int | None = 100,
+		max_browser_memory_mb: float | None = None,
+	):
+		assert size >= 1, 'size must be at least 1'
+		assert contexts_per_browser >= 1, 'contexts_per_browser must be at least 1'
+
+		self.browser_profile = browser_profile or DEFAULT_BROWSER_PROFILE
+		self.size = size
+		self.contexts_per_browser = contexts_per_browser
+		self.max_uses_per_browser = max_uses_per_browser
+		self.max_browser_memory_mb = max_browser_memory_mb
+
+		self._browsers: list[_WarmBrowser] = []
+		self._ready: asyncio.Queue[_WarmContext] = asyncio.Queue()
+		self._in_use: dict[int, _WarmContext] = {}  # id(browser_session) -> context it wraps
+		self._launching: set[asyncio.Task] = set()
+		self._launch_failed = asyncio.Event()  # set when the pool has no browser left to hand out contexts from
+		self._launch_error: Exception | None = None
+		self._closed = False
+
+	async def __aenter__(self) -> Self:
+		await self.start()
+		return self
+
+	async def __aexit__(self, *args: Any) -> None:
+		await self.close()
+
+	@property
+	def n_browsers(self) -> int:
+		return len(self._browsers)
+
+	@property
+	def n_ready(self) -> int:
+		return self._ready.qsize()
+
+	@property
+	def n_in_use(self) -> int:
+		return len(self._in_use)
+
+	async def start(self) -> Self:
+		"""Launch the browsers of the pool and warm up their contexts"""
+		self._closed = False
+		missing = self.size - len(self._browsers)
+		await asyncio.gather(*(self._add_browser() for _ in range(missing)))
+		return self
+
+	async def acquire(self, timeout: float | None = None) -> BrowserSession:
+		"""Get a started BrowserSession with a clean browser context, waiting up to timeout seconds for one to be released"""
+		assert not self._closed, 'BrowserPool is closed'
+		async with asyncio.timeout(timeout):
+			while True:
+				self._ensure_capacity()
+				warm_context = await self._next_ready_context()
+				warm_browser = warm_context.warm_browser
+				if warm_browser.retiring or not warm_browser.is_connected:
+					await self._discard(warm_context)
+					continue
+
+				warm_browser.uses += 1
+				warm_browser.in_use += 1
+				if self.max_uses_per_browser and warm_browser.uses >= self.max_uses_per_browser:
+					# the replacement starts warming up right away, while the last sessions of this browser are still running
+					logger.debug(f'🏊 Retiring pooled browser after {warm_browser.uses} uses')
+					warm_browser.retiring = True
+					self._ensure_capacity()
+
+				self._in_use[id(warm_context.browser_session)] = warm_context
+				return warm_context.browser_session
+
+	async def release(self, browser_session: BrowserSession) -> None:
+		"""Give a session back to the pool, its context is cleaned up and handed out again"""
+		warm_context = self._in_use.pop(id(browser_session), None)
+		if warm_context is None:
+			assert self._closed, f'{browser_session} was not acquired from this BrowserPool'
+			return  # the pool was closed while the session was in use, its browser is already gone
+		warm_browser = warm_context.warm_browser
+		warm_browser.in_use -= 1
+
+		if self.max_browser_memory_mb and not warm_browser.retiring:
+			memory_mb = await self._get_memory_mb(warm_browser)
+			if memory_mb > self.max_browser_memory_mb:
+				logger.info(
+					f'🏊 Retiring pooled browser using {memory_mb:.0f}MB > max_browser_memory_mb={self.max_browser_memory_mb}MB'
+				)
+				warm_browser.retiring = True
+
+		if self._closed or warm_browser.retiring or not warm_browser.is_connected:
+			await self._discard(warm_context)
+			return
+
+		try:
+			await asyncio.wait_for(self._recycle(warm_context), RECYCLE_TIMEOUT)
+		except Exception as e:
+			logger.warning(f'⚠️ Failed to recycle pooled browser context, replacing it with a new one: {type(e).__name__}: {e}')
+			await self._close_context(warm_context)
+			try:
+				warm_context = await self._new_context(warm_browser)
+			except Exception as e:
+				logger.warning(f'⚠️ Failed to create a new pooled browser context, retiring the browser: {type(e).__name__}: {e}')
+				warm_browser.retiring = True
+				await self._retire_if_idle(warm_browser)
+				return
+
+		self._ready.put_nowait(warm_context)
+
+	@asynccontextmanager
+	async def session(self, timeout: float | None = None) -> AsyncIterator[BrowserSession]:
+		"""Acquire a BrowserSession for the duration of the block"""
+		browser_session = await self.acquire(timeout=timeout)
+		try:
+			yield browser_session
+		finally:
+			await self.release(browser_session)
+
+	async def close(self) -> None:
+		"""Close all the browsers of the pool, including the ones with sessions still in use"""
+		self._closed = True
+		for task in self._launching:
+			task.cancel()
+		await asyncio.gather(*self._launching, return_exceptions=True)
+
+		while not self._ready.empty():
+			self._ready.get_nowait()
+		self._in_use.clear()
+
+		browsers, self._browsers = self._browsers, []
+		for warm_browser in browsers:
+			await self._kill_browser(warm_browser)
+
+	async def _next_ready_context(self) -> _WarmContext:
+		"""Wait for the next ready context, or raise if the pool failed to launch any browser to create one"""
+		get = asyncio.ensure_future(self._ready.get())
+		launch_failed = asyncio.ensure_future(self._launch_failed.wait())
+		try:
+			await asyncio.wait({get, launch_failed}, return_when=asyncio.FIRST_COMPLETED)
+		except BaseException:
+			# cancelled (e.g. by the acquire() timeout), don't lose a context that was taken off the queue meanwhile
+			if get.done() and not get.cancelled():
+				self._ready.put_nowait(get.result())
+			raise
+		finally:
+			launch_failed.cancel()
+			if not get.done():
+				get.cancel()
+
+		if get.done():
+			return get.result()
+		error = self._launch_error
+		raise BrowserError(f'Failed to launch a browser for the browser pool: {type(error).__name__}: {error}') from error
+
+	def _ensure_capacity(self) -> None:
+		"""Launch browsers in the background until there are `size` browsers that are not being retired"""
+		if self._closed:
+			return
+		for warm_browser in self._browsers:
+			if not warm_browser.is_connected:
+				warm_browser.retiring = True
+
+		healthy = sum(not warm_browser.retiring for warm_browser in self._browsers)
+		for _ in range(self.size - healthy - len(self._launching)):
+			task = asyncio.create_task(self._add_browser_in_background())
+			self._launching.add(task)
+			task.add_done_callback(self._launching.discard)
+		if healthy or self._launching:
+			self._launch_failed.clear()
+
+	async def _add_browser_in_background(self) -> None:
+		for retry_delay in (*LAUNCH_RETRY_DELAYS, None):
+			try:
+				await self._add_browser()
+				return
+			except Exception as e:
+				logger.warning(f'⚠️ Failed to launch a browser for the browser pool: {type(e).__name__}: {e}')
+				self._launch_error = e
+			if retry_delay is not None:
+				await asyncio.sleep(retry_delay)
+
+		# the acquire() calls waiting for a context would wait forever if no other browser is left to provide one,
+		# wake them up with the error instead (the next acquire() call starts launching browsers again)
+		healthy = sum(not warm_browser.retiring and warm_browser.is_connected for warm_browser in self._browsers)
+		if not healthy and self._launching <= {asyncio.current_task()}:
+			self._launch_failed.set()
+
+	async def _add_browser(self) -> None:
+		# every pooled browser needs its own (temporary) user_data_dir, sessions are isolated by their browser contexts
+		launcher = BrowserSession(browser_profile=self.browser_profile.model_copy(update={'user_data_dir': None}))
+		await launcher.start()
+		warm_browser = _WarmBrowser(browser_session=launcher)
+		if self._closed:
+			await self._kill_browser(warm_browser)
+			return
+
+		self._browsers.append(warm_browser)
+		try:
+			warm_contexts = await asyncio.gather(*(self._new_context(warm_browser) for _ in range(self.contexts_per_browser)))
+		except BaseException:
+			self._browsers.remove(warm_browser)
+			await self._kill_browser(warm_browser)
+			raise
+
+		for warm_context in warm_contexts:
+			self._ready.put_nowait(warm_context)
+		logger.info(
+			f'🏊 Warmed up browser {len(self._browsers)}/{self.size} with {len(warm_contexts)} contexts for the browser pool'
+		)
+
+	async def _new_context(self, warm_browser: _WarmBrowser) -> _WarmContext:
+		browser = warm_browser.browser_session.browser
+		assert browser is not None, 'Pooled browser is not connected'
+		browser_context = await browser.new_context(**self.browser_profile.kwargs_for_new_context().model_dump(mode='json'))
+
+		# the pool owns the browser and the context, whoever acquires the session must not close them
+		browser_session = BrowserSession(
+			browser_profile=self.browser_profile.model_copy(update={'keep_alive': True}),
+			browser=browser,
+			browser_context=browser_context,
+		)
+		warm_context = _WarmContext(browser_session=browser_session, warm_browser=warm_browser)
+		browser_context.on('page', warm_context.track_page)
+		await browser_session.start()
+		return warm_context
+
+	async def _recycle(self, warm_context: _WarmContext) -> None:
+		"""Reset a released context to the state of a freshly created one"""
+		browser_session = warm_context.browser_session
+		browser_context = browser_session.browser_context
+		assert browser_context is not None, 'Pooled browser context is closed'
+
+		# a new tab instead of navigating an old one, so history and sessionStorage don't carry over
+		old_pages = browser_context.pages
+		page = await browser_context.new_page()
+		for old_page in old_pages:
+			await old_page.close()
+
+		origins, warm_context.visited_origins = warm_context.visited_origins, set()
+		for origin in origins:
+			await browser_session._send_cdp_command(page, 'Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+		await browser_context.clear_cookies()
+		await browser_context.clear_permissions()
+		if self.browser_profile.permissions:
+			await browser_context.grant_permissions(self.browser_profile.permissions)
+		await browser_session.load_storage_state()
+
+		browser_session._reset_page_state(page)
+
+	async def _discard(self, warm_context: _WarmContext) -> None:
+		await self._close_context(warm_context)
+		await self._retire_if_idle(warm_context.warm_browser)
+
+	async def _close_context(self, warm_context: _WarmContext) -> None:
+		browser_context = warm_context.browser_session.browser_context
+		try:
+			if browser_context is not None:
+				await browser_context.close()
+		except Exception as e:
+			logger.debug(f'Failed to close pooled browser context: {type(e).__name__}: {e}')
+
+	async def _retire_if_idle(self, warm_browser: _WarmBrowser) -> None:
+		if warm_browser.in_use or warm_browser not in self._browsers:
+			return
+		if warm_browser.retiring or not warm_browser.is_connected:
+			self._browsers.remove(warm_browser)
+			await self._kill_browser(warm_browser)
+			self._ensure_capacity()
+
+	async def _kill_browser(self, warm_browser: _WarmBrowser) -> None:
+		try:
+			await warm_browser.browser_session.kill()
+		except Exception as e:
+			logger.warning(f'⚠️ Failed to close pooled browser: {type(e).__name__}: {e}')
+
+	async def _get_memory_mb(self, warm_browser: _WarmBrowser) -> float:
+		"""Memory used by the browser process and all its renderer / gpu / utility subprocesses"""
+		browser_pid = warm_browser.browser_session.browser_pid
+		if not browser_pid:
+			return 0
+
+		def measure() -> float:
+			process = psutil.Process(browser_pid)
+			return sum(p.memory_info().rss for p in [process, *process.children(recursive=True)]) / 1024 / 1024
+
+		try:
+			return await asyncio.to_thread(measure)
+		except psutil.Error:
+			return 0
@@ -1,3 +1,4 @@
+import re
 import sys
 from collections.abc import Iterable
 from enum import Enum
@@ -104,6 +105,46 @@ CHROME_DETERMINISTIC_RENDERING_ARGS = [
 	'--force-color-profile=srgb',
 ]
 
+# requests to these URLs (matched as lowercase substrings) are not waited for when waiting for the network to calm down
+NETWORK_IDLE_IGNORED_URL_PATTERNS = [
+	# Analytics and tracking
+	'analytics',
+	'tracking',
+	'telemetry',
+	'beacon',
+	'metrics',
+	# Ad-related
+	'doubleclick',
+	'adsystem',
+	'adserver',
+	'advertising',
+	# Social media widgets
+	'facebook.com/plugins',
+	'platform.twitter',
+	'linkedin.com/embed',
+	# Live chat and support
+	'livechat',
+	'zendesk',
+	'intercom',
+	'crisp.chat',
+	'hotjar',
+	# Push notifications
+	'push-notifications',
+	'onesignal',
+	'pushwoosh',
+	# Background sync/heartbeat
+	'heartbeat',
+	'ping',
+	'alive',
+	# WebRTC and streaming
+	'webrtc',
+	'rtmp://',
+	'wss://',
+	# Common CDNs for dynamic content
+	'cloudfront.net',
+	'fastly.net',
+]
+
 CHROME_DEFAULT_ARGS = [
 	# # provided by playwright by default: https://github.com/microsoft/playwright/blob/41008eeddd020e2dee1c540f7c0cdfa337e99637/packages/playwright-core/src/server/chromium/chromiumSwitches.ts#L76
 	'--disable-field-trial-config',  # https://source.chromium.org/chromium/chromium/src/+/main:testing/variations/README.md
@@ -197,6 +238,14 @@ def get_display_size() -> ViewportSize | None:
 	return None
 
 
+@cache
+def compile_url_substring_matcher(patterns: tuple[str, ...]) -> Pattern[str] | None:
+	"""Compile a list of lowercase URL substrings into a single regex, so a URL is checked against all of them in one scan"""
+	if not patterns:
+		return None
+	return re.compile('|'.join(re.escape(pattern.lower()) for pattern in patterns))
+
+
 def get_window_adjustments() -> tuple[int, int]:
 	"""Returns recommended x, y offsets for window positioning"""
 
@@ -575,12 +624,39 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 	minimum_wait_page_load_time: float = Field(default=0.25, description='Minimum time to wait before capturing page state.')
 	wait_for_network_idle_page_load_time: float = Field(default=0.5, description='Time to wait for network idle.')
 	maximum_wait_page_load_time: float = Field(default=5.0, description='Maximum time to wait for page load.')
+	network_idle_ignored_url_patterns: list[str] = Field(
+		default_factory=lambda: list(NETWORK_IDLE_IGNORED_URL_PATTERNS),
+		description='URL substrings of requests (e.g. analytics, ads, chat widgets) that are not waited for when waiting for network idle.',
+	)
 	wait_between_actions: float = Field(default=0.5, description='Time to wait between actions.')
 
 	# --- UI/viewport/DOM ---
 	include_dynamic_attributes: bool = Field(default=True, description='Include dynamic attributes in selectors.')
 	highlight_elements: bool = Field(default=True, description='Highlight interactive elements on the page.')
 	viewport_expansion: int = Field(default=500, description='Viewport expansion in pixels for LLM context.')
+	incremental_dom_snapshots: bool = Field(
+		default=False,
+		description='Keep a MutationObserver in the page and only re-walk the DOM subtrees that changed since the last step (experimental).',
+	)
+	packed_dom_transfer: bool = Field(
+		default=False,
+		description='Transfer the extracted DOM from the page as packed parallel arrays instead of one JSON object per node.',
+	)
+
+	# --- Screenshots ---
+	screenshot_format: Literal['png', 'jpeg', 'webp'] = Field(
+		default='png', description='Image format of the screenshots taken for the LLM, jpeg/webp are much smaller than png.'
+	)
+	screenshot_quality: int | None = Field(
+		default=None, ge=0, le=100, description='Compression quality (0-100) of jpeg/webp screenshots, ignored for png.'
+	)
+	screenshot_max_size: ViewportSize | None = Field(
+		default=None,
+		description='Downscale screenshots at capture time to fit within this size in pixels e.g. {"width": 1280, "height": 800}.',
+	)
+	screenshot_grayscale: bool = Field(
+		default=False, description='Render the page in grayscale while taking screenshots (smaller images, colors are lost).'
+	)
 
 	profile_directory: str = 'Default'  # e.g. 'Profile 1', 'Profile 2', 'Custom Profile', etc.
 
@@ -32,10 +32,12 @@ from playwright._impl._api_structures import ViewportSize
 from pydantic import AliasChoices, BaseModel, ConfigDict, Field, InstanceOf, PrivateAttr, model_validator
 from uuid_extensions import uuid7str
 
-from browser_use.browser.profile import BROWSERUSE_DEFAULT_CHANNEL, BrowserChannel, BrowserProfile
+from browser_use.browser.profile import BROWSERUSE_DEFAULT_CHANNEL, BrowserChannel, BrowserProfile, compile_url_substring_matcher
 from browser_use.browser.types import (
 	Browser,
 	BrowserContext,
+	CDPSession,
+	Download,
 	ElementHandle,
 	FrameLocator,
 	Page,
@@ -53,10 +55,10 @@ from browser_use.browser.views import (
 )
 from browser_use.dom.clickable_element_processor.service import ClickableElementProcessor
 from browser_use.dom.service import DomService
-from browser_use.dom.views import DOMElementNode, SelectorMap
+from browser_use.dom.views import DOMElementNode, DOMState, SelectorMap
 from browser_use.utils import (
+	DomainMatcher,
 	is_new_tab_page,
-	match_url_with_domain_pattern,
 	merge_dicts,
 	time_execution_async,
 	time_execution_sync,
@@ -73,6 +75,20 @@ MAX_SCREENSHOT_HEIGHT = 2000
 MAX_SCREENSHOT_WIDTH = 1920
 
 
+# CDP commands that are safe to send twice, so _send_cdp_command() may retry them when the pooled session broke
+RETRYABLE_CDP_COMMANDS = frozenset(
+	{
+		'Browser.getWindowForTarget',
+		'Browser.setWindowBounds',
+		'Emulation.setEmulatedVisionDeficiency',
+		'Page.captureScreenshot',
+		'Page.getLayoutMetrics',
+		'Storage.clearDataForOrigin',
+		'Target.getTargets',
+	}
+)
+
+
 def _log_glob_warning(domain: str, glob: str, logger: logging.Logger):
 	global _GLOB_WARNING_SHOWN
 	if not _GLOB_WARNING_SHOWN:
@@ -290,6 +306,11 @@ class BrowserSession(BaseModel):
 	_owns_browser_resources: bool = PrivateAttr(default=True)  # True if this instance owns and should clean up browser resources
 	_auto_download_pdfs: bool = PrivateAttr(default=True)  # Auto-download PDFs when detected
 	_subprocess: Any = PrivateAttr(default=None)  # Chrome subprocess reference for error handling
+	_dom_service: DomService | None = PrivateAttr(default=None)  # reused across steps for incremental_dom_snapshots
+	_cdp_sessions: dict[Page, CDPSession] = PrivateAttr(default_factory=dict)  # see _get_cdp_session()
+	_downloads: list[asyncio.Task] = PrivateAttr(default_factory=list)  # downloads saved in the background, see _save_download()
+	_download_listener_context: Any = PrivateAttr(default=None)  # browser_context that _setup_download_listeners() is attached to
+	_allowed_domains_matcher: tuple[list[str], DomainMatcher] | None = PrivateAttr(default=None)  # see _is_url_allowed()
 
 	@model_validator(mode='after')
 	def apply_session_overrides_to_profile(self) -> Self:
@@ -387,6 +408,7 @@ class BrowserSession(BaseModel):
 			# Configure browser
 			await self._setup_viewports()
 			await self._setup_current_page_change_listeners()
+			self._setup_download_listeners()
 			await self._start_context_tracing()
 
 			self.initialized = True
@@ -1643,9 +1665,9 @@ class BrowserSession(BaseModel):
 
 			# cdp api: https://chromedevtools.github.io/devtools-protocol/tot/Browser/#method-setWindowBounds
 			try:
-				cdp_session = await page.context.new_cdp_session(page)  # type: ignore
-				window_id_result = await cdp_session.send('Browser.getWindowForTarget')
-				await cdp_session.send(
+				window_id_result = await self._send_cdp_command(page, 'Browser.getWindowForTarget')
+				await self._send_cdp_command(
+					page,
 					'Browser.setWindowBounds',
 					{
 						'windowId': window_id_result['windowId'],
@@ -1655,10 +1677,6 @@ class BrowserSession(BaseModel):
 						},
 					},
 				)
-				try:
-					await asyncio.wait_for(cdp_session.detach(), timeout=1.0)
-				except (TimeoutError, Exception):
-					pass
 			except Exception as e:
 				_log_size = lambda size: f'{size["width"]}x{size["height"]}px'
 				try:
@@ -1753,6 +1771,9 @@ class BrowserSession(BaseModel):
 		self.cdp_url = None
 		self.browser_pid = None
 		self._cached_browser_state_summary = None
+		self._dom_service = None
+		self._cdp_sessions = {}
+		self._download_listener_context = None
 		# Don't clear self.playwright here - it should be cleared explicitly in kill()
 
 		if self.browser_pid:
@@ -1772,6 +1793,22 @@ class BrowserSession(BaseModel):
 		if not already_disconnected:
 			self.logger.debug(f'⚰️ Browser {self._connection_str} disconnected')
 
+	def _reset_page_state(self, page: Page) -> None:
+		"""Forget everything cached about the pages of the browser_context, and focus on page (used when a context is recycled)"""
+		self.agent_current_page = page
+		self.human_current_page = page
+		self._cached_browser_state_summary = None
+		self._cached_clickable_element_hashes = None
+		self._dom_service = None
+		self._downloaded_files = []
+		# downloads still in progress belong to the previous user of the context, don't let them land in the new one's files
+		for download in self._downloads:
+			download.cancel()
+		self._downloads = []
+		self._cdp_sessions = {
+			open_page: session for open_page, session in self._cdp_sessions.items() if not open_page.is_closed()
+		}
+
 	def _check_for_singleton_lock_conflict(self) -> bool:
 		"""Check if the user data directory has a conflicting browser process.
 
@@ -2074,47 +2111,25 @@ class BrowserSession(BaseModel):
 			async def perform_click(click_func):
 				"""Performs the actual click, handling both download and navigation scenarios."""
 
-				# only wait the 5s extra for potential downloads if they are enabled
-				# TODO: instead of blocking for 5s, we should register a non-block page.on('download') event
-				# and then check if the download has been triggered within the event handler
-				if self.browser_profile.downloads_path:
-					try:
-						# Try short-timeout expect_download to detect a file download has been been triggered
-						async with page.expect_download(timeout=5_000) as download_info:
-							await click_func()
-						download = await download_info.value
-						# Determine file path
-						suggested_filename = download.suggested_filename
-						unique_filename = await self._get_unique_filename(self.browser_profile.downloads_path, suggested_filename)
-						download_path = os.path.join(self.browser_profile.downloads_path, unique_filename)
-						await download.save_as(download_path)
-						self.logger.info(f'⬇️ Downloaded file to: {download_path}')
-
-						# Track the downloaded file in the session
-						self._downloaded_files.append(download_path)
-						self.logger.info(f'📁 Added download to session tracking (total: {len(self._downloaded_files)} files)')
-
-						return download_path
-					except Exception:
-						# If no download is triggered, treat as normal click
-						self.logger.debug('No download triggered within timeout. Checking navigation...')
-						try:
-							await page.wait_for_load_state()
-						except Exception as e:
-							self.logger.warning(
-								f'⚠️ Page {_log_pretty_url(page.url)} failed to finish loading after click: {type(e).__name__}: {e}'
-							)
-						await self._check_and_handle_navigation(page)
-				else:
-					# If downloads are disabled, just perform the click
-					await click_func()
-					try:
-						await page.wait_for_load_state()
-					except Exception as e:
-						self.logger.warning(
-							f'⚠️ Page {_log_pretty_url(page.url)} failed to finish loading after click: {type(e).__name__}: {e}'
-						)
-					await self._check_and_handle_navigation(page)
+				# downloads are picked up by the page.on('download') listeners in the background, so the click never waits for one
+				downloads_before = set(self._downloads)
+				await click_func()
+				try:
+					await page.wait_for_load_state()
+				except Exception as e:
+					self.logger.warning(
+						f'⚠️ Page {_log_pretty_url(page.url)} failed to finish loading after click: {type(e).__name__}: {e}'
+					)
+
+				# only wait for the downloads that the click started before it finished loading,
+				# downloads that start later are saved in the background and surfaced by wait_for_downloads()
+				started_downloads = [download for download in self._downloads if download not in downloads_before]
+				if started_downloads:
+					download_paths = [path for path in await asyncio.gather(*started_downloads) if path]
+					if download_paths:
+						return download_paths[-1]
+
+				await self._check_and_handle_navigation(page)
 
 			try:
 				return await perform_click(lambda: element_handle and element_handle.click(timeout=1_500))
@@ -2620,8 +2635,11 @@ class BrowserSession(BaseModel):
 	# 	return list(Path(self.browser_profile.downloads_path).glob('*'))
 
 	async def _wait_for_stable_network(self):
+		loop = asyncio.get_running_loop()
 		pending_requests = set()
-		last_activity = asyncio.get_event_loop().time()
+		last_activity = loop.time()
+		# set whenever a relevant request starts or finishes, the waiter below sleeps until then or until the idle window is over
+		network_activity = asyncio.Event()
 
 		page = await self.get_current_page()
 
@@ -2644,45 +2662,13 @@ class BrowserSession(BaseModel):
 			'application/json',
 		}
 
-		# Additional patterns to filter out
-		IGNORED_URL_PATTERNS = {
-			# Analytics and tracking
-			'analytics',
-			'tracking',
-			'telemetry',
-			'beacon',
-			'metrics',
-			# Ad-related
-			'doubleclick',
-			'adsystem',
-			'adserver',
-			'advertising',
-			# Social media widgets
-			'facebook.com/plugins',
-			'platform.twitter',
-			'linkedin.com/embed',
-			# Live chat and support
-			'livechat',
-			'zendesk',
-			'intercom',
-			'crisp.chat',
-			'hotjar',
-			# Push notifications
-			'push-notifications',
-			'onesignal',
-			'pushwoosh',
-			# Background sync/heartbeat
-			'heartbeat',
-			'ping',
-			'alive',
-			# WebRTC and streaming
-			'webrtc',
-			'rtmp://',
-			'wss://',
-			# Common CDNs for dynamic content
-			'cloudfront.net',
-			'fastly.net',
-		}
+		# Additional patterns to filter out (see BrowserProfile.network_idle_ignored_url_patterns), compiled into a single regex
+		ignored_url_matcher = compile_url_substring_matcher(tuple(self.browser_profile.network_idle_ignored_url_patterns))
+
+		def mark_activity() -> None:
+			nonlocal last_activity
+			last_activity = loop.time()
+			network_activity.set()
 
 		async def on_request(request):
 			# Filter by resource type
@@ -2701,7 +2687,7 @@ class BrowserSession(BaseModel):
 
 			# Filter out by URL patterns
 			url = request.url.lower()
-			if any(pattern in url for pattern in IGNORED_URL_PATTERNS):
+			if ignored_url_matcher and ignored_url_matcher.search(url):
 				return
 
 			# Filter out data URLs and blob URLs
@@ -2716,9 +2702,8 @@ class BrowserSession(BaseModel):
 			]:
 				return
 
-			nonlocal last_activity
 			pending_requests.add(request)
-			last_activity = asyncio.get_event_loop().time()
+			mark_activity()
 			# self.logger.debug(f'Request started: {request.url} ({request.resource_type})')
 
 		async def on_response(response):
@@ -2744,55 +2729,75 @@ class BrowserSession(BaseModel):
 				]
 			):
 				pending_requests.remove(request)
+				network_activity.set()
 				return
 
 			# Only process relevant content types
 			if not any(ct in content_type for ct in RELEVANT_CONTENT_TYPES):
 				pending_requests.remove(request)
+				network_activity.set()
 				return
 
 			# Skip if response is too large (likely not essential for page load)
 			content_length = response.headers.get('content-length')
 			if content_length and int(content_length) > 5 * 1024 * 1024:  # 5MB
 				pending_requests.remove(request)
+				network_activity.set()
 				return
 
-			nonlocal last_activity
 			pending_requests.remove(request)
-			last_activity = asyncio.get_event_loop().time()
+			mark_activity()
 			# self.logger.debug(f'Request resolved: {request.url} ({content_type})')
 
+		async def on_request_failed(request):
+			# failed requests never get a response, don't wait for them until the timeout
+			if request in pending_requests:
+				pending_requests.remove(request)
+				mark_activity()
+
 		# Attach event listeners
 		page.on('request', on_request)
 		page.on('response', on_response)
+		page.on('requestfailed', on_request_failed)
 
-		now = asyncio.get_event_loop().time()
+		start_time = now = loop.time()
+		deadline = start_time + self.browser_profile.maximum_wait_page_load_time
 		try:
 			# Wait for idle time
-			start_time = asyncio.get_event_loop().time()
 			while True:
-				await asyncio.sleep(0.1)
-				now = asyncio.get_event_loop().time()
-				if (
-					len(pending_requests) == 0
-					and (now - last_activity) >= self.browser_profile.wait_for_network_idle_page_load_time
-				):
-					break
-				if now - start_time > self.browser_profile.maximum_wait_page_load_time:
+				now = loop.time()
+				if now >= deadline:
 					self.logger.debug(
 						f'{self} Network timeout after {self.browser_profile.maximum_wait_page_load_time}s with {len(pending_requests)} '
 						f'pending requests: {[r.url for r in pending_requests]}'
 					)
 					break
 
+				if pending_requests:
+					# nothing to do until a request finishes
+					timeout = deadline - now
+				else:
+					idle_time = now - last_activity
+					if idle_time >= self.browser_profile.wait_for_network_idle_page_load_time:
+						break
+					timeout = min(self.browser_profile.wait_for_network_idle_page_load_time - idle_time, deadline - now)
+
+				# no await between checking the state above and clearing the event, so no activity can be missed
+				network_activity.clear()
+				try:
+					await asyncio.wait_for(network_activity.wait(), timeout=timeout)
+				except TimeoutError:
+					pass
+
 		finally:
 			# Clean up event listeners
 			page.remove_listener('request', on_request)
 			page.remove_listener('response', on_response)
+			page.remove_listener('requestfailed', on_request_failed)
 
 		elapsed = now - start_time
 		if elapsed > 1:
-			self.logger.debug(f'💤 Page network traffic calmed down after {now - start_time:.2f} seconds')
+			self.logger.debug(f'💤 Page network traffic calmed down after {elapsed:.2f} seconds')
 
 	@observe_debug(ignore_input=True, ignore_output=True, name='wait_for_page_and_frames_load')
 	async def _wait_for_page_and_frames_load(self, timeout_overwrite: float | None = None):
@@ -2863,21 +2868,20 @@ class BrowserSession(BaseModel):
 		if is_new_tab_page(url):
 			return True
 
-		for allowed_domain in self.browser_profile.allowed_domains:
-			try:
-				if match_url_with_domain_pattern(url, allowed_domain, log_warnings=True):
-					# If it's a pattern with wildcards, show a warning
-					if '*' in allowed_domain:
-						parsed_url = urlparse(url)
-						domain = parsed_url.hostname.lower() if parsed_url.hostname else ''
-						_log_glob_warning(domain, allowed_domain, self.logger)
-					return True
-			except AssertionError:
-				# This would only happen if a new tab page is passed to match_url_with_domain_pattern,
-				# which shouldn't occur since we check for it above
-				continue
+		# the allow-list can be tens of thousands of patterns long, so it's only compiled again when a new list is assigned
+		allowed_domains = self.browser_profile.allowed_domains
+		if self._allowed_domains_matcher is None or self._allowed_domains_matcher[0] is not allowed_domains:
+			self._allowed_domains_matcher = (allowed_domains, DomainMatcher(allowed_domains, log_warnings=True))
+		allowed_domain = self._allowed_domains_matcher[1].first_matching_pattern(url)
+		if allowed_domain is None:
+			return False
 
-		return False
+		# If it's a pattern with wildcards, show a warning
+		if '*' in allowed_domain:
+			parsed_url = urlparse(url)
+			domain = parsed_url.hostname.lower() if parsed_url.hostname else ''
+			_log_glob_warning(domain, allowed_domain, self.logger)
+		return True
 
 	async def _check_and_handle_navigation(self, page: Page) -> None:
 		"""Check if current page URL is allowed and handle if not."""
@@ -3171,41 +3175,82 @@ class BrowserSession(BaseModel):
 			except Exception as e:
 				self.logger.debug(f'PDF auto-download check failed: {type(e).__name__}: {e}')
 
-			self.logger.debug('🌳 Starting DOM processing...')
-			dom_service = DomService(page, logger=self.logger)
-			try:
-				content = await asyncio.wait_for(
-					dom_service.get_clickable_elements(
-						focus_element=focus_element,
-						viewport_expansion=self.browser_profile.viewport_expansion,
-						highlight_elements=self.browser_profile.highlight_elements,
-					),
-					timeout=45.0,  # 45 second timeout for DOM processing - generous for complex pages
-				)
-				self.logger.debug('✅ DOM processing completed')
-			except TimeoutError:
-				self.logger.warning(f'DOM processing timed out after 45 seconds for {page.url}')
-				self.logger.warning('🔄 Falling back to minimal DOM state to allow basic navigation...')
-
-				# Create minimal DOM state for basic navigation
-				from browser_use.dom.views import DOMElementNode
-
-				minimal_element_tree = DOMElementNode(
-					tag_name='body',
-					xpath='/body',
-					attributes={},
-					children=[],
-					is_visible=True,
-					parent=None,
-				)
+			incremental = self.browser_profile.incremental_dom_snapshots
+			if incremental and self._dom_service is not None and self._dom_service.page is page:
+				# same page as last step, the previous snapshot can be patched with only what changed since
+				dom_service = self._dom_service
+			else:
+				dom_service = DomService(page, logger=self.logger)
+				self._dom_service = dom_service if incremental else None
+
+			async def capture_dom_state() -> DOMState:
+				self.logger.debug('🌳 Starting DOM processing...')
+				try:
+					content = await asyncio.wait_for(
+						dom_service.get_clickable_elements(
+							focus_element=focus_element,
+							viewport_expansion=self.browser_profile.viewport_expansion,
+							highlight_elements=self.browser_profile.highlight_elements,
+							incremental=incremental,
+							packed=self.browser_profile.packed_dom_transfer,
+						),
+						timeout=45.0,  # 45 second timeout for DOM processing - generous for complex pages
+					)
+					self.logger.debug('✅ DOM processing completed')
+					return content
+				except TimeoutError:
+					self.logger.warning(f'DOM processing timed out after 45 seconds for {page.url}')
+					self.logger.warning('🔄 Falling back to minimal DOM state to allow basic navigation...')
+
+					# Create minimal DOM state for basic navigation
+					minimal_element_tree = DOMElementNode(
+						tag_name='body',
+						xpath='/body',
+						attributes={},
+						children=[],
+						is_visible=True,
+						parent=None,
+					)
+					return DOMState(element_tree=minimal_element_tree, selector_map={})
 
-				from browser_use.dom.views import DOMState
+			async def capture_screenshot() -> str | None:
+				try:
+					self.logger.debug('📸 Capturing screenshot...')
+					# Reasonable timeout for screenshot
+					return await self.take_screenshot()
+				except Exception as e:
+					self.logger.warning(f'❌ Screenshot failed for {_log_pretty_url(page.url)}: {type(e).__name__} {e}')
+					return None
 
-				content = DOMState(element_tree=minimal_element_tree, selector_map={})
+			async def capture_dom_state_and_screenshot() -> tuple[DOMState, str | None]:
+				if self.browser_profile.highlight_elements:
+					# the screenshot has to show the highlights drawn during DOM processing, so it has to wait for it
+					content = await capture_dom_state()
+					return content, await capture_screenshot()
+				content, screenshot_b64 = await asyncio.gather(capture_dom_state(), capture_screenshot())
+				return content, screenshot_b64
+
+			async def capture_tabs_info() -> list[TabInfo]:
+				self.logger.debug('📋 Getting tabs info...')
+				tabs_info = await self.get_tabs_info()
+				self.logger.debug('✅ Tabs info completed')
+				return tabs_info
+
+			async def capture_scroll_info() -> tuple[int, int]:
+				try:
+					self.logger.debug('📏 Getting scroll info...')
+					pixels_above, pixels_below = await asyncio.wait_for(self.get_scroll_info(page), timeout=5.0)
+					self.logger.debug('✅ Scroll info completed')
+					return pixels_above, pixels_below
+				except Exception as e:
+					self.logger.warning(f'Failed to get scroll info: {type(e).__name__}')
+					return 0, 0
 
-			self.logger.debug('📋 Getting tabs info...')
-			tabs_info = await self.get_tabs_info()
-			self.logger.debug('✅ Tabs info completed')
+			async def capture_title() -> str:
+				try:
+					return await asyncio.wait_for(page.title(), timeout=3.0)
+				except Exception:
+					return 'Title unavailable'
 
 			# Get all cross-origin iframes within the page and open them in new tabs
 			# mark the titles of the new tabs so the LLM knows to check them for additional content
@@ -3228,29 +3273,26 @@ class BrowserSession(BaseModel):
 			# 		)
 			# 	)
 
+			# The components are independent round-trips to the browser, so they run concurrently and the state
+			# is ready after the slowest one instead of after all of them. Components with a fallback (screenshot,
+			# scroll info, title, DOM timeout) never raise, a failure in any other one cancels the rest and is
+			# handled below like before, by returning the last known good state.
 			try:
-				self.logger.debug('📸 Capturing screenshot...')
-				# Reasonable timeout for screenshot
-				screenshot_b64 = await self.take_screenshot()
-				# self.logger.debug('✅ Screenshot completed')
-			except Exception as e:
-				self.logger.warning(f'❌ Screenshot failed for {_log_pretty_url(page.url)}: {type(e).__name__} {e}')
-				screenshot_b64 = None
-
-			# Get comprehensive page information
-			page_info = await self.get_page_info(page)
-			try:
-				self.logger.debug('📏 Getting scroll info...')
-				pixels_above, pixels_below = await asyncio.wait_for(self.get_scroll_info(page), timeout=5.0)
-				self.logger.debug('✅ Scroll info completed')
-			except Exception as e:
-				self.logger.warning(f'Failed to get scroll info: {type(e).__name__}')
-				pixels_above, pixels_below = 0, 0
-
-			try:
-				title = await asyncio.wait_for(page.title(), timeout=3.0)
-			except Exception:
-				title = 'Title unavailable'
+				async with asyncio.TaskGroup() as task_group:
+					dom_task = task_group.create_task(capture_dom_state_and_screenshot())
+					tabs_task = task_group.create_task(capture_tabs_info())
+					# Get comprehensive page information
+					page_info_task = task_group.create_task(asyncio.wait_for(self.get_page_info(page), timeout=10.0))
+					scroll_task = task_group.create_task(capture_scroll_info())
+					title_task = task_group.create_task(capture_title())
+			except ExceptionGroup as e:
+				raise e.exceptions[0]
+
+			content, screenshot_b64 = dom_task.result()
+			tabs_info = tabs_task.result()
+			page_info = page_info_task.result()
+			pixels_above, pixels_below = scroll_task.result()
+			title = title_task.result()
 
 			# Check if this is a minimal fallback state
 			browser_errors = []
@@ -3310,6 +3352,62 @@ class BrowserSession(BaseModel):
 				except (asyncio.CancelledError, Exception):
 					pass
 
+	async def _get_cdp_session(self, page: Page) -> CDPSession:
+		"""Get the CDP session attached to the page, creating it on first use.
+
+		Sessions are reused across calls instead of being created and detached around every command,
+		and are dropped from the pool when their page closes or a command on them fails.
+		"""
+		cdp_session = self._cdp_sessions.get(page)
+		if cdp_session is not None:
+			return cdp_session
+
+		cdp_session = await page.context.new_cdp_session(page)  # type: ignore
+
+		# another caller may have attached one in the meantime, keep the first one
+		if page in self._cdp_sessions:
+			await self._detach_cdp_session(cdp_session)
+			return self._cdp_sessions[page]
+
+		self._cdp_sessions[page] = cdp_session
+		page.once('close', lambda *args: self._cdp_sessions.pop(page, None))
+		return cdp_session
+
+	async def _send_cdp_command(self, page: Page, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+		"""Send a CDP command to the page over its pooled CDP session.
+
+		If the command fails on a reused session (e.g. it was detached by a navigation to another process),
+		the session is discarded. Commands that are safe to run twice (RETRYABLE_CDP_COMMANDS) are then retried
+		once on a fresh session, others may already have taken effect so the error is raised.
+		"""
+		reused = page in self._cdp_sessions
+		cdp_session = await self._get_cdp_session(page)
+		try:
+			return await cdp_session.send(method, params)  # type: ignore
+		except Exception:
+			await self._discard_cdp_session(page, cdp_session)
+			if not reused or page.is_closed() or method not in RETRYABLE_CDP_COMMANDS:
+				raise
+
+		cdp_session = await self._get_cdp_session(page)
+		try:
+			return await cdp_session.send(method, params)  # type: ignore
+		except Exception:
+			await self._discard_cdp_session(page, cdp_session)
+			raise
+
+	async def _discard_cdp_session(self, page: Page, cdp_session: CDPSession) -> None:
+		if self._cdp_sessions.get(page) is cdp_session:
+			del self._cdp_sessions[page]
+		await self._detach_cdp_session(cdp_session)
+
+	@staticmethod
+	async def _detach_cdp_session(cdp_session: CDPSession) -> None:
+		try:
+			await asyncio.wait_for(cdp_session.detach(), timeout=1.0)
+		except Exception:
+			pass
+
 	async def _force_close_page_via_cdp(self, page_url: str) -> bool:
 		"""Force close a crashed page using CDP from a clean temporary page."""
 		try:
@@ -3320,12 +3418,9 @@ class BrowserSession(BaseModel):
 			temp_page = await asyncio.wait_for(self.browser_context.new_page(), timeout=5.0)
 			await asyncio.wait_for(temp_page.goto('about:blank'), timeout=2.0)
 
-			# Create CDP session from the clean page
-			cdp_session = await asyncio.wait_for(self.browser_context.new_cdp_session(temp_page), timeout=5.0)  # type: ignore
-
 			try:
-				# Get all browser targets
-				targets = await asyncio.wait_for(cdp_session.send('Target.getTargets'), timeout=2.0)
+				# Get all browser targets, via a CDP session on the clean page
+				targets = await asyncio.wait_for(self._send_cdp_command(temp_page, 'Target.getTargets'), timeout=5.0)
 
 				# Find the crashed page target
 				blocked_target_id = None
@@ -3340,7 +3435,9 @@ class BrowserSession(BaseModel):
 					self.logger.warning(
 						f'🪓 Force-closing crashed page target_id={blocked_target_id} via CDP: {_log_pretty_url(page_url)}...'
 					)
-					await asyncio.wait_for(cdp_session.send('Target.closeTarget', {'targetId': blocked_target_id}), timeout=2.0)
+					await asyncio.wait_for(
+						self._send_cdp_command(temp_page, 'Target.closeTarget', {'targetId': blocked_target_id}), timeout=2.0
+					)
 					# self.logger.debug(f'☠️ Successfully force-closed crashed page target_id={blocked_target_id} via CDP: {_log_pretty_url(page_url)}')
 					return True
 				else:
@@ -3350,11 +3447,7 @@ class BrowserSession(BaseModel):
 					return False
 
 			finally:
-				# Clean up
-				try:
-					await asyncio.wait_for(cdp_session.detach(), timeout=1.0)
-				except Exception:
-					pass
+				# Clean up (closing the page also drops its CDP session from the pool)
 				await temp_page.close()
 
 		except Exception as e:
@@ -3576,28 +3669,36 @@ class BrowserSession(BaseModel):
 			pass
 
 		# Take screenshot using CDP to get around playwright's unnecessary slowness and weird behavior
-		cdp_session = None
+		grayscale = self.browser_profile.screenshot_grayscale
 		try:
-			# Create CDP session for the screenshot
+			screenshot_format = self.browser_profile.screenshot_format
 			self.logger.debug(
-				f'📸 Taking viewport-only PNG screenshot of page via fresh CDP session: {_log_pretty_url(page.url)}'
+				f'📸 Taking viewport-only {screenshot_format.upper()} screenshot of page via CDP: {_log_pretty_url(page.url)}'
 			)
-			cdp_session = await self.browser_context.new_cdp_session(page)  # type: ignore
+
+			# encoding and downscaling are done by the browser at capture time, no need to re-encode the image in python
+			capture_params: dict[str, Any] = {
+				'captureBeyondViewport': False,
+				'fromSurface': True,
+				'format': screenshot_format,
+			}
+			if screenshot_format != 'png' and self.browser_profile.screenshot_quality is not None:
+				capture_params['quality'] = self.browser_profile.screenshot_quality
+			if self.browser_profile.screenshot_max_size:
+				clip = await self._get_downscaled_viewport_clip(page, self.browser_profile.screenshot_max_size)
+				if clip:
+					capture_params['clip'] = clip
+
+			if grayscale:
+				await self._send_cdp_command(page, 'Emulation.setEmulatedVisionDeficiency', {'type': 'achromatopsia'})
 
 			# Capture screenshot via CDP
-			screenshot_response = await cdp_session.send(
-				'Page.captureScreenshot',
-				{
-					'captureBeyondViewport': False,
-					'fromSurface': True,
-					'format': 'png',
-				},
-			)
+			screenshot_response = await self._send_cdp_command(page, 'Page.captureScreenshot', capture_params)
 
 			screenshot_b64 = screenshot_response.get('data')
 			if not screenshot_b64:
 				raise Exception(
-					f'CDP returned empty screenshot data for page {_log_pretty_url(page.url)}? (expected png base64)'
+					f'CDP returned empty screenshot data for page {_log_pretty_url(page.url)}? (expected {screenshot_format} base64)'
 				)  # have never seen this happen in practice
 
 			return screenshot_b64
@@ -3610,12 +3711,34 @@ class BrowserSession(BaseModel):
 				self.logger.error(f'❌ Screenshot failed on page {_log_pretty_url(page.url)} (possibly crashed): {error_str}')
 			raise
 		finally:
-			if cdp_session:
+			if grayscale:
 				try:
-					await asyncio.wait_for(cdp_session.detach(), timeout=1.0)
+					await self._send_cdp_command(page, 'Emulation.setEmulatedVisionDeficiency', {'type': 'none'})
 				except Exception:
 					pass
 
+	async def _get_downscaled_viewport_clip(self, page: Page, max_size: ViewportSize) -> dict[str, float] | None:
+		"""CDP Page.captureScreenshot clip of the visible viewport, scaled down so the image fits within max_size (device pixels)"""
+		metrics = await self._send_cdp_command(page, 'Page.getLayoutMetrics')
+		viewport = metrics.get('cssVisualViewport') or {}
+		width, height = viewport.get('clientWidth'), viewport.get('clientHeight')
+		if not width or not height:
+			return None
+
+		# the deprecated visualViewport is in device pixels, the css one in css pixels
+		device_pixel_ratio = (metrics.get('visualViewport') or {}).get('clientWidth', width) / width
+		scale = min(1.0, max_size['width'] / (width * device_pixel_ratio), max_size['height'] / (height * device_pixel_ratio))
+		if scale >= 1.0:
+			return None
+
+		return {
+			'x': viewport.get('pageX', 0),
+			'y': viewport.get('pageY', 0),
+			'width': width,
+			'height': height,
+			'scale': scale,
+		}
+
 	# region - User Actions
 
 	@staticmethod
@@ -3629,6 +3752,79 @@ class BrowserSession(BaseModel):
 			counter += 1
 		return new_filename
 
+	@staticmethod
+	def _reserve_unique_download_path(directory: str | Path, filename: str) -> str:
+		"""Create an empty placeholder file at a unique path, so concurrent downloads of the same filename can't collide."""
+		os.makedirs(directory, exist_ok=True)
+		base, ext = os.path.splitext(filename)
+		counter = 0
+		while True:
+			download_path = os.path.join(directory, f'{base} ({counter}){ext}' if counter else filename)
+			try:
+				open(download_path, 'x').close()
+				return download_path
+			except FileExistsError:
+				counter += 1
+
+	def _setup_download_listeners(self) -> None:
+		"""Save every download started by any page of the browser_context in the background (only if downloads_path is set)"""
+		if not self.browser_profile.downloads_path or not self.browser_context:
+			return
+		if self._download_listener_context is self.browser_context:
+			return  # already listening, e.g. when start() is called again on a running session
+		self._download_listener_context = self.browser_context
+
+		def on_download(download: Download) -> None:
+			self._downloads.append(asyncio.create_task(self._save_download(download)))
+
+		def watch_page(page: Page) -> None:
+			page.on('download', on_download)  # type: ignore
+
+		for page in self.browser_context.pages:
+			watch_page(page)
+		self.browser_context.on('page', watch_page)  # type: ignore
+
+	async def _save_download(self, download: Download) -> str | None:
+		"""Save a download to downloads_path once it finishes, returns the path it was saved to (or None if it failed)"""
+		assert self.browser_profile.downloads_path, 'downloads_path must be set to save downloads'
+		download_path = None
+		try:
+			download_path = await asyncio.to_thread(
+				self._reserve_unique_download_path, self.browser_profile.downloads_path, download.suggested_filename
+			)
+			await download.save_as(download_path)
+		except asyncio.CancelledError:
+			# the session was reset for someone else before the download finished (see _reset_page_state)
+			if download_path:
+				await anyio.Path(download_path).unlink(missing_ok=True)
+			raise
+		except Exception as e:
+			self.logger.warning(f'⚠️ Download of {_log_pretty_url(download.url)} failed: {type(e).__name__}: {e}')
+			if download_path:
+				await anyio.Path(download_path).unlink(missing_ok=True)
+			return None
+		self.logger.info(f'⬇️ Downloaded file to: {download_path}')
+
+		# Track the downloaded file in the session
+		self._downloaded_files.append(download_path)
+		self.logger.info(f'📁 Added download to session tracking (total: {len(self._downloaded_files)} files)')
+		return download_path
+
+	@property
+	def has_pending_downloads(self) -> bool:
+		"""True if a download was started in the browser and is not saved to downloads_path yet"""
+		return any(not download.done() for download in self._downloads)
+
+	async def wait_for_downloads(self, timeout: float | None = None) -> list[str]:
+		"""Wait for the downloads in progress to finish (or for timeout seconds), and return the paths of all downloaded files"""
+		pending = [download for download in self._downloads if not download.done()]
+		if pending:
+			_, still_pending = await asyncio.wait(pending, timeout=timeout)
+			if still_pending:
+				self.logger.debug(f'⬇️ {len(still_pending)} downloads still in progress after {timeout}s, continuing')
+		self._downloads = [download for download in self._downloads if not download.done()]
+		return self.downloaded_files
+
 	async def _start_context_tracing(self):
 		"""Start tracing on browser context if trace_path is configured."""
 		if self.browser_profile.traces_dir and self.browser_context:
@@ -4284,8 +4480,6 @@ class BrowserSession(BaseModel):
 		"""
 		try:
 			# Use CDP to synthesize scroll gesture - works in all contexts including PDFs
-			cdp_session = await page.context.new_cdp_session(page)  # type: ignore
-
 			# Get viewport center for scroll origin
 			viewport = await page.evaluate("""
 				() => ({
@@ -4297,7 +4491,8 @@ class BrowserSession(BaseModel):
 			center_x = viewport['width'] // 2
 			center_y = viewport['height'] // 2
 
-			await cdp_session.send(
+			await self._send_cdp_command(
+				page,
 				'Input.synthesizeScrollGesture',
 				{
 					'x': center_x,
@@ -4309,10 +4504,6 @@ class BrowserSession(BaseModel):
 				},
 			)
 
-			try:
-				await asyncio.wait_for(cdp_session.detach(), timeout=1.0)
-			except (TimeoutError, Exception):
-				pass
 			self.logger.debug(f'📄 Scrolled via CDP Input.synthesizeScrollGesture: {pixels}px')
 			return True
 
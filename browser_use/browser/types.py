@@ -5,7 +5,10 @@ import sys
 from patchright._impl._errors import TargetClosedError as PatchrightTargetClosedError
 from patchright.async_api import Browser as PatchrightBrowser
 from patchright.async_api import BrowserContext as PatchrightBrowserContext
+from patchright.async_api import CDPSession as PatchrightCDPSession
+from patchright.async_api import Download as PatchrightDownload
 from patchright.async_api import ElementHandle as PatchrightElementHandle
+from patchright.async_api import Frame as PatchrightFrame
 from patchright.async_api import FrameLocator as PatchrightFrameLocator
 from patchright.async_api import Page as PatchrightPage
 from patchright.async_api import Playwright as Patchright
@@ -13,7 +16,10 @@ from patchright.async_api import async_playwright as _async_patchright
 from playwright._impl._errors import TargetClosedError as PlaywrightTargetClosedError
 from playwright.async_api import Browser as PlaywrightBrowser
 from playwright.async_api import BrowserContext as PlaywrightBrowserContext
+from playwright.async_api import CDPSession as PlaywrightCDPSession
+from playwright.async_api import Download as PlaywrightDownload
 from playwright.async_api import ElementHandle as PlaywrightElementHandle
+from playwright.async_api import Frame as PlaywrightFrame
 from playwright.async_api import FrameLocator as PlaywrightFrameLocator
 from playwright.async_api import Page as PlaywrightPage
 from playwright.async_api import Playwright as Playwright
@@ -23,7 +29,10 @@ from playwright.async_api import async_playwright as _async_playwright
 Browser = PatchrightBrowser | PlaywrightBrowser
 BrowserContext = PatchrightBrowserContext | PlaywrightBrowserContext
 Page = PatchrightPage | PlaywrightPage
+CDPSession = PatchrightCDPSession | PlaywrightCDPSession
+Download = PatchrightDownload | PlaywrightDownload
 ElementHandle = PatchrightElementHandle | PlaywrightElementHandle
+Frame = PatchrightFrame | PlaywrightFrame
 FrameLocator = PatchrightFrameLocator | PlaywrightFrameLocator
 Playwright = Playwright
 Patchright = Patchright
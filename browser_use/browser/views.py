@@ -5,6 +5,7 @@ from pydantic import BaseModel
 
 from browser_use.dom.history_tree_processor.service import DOMHistoryElement
 from browser_use.dom.views import DOMState
+from browser_use.screenshots.service import ScreenshotStore, load_screenshot
 
 
 # Pydantic
@@ -69,12 +70,24 @@ class BrowserStateHistory:
 	title: str
 	tabs: list[TabInfo]
 	interacted_element: list[DOMHistoryElement | None] | list[None]
-	screenshot: str | None = None
+	screenshot: str | None = None  # base64, only set when the screenshot isn't kept in a ScreenshotStore
+	screenshot_path: str | None = None  # see browser_use.screenshots.service.ScreenshotStore
+	screenshot_store: ScreenshotStore | None = field(default=None, repr=False, compare=False)  # not serialized
+
+	def get_screenshot(self) -> str | None:
+		"""Get the base64 screenshot, loading it from the ScreenshotStore if needed"""
+		if self.screenshot is not None or self.screenshot_path is None:
+			return self.screenshot
+		if self.screenshot_store is not None:
+			return self.screenshot_store.load(self.screenshot_path)
+		return load_screenshot(self.screenshot_path)
 
 	def to_dict(self) -> dict[str, Any]:
 		data = {}
 		data['tabs'] = [tab.model_dump() for tab in self.tabs]
-		data['screenshot'] = self.screenshot
+		# embed the screenshot, so saved histories and GIFs made from them don't depend on the store's files
+		data['screenshot'] = self.get_screenshot()
+		data['screenshot_path'] = self.screenshot_path
 		data['interacted_element'] = [el.to_dict() if el else None for el in self.interacted_element]
 		data['url'] = self.url
 		data['title'] = self.title
@@ -0,0 +1,135 @@
+"""
+Page content for the extract_structured_data action.
+
+Every frame is converted to markdown once and the result is cached until the frame's DOM changes, which is detected
+with a MutationObserver counting the mutations of the document. Long content is split into chunks that can be
+queried concurrently.
+"""
+
+import asyncio
+import logging
+import re
+import weakref
+from functools import partial
+
+from browser_use.browser.types import Frame, Page
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 30000  # characters of page content per LLM call (≈15000 tokens)
+
+# identifies the current document of a frame and how many times its DOM changed, ignoring our own highlight overlays
+DOM_VERSION_SCRIPT = """() => {
+	let state = window.__browserUseDomVersion;
+	if (!state) {
+		state = window.__browserUseDomVersion = { id: Math.random().toString(36).slice(2), mutations: 0 };
+		const isHighlight = (mutation) => {
+			if (mutation.type === 'attributes' && mutation.attributeName === 'browser-user-highlight-id') return true;
+			const target = mutation.target.nodeType === Node.ELEMENT_NODE ? mutation.target : mutation.target.parentElement;
+			if (target?.closest?.('#playwright-highlight-container')) return true;
+			const changed = mutation.type === 'childList' ? [...mutation.addedNodes, ...mutation.removedNodes] : [];
+			return changed.length > 0 && changed.every((node) => node.id === 'playwright-highlight-container');
+		};
+		new MutationObserver((mutations) => {
+			if (!mutations.every(isHighlight)) state.mutations++;
+		}).observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+	}
+	return `${state.id}:${state.mutations}`;
+}"""
+
+# frame -> {extract_links: (dom version, markdown)}, entries go away with their frames
+_markdown_cache: 'weakref.WeakKeyDictionary[Frame, dict[bool, tuple[str, str]]]' = weakref.WeakKeyDictionary()
+
+
+async def _get_dom_version(frame: Frame, timeout: float) -> str | None:
+	try:
+		dom_version = await asyncio.wait_for(frame.evaluate(DOM_VERSION_SCRIPT), timeout=timeout)
+	except Exception:
+		return None  # the frame can't be observed, don't cache it
+	return f'{frame.url} {dom_version}'
+
+
+async def get_frame_markdown(frame: Frame, extract_links: bool, content_timeout: float, markdownify_timeout: float) -> str:
+	"""Convert the HTML of a frame to markdown, reusing the previous result if the DOM did not change since"""
+	import markdownify
+
+	dom_version = await _get_dom_version(frame, content_timeout)
+	cached = _markdown_cache.get(frame, {}).get(extract_links)
+	if dom_version is not None and cached is not None and cached[0] == dom_version:
+		return cached[1]
+
+	html = await asyncio.wait_for(frame.content(), timeout=content_timeout)
+	markdownify_func = partial(markdownify.markdownify, strip=[] if extract_links else ['a', 'img'])
+	markdown = await asyncio.wait_for(asyncio.to_thread(markdownify_func, html), timeout=markdownify_timeout)
+
+	if dom_version is not None:
+		_markdown_cache.setdefault(frame, {})[extract_links] = (dom_version, markdown)
+	return markdown
+
+
+async def _get_iframe_markdown(iframe: Frame, extract_links: bool) -> str:
+	try:
+		await iframe.wait_for_load_state(timeout=1000)  # 1 second aggressive timeout for iframe load
+	except Exception:
+		pass
+
+	try:
+		# 2 second aggressive timeouts for iframe content and markdownify
+		iframe_markdown = await get_frame_markdown(iframe, extract_links, content_timeout=2.0, markdownify_timeout=2.0)
+	except Exception:
+		iframe_markdown = ''  # Skip failed iframes
+	return f'\n\nIFRAME {iframe.url}:\n{iframe_markdown}'
+
+
+async def get_page_markdown(page: Page, extract_links: bool) -> str:
+	"""Markdown of the page, with the text of all its iframes appended (includes cross-origin iframes)"""
+	iframes = [
+		iframe
+		for iframe in page.frames
+		if iframe.url != page.url and not iframe.url.startswith('data:') and not iframe.url.startswith('about:')
+	]
+
+	# the page and all its iframes are fetched and converted concurrently
+	page_result, *iframe_results = await asyncio.gather(
+		get_frame_markdown(page.main_frame, extract_links, content_timeout=10.0, markdownify_timeout=5.0),
+		*(_get_iframe_markdown(iframe, extract_links) for iframe in iframes),
+		return_exceptions=True,
+	)
+
+	if isinstance(page_result, TimeoutError):
+		raise RuntimeError('Page content extraction timed out')
+	elif isinstance(page_result, BaseException):
+		logger.warning(f'Page content extraction failed: {type(page_result).__name__}')
+		raise RuntimeError(f"Couldn't extract page content: {page_result}")
+
+	content = page_result + ''.join(result for result in iframe_results if isinstance(result, str))
+	# replace multiple sequential \n with a single \n
+	return re.sub(r'\n+', '\n', content)
+
+
+def split_into_chunks(content: str, chunk_size: int, max_chunks: int) -> list[str]:
+	"""Split content into at most max_chunks chunks of up to chunk_size characters, on line boundaries where possible.
+
+	Content that doesn't fit in max_chunks chunks loses its middle.
+	"""
+	max_chars = chunk_size * max_chunks
+	if len(content) > max_chars:
+		logger.info(f'Content is too long, removing middle {len(content) - max_chars} characters')
+		content = (
+			content[: max_chars // 2] + '\n... left out the middle because it was too long ...\n' + content[-max_chars // 2 :]
+		)
+
+	chunks: list[str] = []
+	start = 0
+	while len(content) - start > chunk_size:
+		end = content.rfind('\n', start, start + chunk_size) + 1
+		if end <= start:
+			end = start + chunk_size  # a single line longer than a chunk
+		chunks.append(content[start:end])
+		start = end
+	chunks.append(content[start:])
+
+	# cutting on line boundaries (and the marker above) can overflow into one more chunk, which goes into the last one
+	if len(chunks) > max_chunks:
+		chunks[max_chunks - 1 :] = [''.join(chunks[max_chunks - 1 :])]
+	return chunks
@@ -2,7 +2,6 @@ import asyncio
 import functools
 import inspect
 import logging
-import re
 from collections.abc import Callable
 from inspect import Parameter, iscoroutinefunction, signature
 from types import UnionType
@@ -22,7 +21,7 @@ from browser_use.filesystem.file_system import FileSystem
 from browser_use.llm.base import BaseChatModel
 from browser_use.observability import observe_debug
 from browser_use.telemetry.service import ProductTelemetry
-from browser_use.utils import is_new_tab_page, match_url_with_domain_pattern, time_execution_async
+from browser_use.utils import DomainMatcher, SensitiveDataRedactor, is_new_tab_page, time_execution_async
 
 Context = TypeVar('Context')
 
@@ -36,6 +35,10 @@ class Registry(Generic[Context]):
 		self.registry = ActionRegistry()
 		self.telemetry = ProductTelemetry()
 		self.exclude_actions = exclude_actions if exclude_actions is not None else []
+		# action models already created, keyed by the names of the actions they contain, see create_action_model()
+		self._action_models: dict[tuple[str, ...], tuple[tuple[RegisteredAction, ...], type[ActionModel]]] = {}
+		# the agent passes the same sensitive_data dict with every action, its domains are compiled once per dict
+		self._sensitive_data_domain_matcher: tuple[dict[str, Any], DomainMatcher] | None = None
 
 	def _get_special_param_types(self) -> dict[str, type | UnionType | None]:
 		"""Get the expected types for special parameters from SpecialActionParameters"""
@@ -413,8 +416,6 @@ class Registry(Generic[Context]):
 		Returns:
 			BaseModel: The parameter object with placeholders replaced by actual values
 		"""
-		secret_pattern = re.compile(r'<secret>(.*?)</secret>')
-
 		# Set to track all missing placeholders across the full object
 		all_missing_placeholders = set()
 		# Set to track successfully replaced placeholders
@@ -423,14 +424,20 @@ class Registry(Generic[Context]):
 		# Process sensitive data based on format and current URL
 		applicable_secrets = {}
 
+		matching_domains: set[str] = set()
+		if current_url and not is_new_tab_page(current_url):
+			# it's a real url, check it using our custom allowed_domains scheme://*.example.com glob matching
+			if self._sensitive_data_domain_matcher is None or self._sensitive_data_domain_matcher[0] is not sensitive_data:
+				domain_patterns = [key for key, content in sensitive_data.items() if isinstance(content, dict)]
+				self._sensitive_data_domain_matcher = (sensitive_data, DomainMatcher(domain_patterns))
+			matching_domains.update(self._sensitive_data_domain_matcher[1].matching_patterns(current_url))
+
 		for domain_or_key, content in sensitive_data.items():
 			if isinstance(content, dict):
 				# New format: {domain_pattern: {key: value}}
 				# Only include secrets for domains that match the current URL
-				if current_url and not is_new_tab_page(current_url):
-					# it's a real url, check it using our custom allowed_domains scheme://*.example.com glob matching
-					if match_url_with_domain_pattern(current_url, domain_or_key):
-						applicable_secrets.update(content)
+				if domain_or_key in matching_domains:
+					applicable_secrets.update(content)
 			else:
 				# Old format: {key: value}, expose to all domains (only allowed for legacy reasons)
 				applicable_secrets[domain_or_key] = content
@@ -440,18 +447,8 @@ class Registry(Generic[Context]):
 
 		def recursively_replace_secrets(value: str | dict | list) -> str | dict | list:
 			if isinstance(value, str):
-				matches = secret_pattern.findall(value)
-
-				for placeholder in matches:
-					if placeholder in applicable_secrets:
-						value = value.replace(f'<secret>{placeholder}</secret>', applicable_secrets[placeholder])
-						replaced_placeholders.add(placeholder)
-					else:
-						# Keep track of missing placeholders
-						all_missing_placeholders.add(placeholder)
-						# Don't replace the tag, keep it as is
-
-				return value
+				# Tags of missing placeholders are kept as they are
+				return SensitiveDataRedactor.restore(value, applicable_secrets, replaced_placeholders, all_missing_placeholders)
 			elif isinstance(value, dict):
 				return {k: recursively_replace_secrets(v) for k, v in value.items()}
 			elif isinstance(value, list):
@@ -478,8 +475,6 @@ class Registry(Generic[Context]):
 		Each action model contains only the specific action being used,
 		rather than all actions with most set to None.
 		"""
-		from typing import Union
-
 		# Filter actions based on page if provided:
 		#   if page is None, only include actions with no filters
 		#   if page is provided, only include actions that match the page
@@ -496,13 +491,28 @@ class Registry(Generic[Context]):
 				continue
 
 			# Check page_filter if present
-			domain_is_allowed = self.registry._match_domains(action.domains, page.url)
+			domain_is_allowed = action.match_domains(page.url)
 			page_is_allowed = self.registry._match_page_filter(action.page_filter, page)
 
 			# Include action if both filters match (or if either is not present)
 			if domain_is_allowed and page_is_allowed:
 				available_actions[name] = action
 
+		# Reuse the model created the last time the same actions were available, so that the agent's output
+		# model and its JSON schema stay the same (and stay cached) from step to step
+		cache_key = tuple(available_actions)
+		cached = self._action_models.get(cache_key)
+		if cached is not None and all(a is b for a, b in zip(cached[0], available_actions.values())):
+			return cached[1]
+
+		action_model = self._create_action_model(available_actions)
+		self._action_models[cache_key] = (tuple(available_actions.values()), action_model)
+		return action_model
+
+	def _create_action_model(self, available_actions: dict[str, RegisteredAction]) -> type[ActionModel]:
+		"""Creates the Union of individual action models for the given actions"""
+		from typing import Union
+
 		# Create individual action models for each action
 		individual_action_models: list[type[BaseModel]] = []
 
@@ -1,12 +1,13 @@
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from browser_use.browser import BrowserSession
 from browser_use.browser.types import Page
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.llm.base import BaseChatModel
+from browser_use.utils import DomainMatcher
 
 if TYPE_CHECKING:
 	pass
@@ -26,6 +27,16 @@ class RegisteredAction(BaseModel):
 
 	model_config = ConfigDict(arbitrary_types_allowed=True)
 
+	_domain_matcher: tuple[list[str], DomainMatcher] | None = PrivateAttr(default=None)  # see match_domains()
+
+	def match_domains(self, url: str) -> bool:
+		"""Check if the action is available on the URL, the domains are only compiled again when a new list is assigned"""
+		if self.domains is None or not url:
+			return True
+		if self._domain_matcher is None or self._domain_matcher[0] is not self.domains:
+			self._domain_matcher = (self.domains, DomainMatcher(self.domains))
+		return self._domain_matcher[1].matches(url)
+
 	def prompt_description(self) -> str:
 		"""Get a description of the action for the prompt"""
 		skip_keys = ['title']
@@ -78,30 +89,6 @@ class ActionRegistry(BaseModel):
 
 	actions: dict[str, RegisteredAction] = {}
 
-	@staticmethod
-	def _match_domains(domains: list[str] | None, url: str) -> bool:
-		"""
-		Match a list of domain glob patterns against a URL.
-
-		Args:
-			domains: A list of domain patterns that can include glob patterns (* wildcard)
-			url: The URL to match against
-
-		Returns:
-			True if the URL's domain matches the pattern, False otherwise
-		"""
-
-		if domains is None or not url:
-			return True
-
-		# Use the centralized URL matching logic from utils
-		from browser_use.utils import match_url_with_domain_pattern
-
-		for domain_pattern in domains:
-			if match_url_with_domain_pattern(url, domain_pattern):
-				return True
-		return False
-
 	@staticmethod
 	def _match_page_filter(page_filter: Callable[[Page], bool] | None, page: Page) -> bool:
 		"""Match a page filter against a page"""
@@ -135,7 +122,7 @@ class ActionRegistry(BaseModel):
 				# skip actions with no filters, they are already included in the system prompt
 				continue
 
-			domain_is_allowed = self._match_domains(action.domains, page.url)
+			domain_is_allowed = action.match_domains(page.url)
 			page_is_allowed = self._match_page_filter(action.page_filter, page)
 
 			if domain_is_allowed and page_is_allowed:
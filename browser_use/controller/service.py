@@ -3,7 +3,6 @@ import enum
 import json
 import logging
 import os
-import re
 from typing import Generic, TypeVar, cast
 
 try:
@@ -17,6 +16,7 @@ from browser_use.agent.views import ActionModel, ActionResult
 from browser_use.browser import BrowserSession
 from browser_use.browser.types import Page
 from browser_use.browser.views import BrowserError
+from browser_use.controller.extraction import CHUNK_SIZE, get_page_markdown, split_into_chunks
 from browser_use.controller.registry.service import Registry
 from browser_use.controller.views import (
 	ClickElementAction,
@@ -52,9 +52,13 @@ class Controller(Generic[Context]):
 		exclude_actions: list[str] = [],
 		output_model: type[T] | None = None,
 		display_files_in_done_text: bool = True,
+		max_extraction_chunks: int = 1,
 	):
 		self.registry = Registry[Context](exclude_actions)
 		self.display_files_in_done_text = display_files_in_done_text
+		# long pages are split into up to this many chunks for extract_structured_data (one LLM call each, plus one to merge them),
+		# the default of 1 keeps a single call that only sees the start and end of the page
+		self.max_extraction_chunks = max_extraction_chunks
 
 		"""Register all default browser actions"""
 
@@ -327,70 +331,8 @@ Only use this for specific queries for information retrieval from the page. Don'
 			page_extraction_llm: BaseChatModel,
 			file_system: FileSystem,
 		):
-			from functools import partial
-
-			import markdownify
-
-			strip = []
-
-			if not extract_links:
-				strip = ['a', 'img']
-
-			# Run markdownify in a thread pool to avoid blocking the event loop
-			loop = asyncio.get_event_loop()
-
-			# Aggressive timeout for page content
-			try:
-				page_html_result = await asyncio.wait_for(page.content(), timeout=10.0)  # 5 second aggressive timeout
-			except TimeoutError:
-				raise RuntimeError('Page content extraction timed out after 5 seconds')
-			except Exception as e:
-				raise RuntimeError(f"Couldn't extract page content: {e}")
-
-			page_html = page_html_result
-
-			markdownify_func = partial(markdownify.markdownify, strip=strip)
-
-			try:
-				content = await asyncio.wait_for(
-					loop.run_in_executor(None, markdownify_func, page_html), timeout=5.0
-				)  # 5 second aggressive timeout
-			except Exception as e:
-				logger.warning(f'Markdownify failed: {type(e).__name__}')
-				raise RuntimeError(f'Could not convert html to markdown: {type(e).__name__}')
-
-			# manually append iframe text into the content so it's readable by the LLM (includes cross-origin iframes)
-			for iframe in page.frames:
-				try:
-					await iframe.wait_for_load_state(timeout=1000)  # 1 second aggressive timeout for iframe load
-				except Exception:
-					pass
-
-				if iframe.url != page.url and not iframe.url.startswith('data:') and not iframe.url.startswith('about:'):
-					content += f'\n\nIFRAME {iframe.url}:\n'
-					# Run markdownify in a thread pool for iframe content as well
-					try:
-						# Aggressive timeouts for iframe content
-						iframe_html = await asyncio.wait_for(iframe.content(), timeout=2.0)  # 2 second aggressive timeout
-						iframe_markdown = await asyncio.wait_for(
-							loop.run_in_executor(None, markdownify_func, iframe_html),
-							timeout=2.0,  # 2 second aggressive timeout for iframe markdownify
-						)
-					except Exception:
-						iframe_markdown = ''  # Skip failed iframes
-					content += iframe_markdown
-			# replace multiple sequential \n with a single \n
-			content = re.sub(r'\n+', '\n', content)
-
-			# limit to 30000 characters - remove text in the middle (≈15000 tokens)
-			max_chars = 30000
-			if len(content) > max_chars:
-				logger.info(f'Content is too long, removing middle {len(content) - max_chars} characters')
-				content = (
-					content[: max_chars // 2]
-					+ '\n... left out the middle because it was too long ...\n'
-					+ content[-max_chars // 2 :]
-				)
+			content = await get_page_markdown(page, extract_links)
+			chunks = split_into_chunks(content, CHUNK_SIZE, self.max_extraction_chunks)
 
 			prompt = """You convert websites into structured information. Extract information from this webpage based on the query. Focus only on content relevant to the query. If 
 1. The query is vague
@@ -398,15 +340,35 @@ Only use this for specific queries for information retrieval from the page. Don'
 3. Some/all of the information is not available
 
 Explain the content of the page and that the requested information is not available in the page. Respond in JSON format.\nQuery: {query}\n Website:\n{page}"""
-			try:
-				formatted_prompt = prompt.format(query=query, page=content)
+			chunk_prompt = """You convert websites into structured information. The webpage is too long to process at once, this is part {part} of {parts}. Extract information from this part of the webpage based on the query. Focus only on content relevant to the query. If the information is not available in this part, say so briefly. Respond in JSON format.\nQuery: {query}\n Website part {part}/{parts}:\n{page}"""
+			merge_prompt = """You merge information extracted from the parts of a long webpage into one answer. Combine the results below into a single response to the query: keep all the relevant items, remove duplicates, and ignore parts that did not contain the requested information. If none of the parts contained it, explain the content of the page and that the requested information is not available in the page. Respond in JSON format.\nQuery: {query}\n{results}"""
+
+			async def ask(formatted_prompt: str) -> str:
 				# Aggressive timeout for LLM call
 				response = await asyncio.wait_for(
 					page_extraction_llm.ainvoke([UserMessage(content=formatted_prompt)]),
 					timeout=120.0,  # 120 second aggressive timeout for LLM call
 				)
+				return response.completion
+
+			try:
+				if len(chunks) == 1:
+					completion = await ask(prompt.format(query=query, page=chunks[0]))
+				else:
+					# map: query all parts of the page concurrently, reduce: merge their answers
+					logger.info(f'Content is too long, extracting from {len(chunks)} parts of {len(content)} characters')
+					partial_results = await asyncio.gather(
+						*(
+							ask(chunk_prompt.format(query=query, part=i, parts=len(chunks), page=chunk))
+							for i, chunk in enumerate(chunks, start=1)
+						)
+					)
+					results = '\n'.join(
+						f'<part_{i}_result>\n{result}\n</part_{i}_result>' for i, result in enumerate(partial_results, start=1)
+					)
+					completion = await ask(merge_prompt.format(query=query, results=results))
 
-				extracted_content = f'Page Link: {page.url}\nQuery: {query}\nExtracted Content:\n{response.completion}'
+				extracted_content = f'Page Link: {page.url}\nQuery: {query}\nExtracted Content:\n{completion}'
 
 				# if content is small include it to memory
 				MAX_MEMORY_SIZE = 600
@@ -4,11 +4,29 @@
     focusHighlightIndex: -1,
     viewportExpansion: 0,
     debugMode: false,
+    incremental: false,
+    baseSnapshotId: null,
+    maxDeltaSnapshots: 20,
+    packed: false,
   }
 ) => {
-  const { doHighlightElements, focusHighlightIndex, viewportExpansion, debugMode } = args;
+  const {
+    doHighlightElements,
+    focusHighlightIndex,
+    viewportExpansion,
+    debugMode,
+    incremental = false,
+    baseSnapshotId = null,
+    maxDeltaSnapshots = 20,
+    packed = false,
+  } = args;
   let highlightIndex = 0; // Reset highlight index
 
+  // Incremental mode keeps its bookkeeping on the window between calls (see buildIncrementalSnapshot)
+  const INCREMENTAL_STATE_KEY = "__browserUseDomTreeState";
+  let TRACKING_STATE = null; // set while walking in incremental mode, nodes get registered into it
+  let REUSABLE_HIGHLIGHT_INDICES = null; // element -> highlight index it had before its subtree was re-walked
+
   // Add caching mechanisms at the top level
   const DOM_CACHE = {
     boundingRects: new WeakMap(),
@@ -1099,6 +1117,19 @@
   }
   // --- End distinct interaction check ---
 
+  /**
+   * Returns the highlight index for a newly highlighted element.
+   * When a subtree is re-walked in incremental mode, elements keep the index they had before.
+   *
+   * @param {HTMLElement} node - The element being highlighted.
+   * @returns {number} The highlight index to use.
+   */
+  function nextHighlightIndex(node) {
+    const previousIndex = REUSABLE_HIGHLIGHT_INDICES?.get(node);
+    if (previousIndex !== undefined) return previousIndex;
+    return highlightIndex++;
+  }
+
   /**
    * Handles the logic for deciding whether to highlight an element and performing the highlight.
    * @param {
@@ -1143,7 +1174,7 @@
       // When viewportExpansion is -1, all interactive elements should get a highlight index
       // regardless of viewport status
       if (nodeData.isInViewport || viewportExpansion === -1) {
-        nodeData.highlightIndex = highlightIndex++;
+        nodeData.highlightIndex = nextHighlightIndex(node);
 
         if (doHighlightElements) {
           if (focusHighlightIndex >= 0) {
@@ -1199,6 +1230,7 @@
 
       const id = `${ID.current++}`;
       DOM_HASH_MAP[id] = nodeData;
+      registerNode(id, node, nodeData, parentIframe, false);
       return id;
     }
 
@@ -1226,6 +1258,7 @@
         text: textContent,
         isVisible: isTextNodeVisible(node),
       };
+      registerNode(id, node, DOM_HASH_MAP[id], parentIframe, isParentHighlighted);
       return id;
     }
 
@@ -1314,6 +1347,7 @@
         try {
           const iframeDoc = node.contentDocument || node.contentWindow?.document;
           if (iframeDoc) {
+            observeRoot(iframeDoc);
             for (const child of iframeDoc.childNodes) {
               const domElement = buildDomTree(child, node, false);
               if (domElement) nodeData.children.push(domElement);
@@ -1341,6 +1375,7 @@
         // Handle shadow DOM
         if (node.shadowRoot) {
           nodeData.shadowRoot = true;
+          observeRoot(node.shadowRoot);
           for (const child of node.shadowRoot.childNodes) {
             const domElement = buildDomTree(child, parentIframe, nodeWasHighlighted);
             if (domElement) nodeData.children.push(domElement);
@@ -1369,13 +1404,509 @@
 
     const id = `${ID.current++}`;
     DOM_HASH_MAP[id] = nodeData;
+    registerNode(id, node, nodeData, parentIframe, isParentHighlighted);
     return id;
   }
 
+  // --- Incremental snapshots ---
+
+  /**
+   * Records a node emitted by buildDomTree so that later incremental snapshots can
+   * re-walk only the subtrees that changed.
+   *
+   * @param {string} id - The ID assigned to the node.
+   * @param {Node} node - The DOM node.
+   * @param {Object} nodeData - The node data object returned to Python.
+   * @param {HTMLElement | null} parentIframe - The parent iframe node.
+   * @param {boolean} isParentHighlighted - Whether the parent node is highlighted.
+   */
+  function registerNode(id, node, nodeData, parentIframe, isParentHighlighted) {
+    if (!TRACKING_STATE) return;
+
+    TRACKING_STATE.idByNode.set(node, id);
+    TRACKING_STATE.meta.set(id, {
+      node,
+      parentId: null, // filled in by linkParentIds() once the parent has been emitted
+      parentIframe,
+      isParentHighlighted,
+      children: nodeData.type === "TEXT_NODE" ? null : nodeData.children,
+      highlightIndex: nodeData.highlightIndex,
+      // the box the element had when it was walked (if the walk measured it), see hasLayoutChanged()
+      rect: nodeData.type === "TEXT_NODE" ? null : DOM_CACHE.boundingRects.get(node) || null,
+    });
+  }
+
+  /**
+   * Whether the page layout changed since the last snapshot in a way that can move or resize elements outside
+   * the re-walked subtrees: a re-walked subtree changed its size or position, or the document changed size.
+   *
+   * @param {Object} state - The incremental state.
+   * @param {string[]} subtreeRootIds - The IDs of the subtrees about to be re-walked.
+   * @returns {boolean} Whether a full walk is needed.
+   */
+  function hasLayoutChanged(state, subtreeRootIds) {
+    if (getDocumentSize() !== state.documentSize) return true;
+
+    return subtreeRootIds.some((id) => {
+      const { node, rect } = state.meta.get(id);
+      if (!rect || !node.isConnected) return false; // removals and unmeasured elements are caught by the document size
+      const current = node.getBoundingClientRect();
+      return (
+        current.top !== rect.top ||
+        current.left !== rect.left ||
+        current.width !== rect.width ||
+        current.height !== rect.height
+      );
+    });
+  }
+
+  /**
+   * @returns {string} The scrollable size of the document.
+   */
+  function getDocumentSize() {
+    const root = document.documentElement;
+    return `${root.scrollWidth}x${root.scrollHeight}`;
+  }
+
+  /**
+   * Starts observing mutations inside a root node (no-op outside incremental mode).
+   *
+   * @param {Node} root - The document body, iframe document or shadow root to observe.
+   */
+  function observeRoot(root) {
+    if (!TRACKING_STATE) return;
+    try {
+      TRACKING_STATE.observer.observe(root, { childList: true, subtree: true, attributes: true, characterData: true });
+    } catch (e) {
+      // roots we cannot observe just mean we fall back to full rebuilds more often
+      TRACKING_STATE.needsFullRebuild = true;
+    }
+  }
+
+  /**
+   * Whether a mutation was caused by our own highlight overlays (these must not dirty the tree).
+   *
+   * @param {MutationRecord} mutation - The mutation record.
+   * @returns {boolean} Whether the mutation can be ignored.
+   */
+  function isHighlightMutation(mutation) {
+    if (mutation.type === "attributes" && mutation.attributeName === "browser-user-highlight-id") {
+      return true;
+    }
+
+    const target = mutation.target;
+    const targetElement = target.nodeType === Node.ELEMENT_NODE ? target : target.parentElement;
+    if (targetElement?.closest?.(`#${HIGHLIGHT_CONTAINER_ID}`)) {
+      return true;
+    }
+
+    if (mutation.type === "childList") {
+      const changedNodes = [...mutation.addedNodes, ...mutation.removedNodes];
+      return changedNodes.length > 0 && changedNodes.every((changed) => changed.id === HIGHLIGHT_CONTAINER_ID);
+    }
+    return false;
+  }
+
+  /**
+   * Whether a mutation adds, removes or changes a <style> or <link> (stylesheet) element.
+   *
+   * @param {MutationRecord} mutation - The mutation record.
+   * @returns {boolean} Whether the mutation can change the styles of the page.
+   */
+  function isStylesheetMutation(mutation) {
+    return [mutation.target, ...mutation.addedNodes, ...mutation.removedNodes].some((node) => {
+      const element = node.nodeType === Node.ELEMENT_NODE ? node : node.parentElement;
+      return element?.tagName === "STYLE" || element?.tagName === "LINK";
+    });
+  }
+
+  /**
+   * Gets (or lazily creates) the incremental state kept on the window between calls.
+   *
+   * @returns {Object} The incremental state.
+   */
+  function getIncrementalState() {
+    let state = window[INCREMENTAL_STATE_KEY];
+    if (state) return state;
+
+    state = {
+      snapshotId: null,
+      rootId: null,
+      argsKey: null,
+      nextId: 0,
+      nextHighlightIndex: 0,
+      deltasSinceFullRebuild: 0,
+      needsFullRebuild: true,
+      documentSize: null,
+      dirtyNodes: new Set(),
+      idByNode: new WeakMap(), // DOM node -> id
+      meta: new Map(), // id -> { node, parentId, parentIframe, isParentHighlighted, children, highlightIndex }
+      observer: null,
+    };
+    state.recordMutations = (mutations) => {
+      for (const mutation of mutations) {
+        if (isHighlightMutation(mutation)) continue;
+        if (document.head?.contains(mutation.target)) {
+          // stylesheets added, removed or changed in <head> can restyle any element, scripts, title and meta can't
+          if (isStylesheetMutation(mutation)) state.needsFullRebuild = true;
+          continue;
+        }
+        state.dirtyNodes.add(mutation.target);
+      }
+    };
+    state.observer = new MutationObserver(state.recordMutations);
+
+    // Visibility, viewport filtering and highlight indices all depend on the scroll position and viewport size,
+    // none of which produce DOM mutations, so any scroll or resize forces the next snapshot to be a full walk
+    const invalidate = () => {
+      state.needsFullRebuild = true;
+    };
+    window.addEventListener("scroll", invalidate, { capture: true, passive: true });
+    window.addEventListener("resize", invalidate, { passive: true });
+
+    window[INCREMENTAL_STATE_KEY] = state;
+    return state;
+  }
+
+  /**
+   * Fills in parentId for every node emitted during the current walk.
+   *
+   * @param {Object} state - The incremental state.
+   */
+  function linkParentIds(state) {
+    for (const [id, nodeData] of Object.entries(DOM_HASH_MAP)) {
+      for (const childId of nodeData.children || []) {
+        const childMeta = state.meta.get(childId);
+        if (childMeta) childMeta.parentId = id;
+      }
+    }
+  }
+
+  /**
+   * Finds the closest tracked element (the node itself or an ancestor, across shadow roots and iframes).
+   *
+   * @param {Object} state - The incremental state.
+   * @param {Node} node - The node to start from.
+   * @returns {string | null} The tracked element ID, or null if there is none.
+   */
+  function findTrackedElementId(state, node) {
+    let current = node;
+    while (current) {
+      const id = state.idByNode.get(current);
+      if (id !== undefined && state.meta.get(id)?.children) return id;
+
+      if (current.nodeType === Node.DOCUMENT_NODE) {
+        current = current.defaultView?.frameElement || null;
+      } else {
+        current = current.parentNode || current.host || null;
+      }
+    }
+    return null;
+  }
+
+  /**
+   * Collects the IDs of a tracked node and all its tracked descendants.
+   *
+   * @param {Object} state - The incremental state.
+   * @param {string} id - The ID of the subtree root.
+   * @returns {string[]} The IDs in the subtree.
+   */
+  function collectSubtreeIds(state, id) {
+    const ids = [];
+    const stack = [id];
+    while (stack.length > 0) {
+      const currentId = stack.pop();
+      ids.push(currentId);
+      const children = state.meta.get(currentId)?.children;
+      if (children) stack.push(...children);
+    }
+    return ids;
+  }
+
+  /**
+   * Performs a full walk and resets the incremental state to it.
+   *
+   * @param {Object} state - The incremental state.
+   * @param {string} argsKey - Serialized arguments that invalidate the snapshot when changed.
+   * @returns {Object} The full snapshot.
+   */
+  function buildFullSnapshot(state, argsKey) {
+    state.observer.disconnect();
+    state.idByNode = new WeakMap();
+    state.meta = new Map();
+
+    // keep IDs increasing across snapshots so a stale ID can never point at a different node
+    ID.current = state.nextId;
+    TRACKING_STATE = state;
+    observeRoot(document.body);
+    // <head> is only watched for stylesheet changes (see recordMutations), which force the next snapshot to be a full walk
+    if (document.head) observeRoot(document.head);
+    const rootId = buildDomTree(document.body);
+    linkParentIds(state);
+    TRACKING_STATE = null;
+
+    // all mutations recorded so far were made by our own walk (highlights), the page itself cannot run in between
+    state.observer.takeRecords();
+    state.dirtyNodes.clear();
+
+    state.rootId = rootId;
+    state.argsKey = argsKey;
+    state.nextId = ID.current;
+    state.nextHighlightIndex = highlightIndex;
+    state.deltasSinceFullRebuild = 0;
+    state.needsFullRebuild = false;
+    state.documentSize = getDocumentSize();
+    state.snapshotId = `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+
+    return { mode: "full", snapshotId: state.snapshotId, rootId, map: DOM_HASH_MAP };
+  }
+
+  /**
+   * Re-walks only the subtrees touched by mutations since the previous snapshot.
+   *
+   * @param {Object} state - The incremental state.
+   * @returns {Object | null} The delta snapshot, or null if a full walk is needed instead.
+   */
+  function buildDeltaSnapshot(state) {
+    state.recordMutations(state.observer.takeRecords());
+    if (state.needsFullRebuild) return null; // e.g. a stylesheet changed since the previous snapshot
+
+    // Map every mutated node to the closest element we emitted last time
+    const dirtyIds = new Set();
+    for (const dirtyNode of state.dirtyNodes) {
+      if (!dirtyNode.isConnected) continue; // its removal is recorded on a connected ancestor
+      const id = findTrackedElementId(state, dirtyNode);
+      if (id === null || id === state.rootId) return null;
+      dirtyIds.add(id);
+    }
+
+    // Only re-walk the outermost dirty subtrees
+    const subtreeRootIds = [...dirtyIds].filter((id) => {
+      let parentId = state.meta.get(id).parentId;
+      while (parentId !== null) {
+        if (dirtyIds.has(parentId)) return false;
+        parentId = state.meta.get(parentId)?.parentId ?? null;
+      }
+      return true;
+    });
+
+    const staleIdsBySubtree = subtreeRootIds.map((id) => collectSubtreeIds(state, id));
+    const staleCount = staleIdsBySubtree.reduce((count, ids) => count + ids.length, 0);
+    if (staleCount > state.meta.size / 2) return null; // most of the page changed, a full walk is cheaper
+    // the elements outside the re-walked subtrees keep their visibility, viewport and top-element flags,
+    // which are only still right if nothing moved them
+    if (hasLayoutChanged(state, subtreeRootIds)) return null;
+
+    // if anything below throws, the next snapshot starts over with a full walk
+    state.needsFullRebuild = true;
+    ID.current = state.nextId;
+    highlightIndex = state.nextHighlightIndex;
+    REUSABLE_HIGHLIGHT_INDICES = new Map();
+    TRACKING_STATE = state;
+
+    const replaced = {};
+    const removed = [];
+    subtreeRootIds.forEach((subtreeRootId, i) => {
+      const rootMeta = state.meta.get(subtreeRootId);
+      for (const staleId of staleIdsBySubtree[i]) {
+        const staleMeta = state.meta.get(staleId);
+        if (staleMeta.highlightIndex !== undefined) {
+          REUSABLE_HIGHLIGHT_INDICES.set(staleMeta.node, staleMeta.highlightIndex);
+        }
+        state.idByNode.delete(staleMeta.node);
+        state.meta.delete(staleId);
+        removed.push(staleId);
+      }
+
+      const newId = buildDomTree(rootMeta.node, rootMeta.parentIframe, rootMeta.isParentHighlighted);
+      const siblings = state.meta.get(rootMeta.parentId).children;
+      const position = siblings.indexOf(subtreeRootId);
+      if (newId === null) {
+        siblings.splice(position, 1);
+      } else {
+        siblings[position] = newId;
+        state.meta.get(newId).parentId = rootMeta.parentId;
+      }
+      replaced[subtreeRootId] = newId;
+    });
+    linkParentIds(state);
+
+    TRACKING_STATE = null;
+    REUSABLE_HIGHLIGHT_INDICES = null;
+
+    // Highlights are removed before every snapshot, redraw the ones outside the re-walked subtrees
+    if (doHighlightElements) {
+      for (const [id, meta] of state.meta) {
+        if (meta.highlightIndex !== undefined && !(id in DOM_HASH_MAP)) {
+          highlightElement(meta.node, meta.highlightIndex, meta.parentIframe);
+        }
+      }
+    }
+
+    state.observer.takeRecords();
+    state.dirtyNodes.clear();
+
+    state.nextId = ID.current;
+    state.nextHighlightIndex = highlightIndex;
+    state.deltasSinceFullRebuild++;
+    state.needsFullRebuild = false;
+    state.documentSize = getDocumentSize();
+    state.snapshotId = `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+
+    return {
+      mode: "delta",
+      snapshotId: state.snapshotId,
+      baseSnapshotId,
+      rootId: state.rootId,
+      map: DOM_HASH_MAP,
+      replaced,
+      removed,
+    };
+  }
+
+  /**
+   * Incremental mode: keeps a MutationObserver resident in the page and, when possible, only
+   * re-walks the subtrees that changed since the snapshot identified by baseSnapshotId.
+   *
+   * Returns either { mode: "full", snapshotId, rootId, map } or
+   * { mode: "delta", snapshotId, baseSnapshotId, rootId, map, replaced, removed } where map only
+   * contains the new nodes, replaced maps each re-walked subtree root ID to its new ID (or null if it
+   * is gone) and removed lists every ID that is no longer part of the tree.
+   *
+   * @returns {Object} The snapshot.
+   */
+  function buildIncrementalSnapshot() {
+    const state = getIncrementalState();
+    const argsKey = JSON.stringify([doHighlightElements, viewportExpansion, window.innerWidth, window.innerHeight]);
+
+    const canApplyDelta =
+      !state.needsFullRebuild &&
+      state.snapshotId !== null &&
+      state.snapshotId === baseSnapshotId &&
+      state.argsKey === argsKey &&
+      focusHighlightIndex < 0 &&
+      state.deltasSinceFullRebuild < maxDeltaSnapshots &&
+      state.meta.get(state.rootId)?.node === document.body;
+
+    const snapshot = (canApplyDelta && buildDeltaSnapshot(state)) || buildFullSnapshot(state, argsKey);
+
+    DOM_CACHE.clearCache();
+    return snapshot;
+  }
+
+  // --- Packed transfer format ---
+
+  // Bits of the packed `flags` column
+  const PACKED_FLAGS = {
+    TEXT_NODE: 1 << 0,
+    IS_VISIBLE: 1 << 1,
+    IS_TOP_ELEMENT: 1 << 2,
+    IS_INTERACTIVE: 1 << 3,
+    IS_IN_VIEWPORT: 1 << 4,
+    SHADOW_ROOT: 1 << 5,
+  };
+
+  /**
+   * Packs a node map into parallel arrays over an interned string table, which is much smaller to
+   * serialize and cheaper to decode than one object per node.
+   *
+   * Node i has id `idOffset + i`, and nodes are in the same children-before-parent order as the map.
+   * - flags: PACKED_FLAGS bitfield
+   * - values: string index of the tag name (elements) or the text (text nodes)
+   * - xpaths: string index of the xpath, -1 for text nodes
+   * - parents: position of the parent node, -1 if the parent is not part of this batch
+   * - highlights: highlight index, -1 if not highlighted
+   * - attributes: flat [position, count, name, value, name, value, ..., position, count, ...] with string indices
+   *
+   * @param {Object<string, any>} nodeMap - The node map to pack.
+   * @returns {Object | null} The packed nodes, or null if the ids are not contiguous.
+   */
+  function packNodeMap(nodeMap) {
+    const ids = Object.keys(nodeMap); // integer-like keys iterate in ascending order
+    const idOffset = ids.length > 0 ? Number(ids[0]) : 0;
+    if (ids.some((id, position) => Number(id) !== idOffset + position)) return null;
+
+    const strings = [];
+    const stringIndices = new Map();
+    const intern = (value) => {
+      let index = stringIndices.get(value);
+      if (index === undefined) {
+        index = strings.length;
+        strings.push(value);
+        stringIndices.set(value, index);
+      }
+      return index;
+    };
+
+    const count = ids.length;
+    const flags = new Array(count);
+    const values = new Array(count);
+    const xpaths = new Array(count);
+    const parents = new Array(count).fill(-1);
+    const highlights = new Array(count);
+    const attributes = [];
+
+    ids.forEach((id, position) => {
+      const nodeData = nodeMap[id];
+
+      if (nodeData.type === "TEXT_NODE") {
+        flags[position] = PACKED_FLAGS.TEXT_NODE | (nodeData.isVisible ? PACKED_FLAGS.IS_VISIBLE : 0);
+        values[position] = intern(nodeData.text);
+        xpaths[position] = -1;
+        highlights[position] = -1;
+        return;
+      }
+
+      flags[position] =
+        (nodeData.isVisible ? PACKED_FLAGS.IS_VISIBLE : 0) |
+        (nodeData.isTopElement ? PACKED_FLAGS.IS_TOP_ELEMENT : 0) |
+        (nodeData.isInteractive ? PACKED_FLAGS.IS_INTERACTIVE : 0) |
+        (nodeData.isInViewport ? PACKED_FLAGS.IS_IN_VIEWPORT : 0) |
+        (nodeData.shadowRoot ? PACKED_FLAGS.SHADOW_ROOT : 0);
+      values[position] = intern(nodeData.tagName);
+      xpaths[position] = intern(nodeData.xpath);
+      highlights[position] = nodeData.highlightIndex ?? -1;
+
+      const attributeNames = Object.keys(nodeData.attributes || {});
+      if (attributeNames.length > 0) {
+        attributes.push(position, attributeNames.length);
+        for (const name of attributeNames) {
+          attributes.push(intern(name), intern(nodeData.attributes[name]));
+        }
+      }
+
+      for (const childId of nodeData.children) {
+        parents[Number(childId) - idOffset] = position;
+      }
+    });
+
+    return { idOffset, strings, flags, values, xpaths, parents, highlights, attributes };
+  }
+
+  /**
+   * Replaces the `map` of a result with its packed form when packed transfer was requested.
+   *
+   * @param {Object} result - A result containing a node `map`.
+   * @returns {Object} The result to return to Python.
+   */
+  function finalizeResult(result) {
+    if (!packed) return result;
+
+    const packedNodes = packNodeMap(result.map);
+    if (!packedNodes) return result;
+
+    const { map, ...rest } = result;
+    return { ...rest, packed: packedNodes };
+  }
+
+  if (incremental) {
+    return finalizeResult(buildIncrementalSnapshot());
+  }
+
   const rootId = buildDomTree(document.body);
 
   // Clear the cache before starting
   DOM_CACHE.clearCache();
 
-  return { rootId, map: DOM_HASH_MAP };
+  return finalizeResult({ rootId, map: DOM_HASH_MAP });
 };
@@ -1,8 +1,12 @@
 import hashlib
+from collections import defaultdict
 
 from browser_use.dom.history_tree_processor.view import DOMHistoryElement, HashedDomElement
 from browser_use.dom.views import DOMElementNode
 
+HASH_DIGEST_SIZE = 16  # bytes, 128 bit
+EMPTY_BRANCH_PATH_HASH = hashlib.blake2b(b'', digest_size=HASH_DIGEST_SIZE).hexdigest()
+
 
 class HistoryTreeProcessor:
 	""" "
@@ -31,22 +35,14 @@ class HistoryTreeProcessor:
 		)
 
 	@staticmethod
-	def find_history_element_in_tree(dom_history_element: DOMHistoryElement, tree: DOMElementNode) -> DOMElementNode | None:
-		hashed_dom_history_element = HistoryTreeProcessor._hash_dom_history_element(dom_history_element)
+	def find_history_element_in_tree(
+		dom_history_element: DOMHistoryElement, tree: DOMElementNode, fuzzy: bool = False
+	) -> DOMElementNode | None:
+		"""Find the highlighted element of the tree matching the history element, see HistoryTreeIndex.find().
 
-		def process_node(node: DOMElementNode):
-			if node.highlight_index is not None:
-				hashed_node = HistoryTreeProcessor._hash_dom_element(node)
-				if hashed_node == hashed_dom_history_element:
-					return node
-			for child in node.children:
-				if isinstance(child, DOMElementNode):
-					result = process_node(child)
-					if result is not None:
-						return result
-			return None
-
-		return process_node(tree)
+		To look up several elements in the same tree, build a HistoryTreeIndex once and use it directly.
+		"""
+		return HistoryTreeIndex(tree).find(dom_history_element, fuzzy=fuzzy)
 
 	@staticmethod
 	def compare_history_element_and_dom_element(dom_history_element: DOMHistoryElement, dom_element: DOMElementNode) -> bool:
@@ -63,6 +59,34 @@ class HistoryTreeProcessor:
 
 		return HashedDomElement(branch_path_hash, attributes_hash, xpath_hash)
 
+	@staticmethod
+	def hash_tree(root: DOMElementNode) -> dict[DOMElementNode, HashedDomElement]:
+		"""Hash every element of the tree under root (root included) in a single top-down pass.
+
+		Branch path hashes are built from the hash of the parent's branch path (prefix hashing), instead of
+		walking up to the root for every element. The hashes are cached on the nodes, so `element.hash` is free afterwards.
+		"""
+		hashes: dict[DOMElementNode, HashedDomElement] = {}
+		root_branch_path_hash = HistoryTreeProcessor._parent_branch_path_hash(HistoryTreeProcessor._get_parent_branch_path(root))
+
+		stack: list[tuple[DOMElementNode, str]] = [(root, root_branch_path_hash)]
+		while stack:
+			node, branch_path_hash = stack.pop()
+			hashed_node = HashedDomElement(
+				branch_path_hash,
+				HistoryTreeProcessor._attributes_hash(node.attributes),
+				HistoryTreeProcessor._xpath_hash(node.xpath),
+			)
+			node._hash = hashed_node
+			hashes[node] = hashed_node
+
+			# reversed, so the hashes come out in document order
+			for child in reversed(node.children):
+				if isinstance(child, DOMElementNode):
+					stack.append((child, HistoryTreeProcessor._extend_branch_path_hash(branch_path_hash, child.tag_name)))
+
+		return hashes
+
 	@staticmethod
 	def _hash_dom_element(dom_element: DOMElementNode) -> HashedDomElement:
 		parent_branch_path = HistoryTreeProcessor._get_parent_branch_path(dom_element)
@@ -87,20 +111,83 @@ class HistoryTreeProcessor:
 
 	@staticmethod
 	def _parent_branch_path_hash(parent_branch_path: list[str]) -> str:
-		parent_branch_path_string = '/'.join(parent_branch_path)
-		return hashlib.sha256(parent_branch_path_string.encode()).hexdigest()
+		branch_path_hash = EMPTY_BRANCH_PATH_HASH
+		for tag_name in parent_branch_path:
+			branch_path_hash = HistoryTreeProcessor._extend_branch_path_hash(branch_path_hash, tag_name)
+		return branch_path_hash
+
+	@staticmethod
+	def _extend_branch_path_hash(parent_branch_path_hash: str, tag_name: str) -> str:
+		# the parent hash has a fixed length, so hashing it together with the tag name is unambiguous
+		return HistoryTreeProcessor._hash_string(f'{parent_branch_path_hash}/{tag_name}')
 
 	@staticmethod
 	def _attributes_hash(attributes: dict[str, str]) -> str:
 		attributes_string = ''.join(f'{key}={value}' for key, value in attributes.items())
-		return hashlib.sha256(attributes_string.encode()).hexdigest()
+		return HistoryTreeProcessor._hash_string(attributes_string)
 
 	@staticmethod
 	def _xpath_hash(xpath: str) -> str:
-		return hashlib.sha256(xpath.encode()).hexdigest()
+		return HistoryTreeProcessor._hash_string(xpath)
 
 	@staticmethod
 	def _text_hash(dom_element: DOMElementNode) -> str:
 		""" """
 		text_string = dom_element.get_all_text_till_next_clickable_element()
-		return hashlib.sha256(text_string.encode()).hexdigest()
+		return HistoryTreeProcessor._hash_string(text_string)
+
+	@staticmethod
+	def _hash_string(string: str) -> str:
+		# these hashes only identify elements, they don't need to be cryptographic, just fast and collision-free in practice
+		return hashlib.blake2b(string.encode(), digest_size=HASH_DIGEST_SIZE).hexdigest()
+
+
+class HistoryTreeIndex:
+	"""
+	The highlighted elements of one DOM tree, indexed by their hash, by their attributes hash and by their xpath hash
+	(the components find() can fall back to, the branch path is only used to break ties between their candidates).
+
+	Build it once per DOM snapshot, then resolve any number of history elements against it
+	without walking or re-hashing the tree.
+	"""
+
+	def __init__(self, tree: DOMElementNode):
+		self.by_hash: dict[HashedDomElement, DOMElementNode] = {}
+		self.by_attributes_hash: defaultdict[str, list[DOMElementNode]] = defaultdict(list)
+		self.by_xpath_hash: defaultdict[str, list[DOMElementNode]] = defaultdict(list)
+
+		# hash_tree() returns the elements in document order, so the first match wins like it did with a DFS
+		for node, hashed_node in HistoryTreeProcessor.hash_tree(tree).items():
+			if node.highlight_index is None:
+				continue
+			self.by_hash.setdefault(hashed_node, node)
+			self.by_attributes_hash[hashed_node.attributes_hash].append(node)
+			self.by_xpath_hash[hashed_node.xpath_hash].append(node)
+
+	def find(self, dom_history_element: DOMHistoryElement, fuzzy: bool = False) -> DOMElementNode | None:
+		"""Find the highlighted element matching the history element.
+
+		Only exact matches (same branch path, attributes and xpath) are returned unless fuzzy is set, then an element
+		with the same attributes, or else the same xpath, is accepted as long as that match is unambiguous.
+		Ties are broken by preferring the candidate on the same branch path.
+		"""
+		hashed_dom_history_element = HistoryTreeProcessor._hash_dom_history_element(dom_history_element)
+
+		node = self.by_hash.get(hashed_dom_history_element)
+		if node is not None or not fuzzy:
+			return node
+
+		for candidates in (
+			self.by_attributes_hash.get(hashed_dom_history_element.attributes_hash, []),
+			self.by_xpath_hash.get(hashed_dom_history_element.xpath_hash, []),
+		):
+			if len(candidates) > 1:
+				candidates = [
+					candidate
+					for candidate in candidates
+					if candidate.hash.branch_path_hash == hashed_dom_history_element.branch_path_hash
+				]
+			if len(candidates) == 1:
+				return candidates[0]
+
+		return None
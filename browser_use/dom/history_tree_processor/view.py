@@ -3,10 +3,10 @@ from dataclasses import dataclass
 from pydantic import BaseModel
 
 
-@dataclass
+@dataclass(frozen=True)
 class HashedDomElement:
 	"""
-	Hash of the dom element to be used as a unique identifier
+	Hash of the dom element to be used as a unique identifier (frozen, so it can be used as a dict key)
 	"""
 
 	branch_path_hash: str
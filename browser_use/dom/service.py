@@ -1,4 +1,6 @@
+import copy
 import logging
+from dataclasses import dataclass
 from importlib import resources
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
@@ -15,7 +17,15 @@ from browser_use.dom.views import (
 	SelectorMap,
 	ViewportInfo,
 )
-from browser_use.utils import is_new_tab_page, time_execution_async
+from browser_use.utils import is_new_tab_page, time_execution_async, time_execution_sync
+
+# bits of the `flags` column in buildDomTree's packed transfer format (see packNodeMap in index.js)
+PACKED_TEXT_NODE = 1 << 0
+PACKED_IS_VISIBLE = 1 << 1
+PACKED_IS_TOP_ELEMENT = 1 << 2
+PACKED_IS_INTERACTIVE = 1 << 3
+PACKED_IS_IN_VIEWPORT = 1 << 4
+PACKED_SHADOW_ROOT = 1 << 5
 
 # @dataclass
 # class ViewportInfo:
@@ -23,6 +33,18 @@ from browser_use.utils import is_new_tab_page, time_execution_async
 # 	height: int
 
 
+@dataclass
+class DOMSnapshot:
+	"""The last tree built in incremental mode, kept so the next delta from buildDomTree can be patched into it"""
+
+	snapshot_id: str
+	element_tree: DOMElementNode
+	selector_map: SelectorMap
+	node_map: dict[str, DOMBaseNode]  # buildDomTree node id -> parsed node
+	node_ids: dict[DOMBaseNode, str]  # parsed node -> buildDomTree node id, to keep node_map up to date when copying nodes
+	parent_ids: dict[str, str]  # buildDomTree node id -> id of its parent in this tree (the .parent of shared nodes may be older)
+
+
 class DomService:
 	logger: logging.Logger
 
@@ -30,6 +52,7 @@ class DomService:
 		self.page = page
 		self.xpath_cache = {}
 		self.logger = logger or logging.getLogger(__name__)
+		self.snapshot: DOMSnapshot | None = None
 
 		self.js_code = resources.files('browser_use.dom.dom_tree').joinpath('index.js').read_text()
 
@@ -40,8 +63,26 @@ class DomService:
 		highlight_elements: bool = True,
 		focus_element: int = -1,
 		viewport_expansion: int = 0,
+		incremental: bool = False,
+		packed: bool = False,
 	) -> DOMState:
-		element_tree, selector_map = await self._build_dom_tree(highlight_elements, focus_element, viewport_expansion)
+		"""
+		Build the DOM tree and selector map of the current page.
+
+		With incremental=True the buildDomTree script keeps a MutationObserver resident in the page and only
+		re-walks the subtrees that changed since the last call on this DomService, so only reuse the same DomService
+		for consecutive snapshots of the same page. The changed subtrees are patched into a copy of the previous tree
+		(copy-on-write): the ancestors of every changed subtree are copied, all the other nodes and subtrees are shared
+		with the previous tree, which is never modified. A shared node keeps the `.parent` of the tree it was first built
+		in, an ancestor with the same data as the one in the new tree but not the same object, so walking up from a
+		shared node reads the right ancestry but `is` comparisons against the new tree's nodes do not hold.
+
+		With packed=True the result is transferred from the page as parallel arrays over a string table
+		instead of one JSON object per node, which is much smaller and faster to decode on large pages.
+		"""
+		element_tree, selector_map = await self._build_dom_tree(
+			highlight_elements, focus_element, viewport_expansion, incremental, packed
+		)
 		return DOMState(element_tree=element_tree, selector_map=selector_map)
 
 	@time_execution_async('--get_cross_origin_iframes')
@@ -68,12 +109,15 @@ class DomService:
 		highlight_elements: bool,
 		focus_element: int,
 		viewport_expansion: int,
+		incremental: bool = False,
+		packed: bool = False,
 	) -> tuple[DOMElementNode, SelectorMap]:
 		if await self.page.evaluate('1+1') != 2:
 			raise ValueError('The page cannot evaluate javascript code properly')
 
 		if is_new_tab_page(self.page.url):
 			# short-circuit if the page is a new empty tab for speed, no need to inject buildDomTree.js
+			self.snapshot = None
 			return (
 				DOMElementNode(
 					tag_name='body',
@@ -95,6 +139,9 @@ class DomService:
 			'focusHighlightIndex': focus_element,
 			'viewportExpansion': viewport_expansion,
 			'debugMode': debug_mode,
+			'incremental': incremental,
+			'baseSnapshotId': self.snapshot.snapshot_id if (incremental and self.snapshot) else None,
+			'packed': packed,
 		}
 
 		try:
@@ -131,7 +178,18 @@ class DomService:
 			)
 
 		self.logger.debug('🔄 Starting Python DOM tree construction...')
-		result = await self._construct_dom_tree(eval_page)
+		if eval_page.get('mode') == 'delta':
+			try:
+				result = self._apply_dom_delta(eval_page)
+			except (KeyError, ValueError) as e:
+				# our tree and the page's incremental state disagree, start over from a full walk
+				self.logger.debug(f'⚠️ Failed to apply incremental DOM delta, rebuilding full tree: {type(e).__name__}: {e}')
+				self.snapshot = None
+				args['baseSnapshotId'] = None
+				eval_page = await self.page.evaluate(self.js_code, args)
+				result = await self._construct_dom_tree(eval_page)
+		else:
+			result = await self._construct_dom_tree(eval_page)
 		self.logger.debug('✅ Python DOM tree construction completed')
 		return result
 
@@ -140,13 +198,147 @@ class DomService:
 		self,
 		eval_page: dict,
 	) -> tuple[DOMElementNode, SelectorMap]:
-		js_node_map = eval_page['map']
 		js_root_id = eval_page['rootId']
 
+		node_map: dict[str, DOMBaseNode] = {}
+		selector_map = self._parse_nodes(eval_page, node_map)
+
+		html_to_dict = node_map[str(js_root_id)]
+
+		if html_to_dict is None or not isinstance(html_to_dict, DOMElementNode):
+			raise ValueError('Failed to parse HTML to dictionary')
+
+		if 'snapshotId' in eval_page:
+			# incremental mode: keep the id -> node mapping around so the next delta can be patched in
+			node_ids = {node: id for id, node in node_map.items()}
+			self.snapshot = DOMSnapshot(
+				snapshot_id=eval_page['snapshotId'],
+				element_tree=html_to_dict,
+				selector_map=selector_map,
+				node_map=node_map,
+				node_ids=node_ids,
+				parent_ids=self._parent_ids(node_map, node_ids),
+			)
+		else:
+			self.snapshot = None
+
+		del node_map
+		del js_root_id
+
+		return html_to_dict, selector_map
+
+	@time_execution_sync('--apply_dom_delta')
+	def _apply_dom_delta(self, eval_page: dict) -> tuple[DOMElementNode, SelectorMap]:
+		"""Patch the subtrees re-walked by buildDomTree's incremental mode into a copy of the previous tree.
+
+		The previous tree is still referenced by the previous browser state, so only the path from every re-walked
+		subtree up to the root is copied, all the other nodes are shared between the two trees. The shared nodes
+		are not modified at all (not even their `.parent`), so the paths are found through snapshot.parent_ids.
+		"""
+		snapshot = self.snapshot
+		if snapshot is None or eval_page.get('baseSnapshotId') != snapshot.snapshot_id:
+			raise ValueError('Received a DOM delta that does not apply to the current snapshot')
+
+		node_map = snapshot.node_map
+		node_ids = snapshot.node_ids
+		parent_ids = snapshot.parent_ids
+		selector_map = dict(snapshot.selector_map)  # never mutate the selector map handed out with the previous state
+		root_id = node_ids[snapshot.element_tree]
+		replaced_parent_ids = {old_id: parent_ids.get(old_id) for old_id in eval_page['replaced']}
+
+		removed_nodes: dict[str, DOMBaseNode] = {}
+		for id in eval_page['removed']:
+			node = node_map.pop(id, None)
+			if node is None:
+				continue
+			node_ids.pop(node, None)
+			parent_ids.pop(id, None)
+			removed_nodes[id] = node
+			if isinstance(node, DOMElementNode) and node.highlight_index is not None:
+				if selector_map.get(node.highlight_index) is node:
+					del selector_map[node.highlight_index]
+
+		# the new nodes arrive children-first just like a full walk, so the same bottom-up linking applies
+		# (re-walked subtrees are sent whole, so the new nodes only ever link to each other)
+		new_nodes: dict[str, DOMBaseNode] = {}
+		selector_map.update(self._parse_nodes(eval_page, new_nodes))
+		node_map.update(new_nodes)
+		node_ids.update({node: id for id, node in new_nodes.items()})
+		parent_ids.update(self._parent_ids(new_nodes, node_ids))
+
+		copies: dict[str, DOMElementNode] = {}
+		for old_id, new_id in eval_page['replaced'].items():
+			old_node = removed_nodes[old_id]
+			parent_id = replaced_parent_ids[old_id]
+			if parent_id is None:
+				raise ValueError(f'Re-walked subtree {old_id} has no parent in the previous tree')
+
+			parent = self._copy_path(parent_id, copies, snapshot, selector_map)
+			position = next((i for i, child in enumerate(parent.children) if child is old_node), None)
+			if position is None:
+				raise ValueError(f'Re-walked subtree {old_id} is not attached to its parent')
+
+			if new_id is None:
+				del parent.children[position]
+			else:
+				new_node = node_map[new_id]
+				new_node.parent = parent
+				parent.children[position] = new_node
+				parent_ids[new_id] = parent_id
+
+		snapshot.snapshot_id = eval_page['snapshotId']
+		snapshot.element_tree = copies.get(root_id, snapshot.element_tree)
+		snapshot.selector_map = selector_map
+
+		return snapshot.element_tree, selector_map
+
+	@staticmethod
+	def _copy_path(
+		id: str,
+		copies: dict[str, DOMElementNode],
+		snapshot: DOMSnapshot,
+		selector_map: SelectorMap,
+	) -> DOMElementNode:
+		"""Copy node id and its ancestors up to the root (or up to an ancestor already copied for this delta)"""
+		path: list[str] = []
+		current: str | None = id
+		while current is not None and current not in copies:
+			path.append(current)
+			current = snapshot.parent_ids.get(current)
+
+		for node_id in reversed(path):  # root-most first, so every parent is copied before its children
+			original = snapshot.node_map[node_id]
+			assert isinstance(original, DOMElementNode)
+			copied = copy.copy(original)
+			copied.children = list(original.children)
+			parent_id = snapshot.parent_ids.get(node_id)
+			if parent_id is not None:
+				copied.parent = copies[parent_id]
+				siblings = copied.parent.children
+				siblings[next(i for i, sibling in enumerate(siblings) if sibling is original)] = copied
+			copies[node_id] = copied
+
+			del snapshot.node_ids[original]
+			snapshot.node_ids[copied] = node_id
+			snapshot.node_map[node_id] = copied
+			if copied.highlight_index is not None and selector_map.get(copied.highlight_index) is original:
+				selector_map[copied.highlight_index] = copied
+
+		return copies[id]
+
+	@staticmethod
+	def _parent_ids(nodes: dict[str, DOMBaseNode], node_ids: dict[DOMBaseNode, str]) -> dict[str, str]:
+		"""Map the id of every child of nodes to the id of its parent"""
+		return {node_ids[child]: id for id, node in nodes.items() if isinstance(node, DOMElementNode) for child in node.children}
+
+	def _parse_nodes(self, eval_page: dict, node_map: dict[str, DOMBaseNode]) -> SelectorMap:
+		"""Parse and link the nodes returned by buildDomTree into node_map, returns the highlighted ones"""
+		if 'packed' in eval_page:
+			return self._parse_packed_nodes(eval_page['packed'], node_map)
+
 		selector_map = {}
-		node_map = {}
 
-		for id, node_data in js_node_map.items():
+		for id, node_data in eval_page['map'].items():
 			node, children_ids = self._parse_node(node_data)
 			if node is None:
 				continue
@@ -168,16 +360,65 @@ class DomService:
 					child_node.parent = node
 					node.children.append(child_node)
 
-		html_to_dict = node_map[str(js_root_id)]
+		return selector_map
+
+	def _parse_packed_nodes(self, packed: dict, node_map: dict[str, DOMBaseNode]) -> SelectorMap:
+		"""Decode the packed columnar format produced by buildDomTree(packed=true) in a single pass"""
+		strings = packed['strings']
+		flags = packed['flags']
+		values = packed['values']
+		xpaths = packed['xpaths']
+		parents = packed['parents']
+		highlights = packed['highlights']
+		id_offset = packed['idOffset']
+
+		attributes_by_position: dict[int, dict[str, str]] = {}
+		packed_attributes = packed['attributes']
+		i = 0
+		while i < len(packed_attributes):
+			position, count = packed_attributes[i], packed_attributes[i + 1]
+			pairs = packed_attributes[i + 2 : i + 2 + 2 * count]
+			attributes_by_position[position] = {strings[pairs[j]]: strings[pairs[j + 1]] for j in range(0, len(pairs), 2)}
+			i += 2 + 2 * count
 
-		del node_map
-		del js_node_map
-		del js_root_id
+		selector_map = {}
+		# children always come before their parent, collect them until the parent is created
+		pending_children: dict[int, list[DOMBaseNode]] = {}
+
+		for position, node_flags in enumerate(flags):
+			if node_flags & PACKED_TEXT_NODE:
+				node = DOMTextNode(
+					text=strings[values[position]],
+					is_visible=bool(node_flags & PACKED_IS_VISIBLE),
+					parent=None,
+				)
+			else:
+				highlight_index = highlights[position]
+				node = DOMElementNode(
+					tag_name=strings[values[position]],
+					xpath=strings[xpaths[position]],
+					attributes=attributes_by_position.get(position, {}),
+					children=pending_children.pop(position, []),
+					is_visible=bool(node_flags & PACKED_IS_VISIBLE),
+					is_interactive=bool(node_flags & PACKED_IS_INTERACTIVE),
+					is_top_element=bool(node_flags & PACKED_IS_TOP_ELEMENT),
+					is_in_viewport=bool(node_flags & PACKED_IS_IN_VIEWPORT),
+					highlight_index=highlight_index if highlight_index >= 0 else None,
+					shadow_root=bool(node_flags & PACKED_SHADOW_ROOT),
+					parent=None,
+				)
+				for child in node.children:
+					child.parent = node
+				if node.highlight_index is not None:
+					selector_map[node.highlight_index] = node
 
-		if html_to_dict is None or not isinstance(html_to_dict, DOMElementNode):
-			raise ValueError('Failed to parse HTML to dictionary')
+			node_map[str(id_offset + position)] = node
 
-		return html_to_dict, selector_map
+			parent_position = parents[position]
+			if parent_position >= 0:
+				pending_children.setdefault(parent_position, []).append(node)
+
+		return selector_map
 
 	def _parse_node(
 		self,
@@ -1,5 +1,4 @@
-from dataclasses import dataclass
-from functools import cached_property
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Optional
 
 from browser_use.dom.history_tree_processor.view import CoordinateSet, HashedDomElement, ViewportInfo
@@ -11,7 +10,11 @@ if TYPE_CHECKING:
 	from .views import DOMElementNode
 
 
-@dataclass(frozen=False)
+# NOTE: nodes are slotted (no per-instance __dict__) because we keep several trees of tens of thousands
+#       of nodes alive per agent, this means attributes can't be monkeypatched onto individual nodes
+# NOTE: nodes compare and hash by identity (eq=False), comparing field by field would recurse through
+#       parent <-> children, and identity hashing lets nodes be used as dict keys (see HistoryTreeProcessor.hash_tree)
+@dataclass(frozen=False, slots=True, eq=False)
 class DOMBaseNode:
 	is_visible: bool
 	# Use None as default and set parent later to avoid circular reference issues
@@ -21,7 +24,7 @@ class DOMBaseNode:
 		raise NotImplementedError('DOMBaseNode is an abstract class')
 
 
-@dataclass(frozen=False)
+@dataclass(frozen=False, slots=True, eq=False)
 class DOMTextNode(DOMBaseNode):
 	text: str
 	type: str = 'TEXT_NODE'
@@ -70,7 +73,7 @@ DEFAULT_INCLUDE_ATTRIBUTES = [
 ]
 
 
-@dataclass(frozen=False)
+@dataclass(frozen=False, slots=True, eq=False)
 class DOMElementNode(DOMBaseNode):
 	"""
 	xpath: the xpath of the element from the last root node (shadow root or iframe OR document if no shadow root or iframe).
@@ -97,6 +100,9 @@ class DOMElementNode(DOMBaseNode):
 	"""
 	is_new: bool | None = None
 
+	# cache for .hash, filled for the whole tree at once by HistoryTreeProcessor.hash_tree
+	_hash: HashedDomElement | None = field(default=None, init=False, repr=False, compare=False)
+
 	def __json__(self) -> dict:
 		return {
 			'tag_name': self.tag_name,
@@ -139,13 +145,20 @@ class DOMElementNode(DOMBaseNode):
 
 		return tag_str
 
-	@cached_property
+	@property
 	def hash(self) -> HashedDomElement:
-		from browser_use.dom.history_tree_processor.service import (
-			HistoryTreeProcessor,
-		)
-
-		return HistoryTreeProcessor._hash_dom_element(self)
+		if self._hash is None:
+			from browser_use.dom.history_tree_processor.service import (
+				HistoryTreeProcessor,
+			)
+
+			# hash the whole tree top-down once instead of walking up to the root for every element
+			root = self
+			while root.parent is not None:
+				root = root.parent
+			HistoryTreeProcessor.hash_tree(root)
+		assert self._hash is not None
+		return self._hash
 
 	def get_all_text_till_next_clickable_element(self, max_depth: int = -1) -> str:
 		text_parts = []
@@ -155,7 +168,7 @@ class DOMElementNode(DOMBaseNode):
 				return
 
 			# Skip this branch if we hit a highlighted element (except for the current node)
-			if isinstance(node, DOMElementNode) and node != self and node.highlight_index is not None:
+			if isinstance(node, DOMElementNode) and node is not self and node.highlight_index is not None:
 				return
 
 			if isinstance(node, DOMTextNode):
@@ -168,116 +181,142 @@ class DOMElementNode(DOMBaseNode):
 		return '\n'.join(text_parts).strip()
 
 	@time_execution_sync('--clickable_elements_to_string')
-	def clickable_elements_to_string(self, include_attributes: list[str] | None = None) -> str:
-		"""Convert the processed DOM content to HTML."""
-		formatted_text = []
+	def clickable_elements_to_string(self, include_attributes: list[str] | None = None, max_length: int | None = None) -> str:
+		"""Convert the processed DOM content to HTML.
 
+		The tree is walked once, passing down whether we are inside a highlighted element instead of walking
+		up to the root for every text node, and each highlighted element only collects the text up to the next
+		highlighted element, so the cost is linear in the size of the tree.
+
+		If max_length is given, the walk stops as soon as the output is longer than max_length, and the result
+		is exactly the full output truncated to max_length characters.
+		"""
 		if not include_attributes:
 			include_attributes = DEFAULT_INCLUDE_ATTRIBUTES
 
-		def process_node(node: DOMBaseNode, depth: int) -> None:
-			next_depth = int(depth)
+		formatted_text: list[str] = []
+		formatted_length = -1  # len('\n'.join(formatted_text)), without building the string
+
+		# text under a highlighted element is rendered as part of that element, so only the ancestors above self need to be checked
+		has_highlighted_ancestor = False
+		ancestor = self.parent
+		while ancestor is not None and not has_highlighted_ancestor:
+			has_highlighted_ancestor = ancestor.highlight_index is not None
+			ancestor = ancestor.parent
+
+		stack: list[tuple[DOMBaseNode, int, bool]] = [(self, 0, has_highlighted_ancestor)]
+		while stack:
+			node, depth, has_highlighted_parent = stack.pop()
 			depth_str = depth * '\t'
+			line = None
 
 			if isinstance(node, DOMElementNode):
+				next_depth = depth
 				# Add element with highlight_index
 				if node.highlight_index is not None:
 					next_depth += 1
+					line = node._clickable_element_line(depth_str, include_attributes)
 
-					text = node.get_all_text_till_next_clickable_element()
-					attributes_html_str = None
-					if include_attributes:
-						attributes_to_include = {
-							key: str(value).strip()
-							for key, value in node.attributes.items()
-							if key in include_attributes and str(value).strip() != ''
-						}
-
-						# If value of any of the attributes is the same as ANY other value attribute only include the one that appears first in include_attributes
-						# WARNING: heavy vibes, but it seems good enough for saving tokens (it kicks in hard when it's long text)
-
-						# Pre-compute ordered keys that exist in both lists (faster than repeated lookups)
-						ordered_keys = [key for key in include_attributes if key in attributes_to_include]
-
-						if len(ordered_keys) > 1:  # Only process if we have multiple attributes
-							keys_to_remove = set()  # Use set for O(1) lookups
-							seen_values = {}  # value -> first_key_with_this_value
-
-							for key in ordered_keys:
-								value = attributes_to_include[key]
-								if len(value) > 5:  # to not remove false, true, etc
-									if value in seen_values:
-										# This value was already seen with an earlier key, so remove this key
-										keys_to_remove.add(key)
-									else:
-										# First time seeing this value, record it
-										seen_values[value] = key
-
-							# Remove duplicate keys (no need to check existence since we know they exist)
-							for key in keys_to_remove:
-								del attributes_to_include[key]
-
-						# Easy LLM optimizations
-						# if tag == role attribute, don't include it
-						if node.tag_name == attributes_to_include.get('role'):
-							del attributes_to_include['role']
-
-						# Remove attributes that duplicate the node's text content
-						attrs_to_remove_if_text_matches = ['aria-label', 'placeholder', 'title']
-						for attr in attrs_to_remove_if_text_matches:
-							if (
-								attributes_to_include.get(attr)
-								and attributes_to_include.get(attr, '').strip().lower() == text.strip().lower()
-							):
-								del attributes_to_include[attr]
-
-						if attributes_to_include.items():
-							# Format as key1='value1' key2='value2'
-							attributes_html_str = ' '.join(
-								f'{key}={cap_text_length(value, 15)}' for key, value in attributes_to_include.items()
-							)
-
-					# Build the line
-					if node.is_new:
-						highlight_indicator = f'*[{node.highlight_index}]'
-
-					else:
-						highlight_indicator = f'[{node.highlight_index}]'
-
-					line = f'{depth_str}{highlight_indicator}<{node.tag_name}'
-
-					if attributes_html_str:
-						line += f' {attributes_html_str}'
-
-					if text:
-						# Add space before >text only if there were NO attributes added before
-						text = text.strip()
-						if not attributes_html_str:
-							line += ' '
-						line += f'>{text}'
-
-					# Add space before /> only if neither attributes NOR text were added
-					elif not attributes_html_str:
-						line += ' '
-
-					# makes sense to have if the website has lots of text -> so the LLM knows which things are part of the same clickable element and which are not
-					line += ' />'  # 1 token
-					formatted_text.append(line)
-
-				# Process children regardless
-				for child in node.children:
-					process_node(child, next_depth)
+				# Process children regardless (reversed, so they are popped in document order)
+				children_have_highlighted_parent = has_highlighted_parent or node.highlight_index is not None
+				for child in reversed(node.children):
+					stack.append((child, next_depth, children_have_highlighted_parent))
 
 			elif isinstance(node, DOMTextNode):
 				# Add text only if it doesn't have a highlighted parent
-				if node.has_parent_with_highlight_index():
-					return
-
-				if node.parent and node.parent.is_visible and node.parent.is_top_element:
-					formatted_text.append(f'{depth_str}{node.text}')
-
-		process_node(self, 0)
-		return '\n'.join(formatted_text)
+				if not has_highlighted_parent and node.parent and node.parent.is_visible and node.parent.is_top_element:
+					line = f'{depth_str}{node.text}'
+
+			if line is not None:
+				formatted_text.append(line)
+				formatted_length += len(line) + 1
+				if max_length is not None and formatted_length > max_length:
+					break
+
+		result = '\n'.join(formatted_text)
+		return result if max_length is None else result[:max_length]
+
+	def _clickable_element_line(self, depth_str: str, include_attributes: list[str]) -> str:
+		"""Format the line clickable_elements_to_string() outputs for this highlighted element"""
+		text = self.get_all_text_till_next_clickable_element()
+		attributes_html_str = None
+		if include_attributes:
+			attributes_to_include = {
+				key: str(value).strip()
+				for key, value in self.attributes.items()
+				if key in include_attributes and str(value).strip() != ''
+			}
+
+			# If value of any of the attributes is the same as ANY other value attribute only include the one that appears first in include_attributes
+			# WARNING: heavy vibes, but it seems good enough for saving tokens (it kicks in hard when it's long text)
+
+			# Pre-compute ordered keys that exist in both lists (faster than repeated lookups)
+			ordered_keys = [key for key in include_attributes if key in attributes_to_include]
+
+			if len(ordered_keys) > 1:  # Only process if we have multiple attributes
+				keys_to_remove = set()  # Use set for O(1) lookups
+				seen_values = {}  # value -> first_key_with_this_value
+
+				for key in ordered_keys:
+					value = attributes_to_include[key]
+					if len(value) > 5:  # to not remove false, true, etc
+						if value in seen_values:
+							# This value was already seen with an earlier key, so remove this key
+							keys_to_remove.add(key)
+						else:
+							# First time seeing this value, record it
+							seen_values[value] = key
+
+				# Remove duplicate keys (no need to check existence since we know they exist)
+				for key in keys_to_remove:
+					del attributes_to_include[key]
+
+			# Easy LLM optimizations
+			# if tag == role attribute, don't include it
+			if self.tag_name == attributes_to_include.get('role'):
+				del attributes_to_include['role']
+
+			# Remove attributes that duplicate the node's text content
+			attrs_to_remove_if_text_matches = ['aria-label', 'placeholder', 'title']
+			for attr in attrs_to_remove_if_text_matches:
+				if (
+					attributes_to_include.get(attr)
+					and attributes_to_include.get(attr, '').strip().lower() == text.strip().lower()
+				):
+					del attributes_to_include[attr]
+
+			if attributes_to_include.items():
+				# Format as key1='value1' key2='value2'
+				attributes_html_str = ' '.join(
+					f'{key}={cap_text_length(value, 15)}' for key, value in attributes_to_include.items()
+				)
+
+		# Build the line
+		if self.is_new:
+			highlight_indicator = f'*[{self.highlight_index}]'
+
+		else:
+			highlight_indicator = f'[{self.highlight_index}]'
+
+		line = f'{depth_str}{highlight_indicator}<{self.tag_name}'
+
+		if attributes_html_str:
+			line += f' {attributes_html_str}'
+
+		if text:
+			# Add space before >text only if there were NO attributes added before
+			text = text.strip()
+			if not attributes_html_str:
+				line += ' '
+			line += f'>{text}'
+
+		# Add space before /> only if neither attributes NOR text were added
+		elif not attributes_html_str:
+			line += ' '
+
+		# makes sense to have if the website has lots of text -> so the LLM knows which things are part of the same clickable element and which are not
+		line += ' />'  # 1 token
+		return line
 
 
 SelectorMap = dict[int, DOMElementNode]
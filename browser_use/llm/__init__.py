@@ -9,6 +9,7 @@ from browser_use.llm.aws.chat_anthropic import ChatAnthropicBedrock
 from browser_use.llm.aws.chat_bedrock import ChatAWSBedrock
 from browser_use.llm.azure.chat import ChatAzureOpenAI
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.clients import aclose_shared_clients
 from browser_use.llm.deepseek.chat import ChatDeepSeek
 from browser_use.llm.google.chat import ChatGoogle
 from browser_use.llm.groq.chat import ChatGroq
@@ -55,4 +56,6 @@ __all__ = [
 	'ChatAzureOpenAI',
 	'ChatOllama',
 	'ChatOpenRouter',
+	# Shared clients
+	'aclose_shared_clients',
 ]
@@ -2,10 +2,10 @@ import os
 from dataclasses import dataclass
 from typing import Any
 
-import httpx
 from openai import AsyncAzureOpenAI as AsyncAzureOpenAIClient
 from openai.types.shared import ChatModel
 
+from browser_use.llm.clients import get_cached_client, get_shared_http_client
 from browser_use.llm.openai.like import ChatOpenAILike
 
 
@@ -81,11 +81,7 @@ class ChatAzureOpenAI(ChatOpenAILike):
 		if self.http_client:
 			_client_params['http_client'] = self.http_client
 		else:
-			# Create a new async HTTP client with custom limits
-			_client_params['http_client'] = httpx.AsyncClient(
-				limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-			)
+			# Share the keep-alive connection pool with all other LLM clients
+			_client_params['http_client'] = get_shared_http_client()
 
-		self.client = AsyncAzureOpenAIClient(**_client_params)
-
-		return self.client
+		return get_cached_client(AsyncAzureOpenAIClient, **_client_params)
@@ -0,0 +1,130 @@
+"""
+Process-wide cache of provider SDK clients and of the HTTP connection pool underneath them.
+
+Creating a new AsyncOpenAI / AsyncAnthropic / ... per call means a new connection pool, so every LLM
+round-trip pays for DNS, TCP and TLS again. Instead, clients are shared by every chat model with the
+same client params (base_url, credentials, timeout, ...), so their keep-alive connections are reused.
+The OpenAI SDK based providers additionally share one connection pool (HTTP/2 if the `h2` package is installed),
+other SDKs may vendor their own httpx and only accept their own http clients.
+
+httpx connections are bound to the event loop they were opened on, so everything is cached per event loop.
+Agents register as users of the shared clients while they run (see use_shared_clients()), and the last one
+to finish closes them, so their connections don't outlive the work that needed them.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import weakref
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# same limits as the openai / anthropic / groq SDKs use for their default http clients
+SHARED_HTTP_CLIENT_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=60)
+
+_http_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]' = weakref.WeakKeyDictionary()
+_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple, Any]]' = weakref.WeakKeyDictionary()
+_n_users: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, int]' = weakref.WeakKeyDictionary()
+
+
+def _get_running_loop() -> asyncio.AbstractEventLoop | None:
+	try:
+		return asyncio.get_running_loop()
+	except RuntimeError:
+		return None
+
+
+def _is_closed(client: Any) -> bool:
+	is_closed = getattr(client, 'is_closed', False)
+	return is_closed() if callable(is_closed) else bool(is_closed)
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+	"""Get the httpx.AsyncClient shared by all LLM providers on the current event loop.
+
+	The SDKs pass their own timeout with every request, so the timeout configured here is only a fallback.
+	"""
+	loop = _get_running_loop()
+	http_client = _http_clients.get(loop) if loop else None
+	if http_client is None or http_client.is_closed:
+		http_client = httpx.AsyncClient(
+			http2=HTTP2_AVAILABLE,
+			limits=SHARED_HTTP_CLIENT_LIMITS,
+			timeout=httpx.Timeout(timeout=600, connect=5),
+			follow_redirects=True,
+		)
+		if loop:
+			_http_clients[loop] = http_client
+	return http_client
+
+
+def get_cached_client(client_factory: Callable[..., T], **client_params: Any) -> T:
+	"""Get client_factory(**client_params), shared with every caller using the same factory and params on the current event loop.
+
+	Outside of an event loop a new client is returned every time, as there is nothing to bind the cached one to.
+	So is a client for an http_client passed in by the caller: it has its own connection pool already, and as
+	every http_client makes a new cache key, caching them would grow the cache for as long as the loop lives.
+	"""
+	loop = _get_running_loop()
+	if loop is None:
+		return client_factory(**client_params)
+	http_client = client_params.get('http_client')
+	if http_client is not None and http_client is not _http_clients.get(loop):
+		return client_factory(**client_params)
+
+	# params are keyed by repr, they include values like httpx.Timeout or header mappings that aren't hashable
+	key = (client_factory, tuple(sorted((name, repr(value)) for name, value in client_params.items())))
+	clients = _clients.setdefault(loop, {})
+	client = clients.get(key)
+	if client is None or _is_closed(client):
+		client = client_factory(**client_params)
+		clients[key] = client
+	return client
+
+
+def use_shared_clients() -> None:
+	"""Register a user of the clients shared on the current event loop (e.g. a running agent), see release_shared_clients()"""
+	loop = _get_running_loop()
+	if loop is not None:
+		_n_users[loop] = _n_users.get(loop, 0) + 1
+
+
+async def release_shared_clients() -> None:
+	"""Unregister a user registered with use_shared_clients(), the last one closes the shared clients"""
+	loop = _get_running_loop()
+	if loop is None or loop not in _n_users:
+		return
+	_n_users[loop] -= 1
+	if _n_users[loop] <= 0:
+		del _n_users[loop]
+		await aclose_shared_clients()
+
+
+async def aclose_shared_clients() -> None:
+	"""Close the clients and connection pool shared on the current event loop, e.g. before shutting the loop down.
+
+	Clients that are used again afterwards are transparently recreated.
+	"""
+	loop = _get_running_loop()
+	if loop is None:
+		return
+
+	for client in _clients.pop(loop, {}).values():
+		close = getattr(client, 'close', None) or getattr(client, 'aclose', None)
+		try:
+			if close is not None and asyncio.iscoroutinefunction(close):
+				await close()
+		except Exception as e:
+			logger.debug(f'Failed to close shared LLM client {type(client).__name__}: {type(e).__name__}: {e}')
+
+	http_client = _http_clients.pop(loop, None)
+	if http_client is not None and not http_client.is_closed:
+		await http_client.aclose()
@@ -16,6 +16,7 @@ from openai import (
 from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.clients import get_cached_client, get_shared_http_client
 from browser_use.llm.deepseek.serializer import DeepSeekMessageSerializer
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
@@ -46,12 +47,8 @@ class ChatDeepSeek(BaseChatModel):
 		return 'deepseek'
 
 	def _client(self) -> AsyncOpenAI:
-		return AsyncOpenAI(
-			api_key=self.api_key,
-			base_url=self.base_url,
-			timeout=self.timeout,
-			**(self.client_params or {}),
-		)
+		client_params = {'http_client': get_shared_http_client(), **(self.client_params or {})}
+		return get_cached_client(AsyncOpenAI, api_key=self.api_key, base_url=self.base_url, timeout=self.timeout, **client_params)
 
 	@property
 	def name(self) -> str:
@@ -9,6 +9,7 @@ from google.genai.types import MediaModality
 from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.clients import get_cached_client
 from browser_use.llm.exceptions import ModelProviderError
 from browser_use.llm.google.serializer import GoogleMessageSerializer
 from browser_use.llm.messages import BaseMessage
@@ -115,7 +116,7 @@ class ChatGoogle(BaseChatModel):
 			genai.Client: An instance of the Google genai client.
 		"""
 		client_params = self._get_client_params()
-		return genai.Client(**client_params)
+		return get_cached_client(genai.Client, **client_params)
 
 	@property
 	def name(self) -> str:
@@ -82,11 +82,12 @@ class GoogleMessageSerializer:
 
 						# Format: data:image/png;base64,<data>
 						header, data = url.split(',', 1)
+						mime_type = header.split(';')[0].removeprefix('data:') or 'image/png'
 						# Decode base64 to bytes
 						image_bytes = base64.b64decode(data)
 
 						# Add image part
-						image_part = Part.from_bytes(data=image_bytes, mime_type='image/png')
+						image_part = Part.from_bytes(data=image_bytes, mime_type=mime_type)
 
 						message_parts.append(image_part)
 
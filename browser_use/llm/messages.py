@@ -51,6 +51,17 @@ class ContentPartRefusalParam(BaseModel):
 SupportedImageMediaType = Literal['image/jpeg', 'image/png', 'image/gif', 'image/webp']
 
 
+def get_base64_image_media_type(data: str) -> SupportedImageMediaType:
+	"""Detect the media type of base64 encoded image data from its first bytes, defaults to image/png."""
+	if data.startswith('/9j/'):  # \xff\xd8\xff
+		return 'image/jpeg'
+	if data.startswith('UklGR'):  # RIFF....WEBP
+		return 'image/webp'
+	if data.startswith('R0lGOD'):  # GIF8
+		return 'image/gif'
+	return 'image/png'
+
+
 class ImageURL(BaseModel):
 	url: str
 	"""Either a URL of the image or the base64 encoded image data."""
@@ -6,6 +6,7 @@ from ollama import AsyncClient as OllamaAsyncClient
 from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.clients import get_cached_client
 from browser_use.llm.exceptions import ModelProviderError
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.ollama.serializer import OllamaMessageSerializer
@@ -47,7 +48,7 @@ class ChatOllama(BaseChatModel):
 		"""
 		Returns an OllamaAsyncClient client.
 		"""
-		return OllamaAsyncClient(host=self.host, timeout=self.timeout, **self.client_params or {})
+		return get_cached_client(OllamaAsyncClient, host=self.host, timeout=self.timeout, **self.client_params or {})
 
 	@property
 	def name(self) -> str:
@@ -11,6 +11,7 @@ from openai.types.shared_params.response_format_json_schema import JSONSchema, R
 from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.clients import get_cached_client, get_shared_http_client
 from browser_use.llm.exceptions import ModelProviderError
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.openai.serializer import OpenAIMessageSerializer
@@ -89,7 +90,8 @@ class ChatOpenAI(BaseChatModel):
 			AsyncOpenAI: An instance of the AsyncOpenAI client.
 		"""
 		client_params = self._get_client_params()
-		return AsyncOpenAI(**client_params)
+		client_params.setdefault('http_client', get_shared_http_client())
+		return get_cached_client(AsyncOpenAI, **client_params)
 
 	@property
 	def name(self) -> str:
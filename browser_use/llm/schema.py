@@ -2,10 +2,15 @@
 Utilities for creating optimized Pydantic schemas for LLM usage.
 """
 
+import copy
+import weakref
 from typing import Any
 
 from pydantic import BaseModel
 
+# optimized schemas already created, per model class (the agent reuses the same output model across steps)
+_optimized_schemas: 'weakref.WeakKeyDictionary[type[BaseModel], dict[str, Any]]' = weakref.WeakKeyDictionary()
+
 
 class SchemaOptimizer:
 	@staticmethod
@@ -14,12 +19,22 @@ class SchemaOptimizer:
 		Create the most optimized schema by flattening all $ref/$defs while preserving
 		FULL descriptions and ALL action definitions. Also ensures OpenAI strict mode compatibility.
 
+		The schema is only generated once per model, every call returns a fresh copy of it that the caller may modify.
+
 		Args:
 			model: The Pydantic model to optimize
 
 		Returns:
 			Optimized schema with all $refs resolved and strict mode compatibility
 		"""
+		optimized_schema = _optimized_schemas.get(model)
+		if optimized_schema is None:
+			optimized_schema = SchemaOptimizer._create_optimized_json_schema(model)
+			_optimized_schemas[model] = optimized_schema
+		return copy.deepcopy(optimized_schema)
+
+	@staticmethod
+	def _create_optimized_json_schema(model: type[BaseModel]) -> dict[str, Any]:
 		# Generate original schema
 		original_schema = model.model_json_schema()
 
@@ -1,5 +1,6 @@
 import logging
 import tempfile
+from unittest.mock import patch
 
 import pytest
 
@@ -81,10 +82,14 @@ def create_mock_state_message(temp_dir: str):
 	)
 
 	# Override the clickable_elements_to_string method to return our simple element
-	mock_button.clickable_elements_to_string = lambda include_attributes=None: '[1]<button id="test-button">Click Me</button>'
-
-	# Get the formatted message
-	message = agent_prompt.get_user_message(use_vision=False)
+	# (DOM nodes are slotted, so the method has to be patched on the class rather than the instance)
+	with patch.object(
+		DOMElementNode,
+		'clickable_elements_to_string',
+		lambda self, include_attributes=None, max_length=None: '[1]<button id="test-button">Click Me</button>',
+	):
+		# Get the formatted message
+		message = agent_prompt.get_user_message(use_vision=False)
 
 	return message
 
@@ -29,6 +29,9 @@ import logging
 import os
 import sys
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
 
@@ -76,10 +79,11 @@ _configure_mcp_server_logging()
 
 # Import browser_use modules
 from browser_use import ActionModel, Agent
-from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser import BrowserPool, BrowserProfile, BrowserSession
 from browser_use.config import get_default_llm, get_default_profile, load_browser_use_config
 from browser_use.controller.service import Controller
 from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm.clients import aclose_shared_clients
 from browser_use.llm.openai.chat import ChatOpenAI
 
 logger = logging.getLogger(__name__)
@@ -134,9 +138,15 @@ except ImportError:
 	logger.error('MCP SDK not installed. Install with: pip install mcp')
 	sys.exit(1)
 
+from uuid_extensions import uuid7str
+
 from browser_use.telemetry import MCPServerTelemetryEvent, ProductTelemetry
 from browser_use.utils import get_browser_use_version
 
+# tools that don't act on a browser session, every other browser_* tool takes an optional session_id
+SESSION_MANAGEMENT_TOOLS = ('browser_create_session', 'browser_list_sessions', 'browser_close_session')
+SESSION_ACQUIRE_TIMEOUT = 30  # seconds browser_create_session waits for a browser context of the pool
+
 
 def get_parent_process_cmdline() -> str | None:
 	"""Get the command line of all parent processes up the chain."""
@@ -169,10 +179,28 @@ def get_parent_process_cmdline() -> str | None:
 		return None
 
 
+@dataclass
+class MCPBrowserSession:
+	"""A browser session created with browser_create_session, isolated from the other sessions in its own browser context"""
+
+	session_id: str
+	browser_session: BrowserSession
+	file_system: FileSystem
+	created_at: float = field(default_factory=time.time)
+	last_used: float = field(default_factory=time.time)
+	# tool calls on the same session run one at a time, calls on different sessions run in parallel
+	lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
 class BrowserUseServer:
-	"""MCP Server for browser-use capabilities."""
+	"""MCP Server for browser-use capabilities.
+
+	Browser tools called without a session_id share one default browser session. Clients that need their own
+	browser create a session with browser_create_session and pass its session_id, those sessions are served from
+	a pool of warm browser contexts and closed after session_idle_timeout seconds without tool calls.
+	"""
 
-	def __init__(self):
+	def __init__(self, max_sessions: int = 10, session_idle_timeout: float = 600):
 		# Ensure all logging goes to stderr (in case new loggers were created)
 		_ensure_all_loggers_use_stderr()
 
@@ -183,6 +211,13 @@ class BrowserUseServer:
 		self.controller: Controller | None = None
 		self.llm: ChatOpenAI | None = None
 		self.file_system: FileSystem | None = None
+		self.max_sessions = max_sessions
+		self.session_idle_timeout = session_idle_timeout
+		self.sessions: dict[str, MCPBrowserSession] = {}
+		self._n_creating_sessions = 0  # sessions that have a slot reserved but are still waiting for a browser context
+		self._browser_pool: BrowserPool | None = None
+		self._init_lock = asyncio.Lock()
+		self._default_session_lock = asyncio.Lock()
 		self._telemetry = ProductTelemetry()
 		self._start_time = time.time()
 
@@ -195,7 +230,7 @@ class BrowserUseServer:
 		@self.server.list_tools()
 		async def handle_list_tools() -> list[types.Tool]:
 			"""List all available browser-use tools."""
-			return [
+			tools = [
 				# Agent tools
 				# Direct browser control tools
 				types.Tool(
@@ -316,6 +351,26 @@ class BrowserUseServer:
 						'required': ['tab_index'],
 					},
 				),
+				# Session management
+				types.Tool(
+					name='browser_create_session',
+					description='Create a new browser session with its own cookies, storage and tabs. Pass the returned session_id to the other browser tools to use it.',
+					inputSchema={'type': 'object', 'properties': {}},
+				),
+				types.Tool(
+					name='browser_list_sessions',
+					description='List the open browser sessions',
+					inputSchema={'type': 'object', 'properties': {}},
+				),
+				types.Tool(
+					name='browser_close_session',
+					description='Close a browser session created with browser_create_session',
+					inputSchema={
+						'type': 'object',
+						'properties': {'session_id': {'type': 'string', 'description': 'ID of the session to close'}},
+						'required': ['session_id'],
+					},
+				),
 				# types.Tool(
 				# 	name="browser_close",
 				# 	description="Close the browser session",
@@ -361,6 +416,14 @@ class BrowserUseServer:
 				),
 			]
 
+			for tool in tools:
+				if tool.name.startswith('browser_') and tool.name not in SESSION_MANAGEMENT_TOOLS:
+					tool.inputSchema['properties']['session_id'] = {
+						'type': 'string',
+						'description': 'Browser session to use (from browser_create_session), uses the default session if omitted',
+					}
+			return tools
+
 		@self.server.call_tool()
 		async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[types.TextContent]:
 			"""Handle tool execution."""
@@ -399,57 +462,94 @@ class BrowserUseServer:
 				use_vision=arguments.get('use_vision', True),
 			)
 
+		# Session management tools
+		if tool_name == 'browser_create_session':
+			return await self._create_session()
+
+		elif tool_name == 'browser_list_sessions':
+			return self._list_sessions()
+
+		elif tool_name == 'browser_close_session':
+			return await self._close_session(arguments['session_id'])
+
+		elif tool_name == 'browser_close' and arguments.get('session_id') is not None:
+			# closes that session instead of the default browser (outside of _use_session, closing waits for the session's lock)
+			return await self._close_session(arguments['session_id'])
+
 		# Direct browser control tools (require active session)
 		if tool_name.startswith('browser_'):
+			session_id = arguments.get('session_id')
+
 			# Ensure browser session exists
-			if not self.browser_session:
+			if session_id is None and not self.browser_session:
 				await self._init_browser_session()
 
-			if tool_name == 'browser_navigate':
-				return await self._navigate(arguments['url'], arguments.get('new_tab', False))
+			async with self._use_session(session_id):
+				if tool_name == 'browser_navigate':
+					return await self._navigate(arguments['url'], arguments.get('new_tab', False), session_id=session_id)
 
-			elif tool_name == 'browser_click':
-				return await self._click(arguments['index'], arguments.get('new_tab', False))
+				elif tool_name == 'browser_click':
+					return await self._click(arguments['index'], arguments.get('new_tab', False), session_id=session_id)
 
-			elif tool_name == 'browser_type':
-				return await self._type_text(arguments['index'], arguments['text'])
+				elif tool_name == 'browser_type':
+					return await self._type_text(arguments['index'], arguments['text'], session_id=session_id)
 
-			elif tool_name == 'browser_get_state':
-				return await self._get_browser_state(arguments.get('include_screenshot', False))
+				elif tool_name == 'browser_get_state':
+					return await self._get_browser_state(arguments.get('include_screenshot', False), session_id=session_id)
 
-			elif tool_name == 'browser_extract_content':
-				return await self._extract_content(arguments['query'], arguments.get('extract_links', False))
+				elif tool_name == 'browser_extract_content':
+					return await self._extract_content(
+						arguments['query'], arguments.get('extract_links', False), session_id=session_id
+					)
 
-			elif tool_name == 'browser_scroll':
-				return await self._scroll(arguments.get('direction', 'down'))
+				elif tool_name == 'browser_scroll':
+					return await self._scroll(arguments.get('direction', 'down'), session_id=session_id)
 
-			elif tool_name == 'browser_go_back':
-				return await self._go_back()
+				elif tool_name == 'browser_go_back':
+					return await self._go_back(session_id=session_id)
 
-			elif tool_name == 'browser_close':
-				return await self._close_browser()
+				elif tool_name == 'browser_close':
+					return await self._close_browser()
 
-			elif tool_name == 'browser_list_tabs':
-				return await self._list_tabs()
+				elif tool_name == 'browser_list_tabs':
+					return await self._list_tabs(session_id=session_id)
 
-			elif tool_name == 'browser_switch_tab':
-				return await self._switch_tab(arguments['tab_index'])
+				elif tool_name == 'browser_switch_tab':
+					return await self._switch_tab(arguments['tab_index'], session_id=session_id)
 
-			elif tool_name == 'browser_close_tab':
-				return await self._close_tab(arguments['tab_index'])
+				elif tool_name == 'browser_close_tab':
+					return await self._close_tab(arguments['tab_index'], session_id=session_id)
 
 		return f'Unknown tool: {tool_name}'
 
 	async def _init_browser_session(self, allowed_domains: list[str] | None = None, **kwargs):
 		"""Initialize browser session using config"""
-		if self.browser_session:
-			return
+		async with self._init_lock:
+			if self.browser_session:
+				return
 
-		# Ensure all logging goes to stderr before browser initialization
-		_ensure_all_loggers_use_stderr()
+			# Ensure all logging goes to stderr before browser initialization
+			_ensure_all_loggers_use_stderr()
+
+			logger.debug('Initializing browser session...')
+
+			# Create browser profile
+			profile = self._get_browser_profile(allowed_domains, **kwargs)
+
+			# Create browser session
+			browser_session = BrowserSession(browser_profile=profile)
+			await browser_session.start()
+			self.browser_session = browser_session
 
-		logger.debug('Initializing browser session...')
+			self._init_shared_resources()
 
+			# Initialize FileSystem for extraction actions
+			self.file_system = FileSystem(base_dir=self._file_system_path)
+
+			logger.debug('Browser session initialized')
+
+	def _get_browser_profile(self, allowed_domains: list[str] | None = None, **kwargs) -> BrowserProfile:
+		"""Build the BrowserProfile for the server's browser sessions from the config"""
 		# Get profile config
 		profile_config = get_default_profile(self.config)
 
@@ -474,13 +574,14 @@ class BrowserUseServer:
 		for key, value in kwargs.items():
 			profile_data[key] = value
 
-		# Create browser profile
-		profile = BrowserProfile(**profile_data)
+		return BrowserProfile(**profile_data)
 
-		# Create browser session
-		self.browser_session = BrowserSession(browser_profile=profile)
-		await self.browser_session.start()
+	@property
+	def _file_system_path(self) -> Path:
+		return Path(get_default_profile(self.config).get('file_system_path', '~/.browser-use-mcp')).expanduser()
 
+	def _init_shared_resources(self) -> None:
+		"""Create the controller and LLM shared by all browser sessions"""
 		# Create controller for direct actions
 		self.controller = Controller()
 
@@ -494,11 +595,125 @@ class BrowserUseServer:
 				# max_tokens=llm_config.get('max_tokens'),
 			)
 
-		# Initialize FileSystem for extraction actions
-		file_system_path = profile_config.get('file_system_path', '~/.browser-use-mcp')
-		self.file_system = FileSystem(base_dir=Path(file_system_path).expanduser())
+	async def _init_browser_pool(self, **kwargs) -> BrowserPool:
+		"""Initialize the pool of browsers the sessions of browser_create_session are served from, kwargs override the config"""
+		async with self._init_lock:
+			if self._browser_pool is None:
+				_ensure_all_loggers_use_stderr()
+				# sessions live in their own browser contexts, so the pooled browsers can't share the default user_data_dir
+				browser_pool = BrowserPool(
+					browser_profile=self._get_browser_profile(**{**kwargs, 'user_data_dir': None}),
+					contexts_per_browser=self.max_sessions,
+				)
+				await browser_pool.start()
+				self._browser_pool = browser_pool
+			if self.controller is None:
+				self._init_shared_resources()
+			return self._browser_pool
+
+	async def _create_session(self) -> str:
+		"""Create a new isolated browser session and return its session_id"""
+		await self._evict_idle_sessions()
+
+		# reserve a slot right away, so concurrent calls can't go over max_sessions while waiting for a browser context
+		if len(self.sessions) + self._n_creating_sessions >= self.max_sessions:
+			return f'Error: Too many browser sessions open (max {self.max_sessions}), close one with browser_close_session first'
+		self._n_creating_sessions += 1
+		try:
+			browser_pool = await self._init_browser_pool()
+			try:
+				browser_session = await browser_pool.acquire(timeout=SESSION_ACQUIRE_TIMEOUT)
+			except TimeoutError:
+				return f'Error: No browser available for a new session after {SESSION_ACQUIRE_TIMEOUT}s, try again later'
+
+			session_id = uuid7str()
+			self.sessions[session_id] = MCPBrowserSession(
+				session_id=session_id,
+				browser_session=browser_session,
+				file_system=FileSystem(base_dir=self._file_system_path / 'sessions' / session_id),
+			)
+		finally:
+			self._n_creating_sessions -= 1
+		logger.debug(f'Created browser session {session_id}')
+		return json.dumps({'session_id': session_id})
+
+	def _list_sessions(self) -> str:
+		"""List the browser sessions created with browser_create_session"""
+		now = time.time()
+		sessions = []
+		for session in self.sessions.values():
+			page = session.browser_session.agent_current_page
+			sessions.append(
+				{
+					'session_id': session.session_id,
+					'url': page.url if page and not page.is_closed() else None,
+					'tabs': len(session.browser_session.tabs),
+					'age_seconds': round(now - session.created_at),
+					'idle_seconds': round(now - session.last_used),
+				}
+			)
+		return json.dumps(sessions, indent=2)
+
+	async def _close_session(self, session_id: str) -> str:
+		"""Close a browser session, its browser context is cleaned up and reused for new sessions"""
+		session = self.sessions.pop(session_id, None)
+		if session is None:
+			return f'Unknown session_id: {session_id}'
+
+		# wait for the tool call that is using the session to finish
+		async with session.lock:
+			if self._browser_pool is not None:
+				await self._browser_pool.release(session.browser_session)
+		logger.debug(f'Closed browser session {session_id}')
+		return f'Closed session {session_id}'
+
+	async def _evict_idle_sessions(self) -> None:
+		"""Close the sessions that had no tool calls for session_idle_timeout seconds"""
+		now = time.time()
+		for session in list(self.sessions.values()):
+			if not session.lock.locked() and now - session.last_used > self.session_idle_timeout:
+				logger.debug(
+					f'Closing browser session {session.session_id} after {now - session.last_used:.0f}s without tool calls'
+				)
+				await self._close_session(session.session_id)
+
+	async def _evict_idle_sessions_periodically(self) -> None:
+		while True:
+			await asyncio.sleep(min(60, self.session_idle_timeout))
+			try:
+				await self._evict_idle_sessions()
+			except Exception as e:
+				logger.error(f'Failed to close idle browser sessions: {type(e).__name__}: {e}')
+
+	@asynccontextmanager
+	async def _use_session(self, session_id: str | None) -> AsyncIterator[None]:
+		"""Hold the lock of a browser session for the duration of a tool call"""
+		if session_id is None:
+			async with self._default_session_lock:
+				yield
+			return
+
+		session = self.sessions.get(session_id)
+		if session is None:
+			raise ValueError(f'Unknown session_id: {session_id}, create one with browser_create_session')
+		async with session.lock:
+			session.last_used = time.time()
+			try:
+				yield
+			finally:
+				session.last_used = time.time()
 
-		logger.debug('Browser session initialized')
+	def _get_browser_session(self, session_id: str | None) -> BrowserSession | None:
+		if session_id is None:
+			return self.browser_session
+		session = self.sessions.get(session_id)
+		return session.browser_session if session else None
+
+	def _get_file_system(self, session_id: str | None) -> FileSystem | None:
+		if session_id is None:
+			return self.file_system
+		session = self.sessions.get(session_id)
+		return session.file_system if session else None
 
 	async def _retry_with_browser_use_agent(
 		self,
@@ -582,26 +797,28 @@ class BrowserUseServer:
 			# Clean up
 			await agent.close()
 
-	async def _navigate(self, url: str, new_tab: bool = False) -> str:
+	async def _navigate(self, url: str, new_tab: bool = False, session_id: str | None = None) -> str:
 		"""Navigate to a URL."""
-		if not self.browser_session:
+		browser_session = self._get_browser_session(session_id)
+		if not browser_session:
 			return 'Error: No browser session active'
 
 		if new_tab:
-			page = await self.browser_session.create_new_tab(url)
-			tab_idx = self.browser_session.tabs.index(page)
+			page = await browser_session.create_new_tab(url)
+			tab_idx = browser_session.tabs.index(page)
 			return f'Opened new tab #{tab_idx} with URL: {url}'
 		else:
-			await self.browser_session.navigate_to(url)
+			await browser_session.navigate_to(url)
 			return f'Navigated to: {url}'
 
-	async def _click(self, index: int, new_tab: bool = False) -> str:
+	async def _click(self, index: int, new_tab: bool = False, session_id: str | None = None) -> str:
 		"""Click an element by index."""
-		if not self.browser_session:
+		browser_session = self._get_browser_session(session_id)
+		if not browser_session:
 			return 'Error: No browser session active'
 
 		# Get the element
-		element = await self.browser_session.get_dom_element_by_index(index)
+		element = await browser_session.get_dom_element_by_index(index)
 		if not element:
 			return f'Element with index {index} not found'
 
@@ -610,7 +827,7 @@ class BrowserUseServer:
 			href = element.attributes.get('href')
 			if href:
 				# Convert relative href to absolute URL
-				current_page = await self.browser_session.get_current_page()
+				current_page = await browser_session.get_current_page()
 				if href.startswith('/'):
 					# Relative URL - construct full URL
 					from urllib.parse import urlparse
@@ -621,13 +838,13 @@ class BrowserUseServer:
 					full_url = href
 
 				# Open link in new tab
-				page = await self.browser_session.create_new_tab(full_url)
-				tab_idx = self.browser_session.tabs.index(page)
+				page = await browser_session.create_new_tab(full_url)
+				tab_idx = browser_session.tabs.index(page)
 				return f'Clicked element {index} and opened in new tab #{tab_idx}'
 			else:
 				# For non-link elements, try Cmd/Ctrl+Click
-				page = await self.browser_session.get_current_page()
-				element_handle = await self.browser_session.get_locate_element(element)
+				page = await browser_session.get_current_page()
+				element_handle = await browser_session.get_locate_element(element)
 				if element_handle:
 					# Use playwright's click with modifiers
 					modifier: Literal['Meta', 'Control'] = 'Meta' if sys.platform == 'darwin' else 'Control'
@@ -639,27 +856,29 @@ class BrowserUseServer:
 					return f'Could not locate element {index} for modified click'
 		else:
 			# Normal click
-			await self.browser_session._click_element_node(element)
+			await browser_session._click_element_node(element)
 			return f'Clicked element {index}'
 
-	async def _type_text(self, index: int, text: str) -> str:
+	async def _type_text(self, index: int, text: str, session_id: str | None = None) -> str:
 		"""Type text into an element."""
-		if not self.browser_session:
+		browser_session = self._get_browser_session(session_id)
+		if not browser_session:
 			return 'Error: No browser session active'
 
-		element = await self.browser_session.get_dom_element_by_index(index)
+		element = await browser_session.get_dom_element_by_index(index)
 		if not element:
 			return f'Element with index {index} not found'
 
-		await self.browser_session._input_text_element_node(element, text)
+		await browser_session._input_text_element_node(element, text)
 		return f"Typed '{text}' into element {index}"
 
-	async def _get_browser_state(self, include_screenshot: bool = False) -> str:
+	async def _get_browser_state(self, include_screenshot: bool = False, session_id: str | None = None) -> str:
 		"""Get current browser state."""
-		if not self.browser_session:
+		browser_session = self._get_browser_session(session_id)
+		if not browser_session:
 			return 'Error: No browser session active'
 
-		state = await self.browser_session.get_state_summary(cache_clickable_elements_hashes=False)
+		state = await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
 
 		result = {
 			'url': state.url,
@@ -686,21 +905,23 @@ class BrowserUseServer:
 
 		return json.dumps(result, indent=2)
 
-	async def _extract_content(self, query: str, extract_links: bool = False) -> str:
+	async def _extract_content(self, query: str, extract_links: bool = False, session_id: str | None = None) -> str:
 		"""Extract content from current page."""
+		browser_session = self._get_browser_session(session_id)
+		file_system = self._get_file_system(session_id)
 		if not self.llm:
 			return 'Error: LLM not initialized (set OPENAI_API_KEY)'
 
-		if not self.file_system:
+		if not file_system:
 			return 'Error: FileSystem not initialized'
 
-		if not self.browser_session:
+		if not browser_session:
 			return 'Error: No browser session active'
 
 		if not self.controller:
 			return 'Error: Controller not initialized'
 
-		page = await self.browser_session.get_current_page()
+		page = await browser_session.get_current_page()
 
 		# Use the extract_structured_data action
 		# Create a dynamic action model that matches the controller's expectations
@@ -716,19 +937,20 @@ class BrowserUseServer:
 		action = ExtractAction()
 		action_result = await self.controller.act(
 			action=action,
-			browser_session=self.browser_session,
+			browser_session=browser_session,
 			page_extraction_llm=self.llm,
-			file_system=self.file_system,
+			file_system=file_system,
 		)
 
 		return action_result.extracted_content or 'No content extracted'
 
-	async def _scroll(self, direction: str = 'down') -> str:
+	async def _scroll(self, direction: str = 'down', session_id: str | None = None) -> str:
 		"""Scroll the page."""
-		if not self.browser_session:
+		browser_session = self._get_browser_session(session_id)
+		if not browser_session:
 			return 'Error: No browser session active'
 
-		page = await self.browser_session.get_current_page()
+		page = await browser_session.get_current_page()
 
 		# Get viewport height
 		viewport_height = await page.evaluate('() => window.innerHeight')
@@ -737,12 +959,13 @@ class BrowserUseServer:
 		await page.evaluate('(y) => window.scrollBy(0, y)', dy)
 		return f'Scrolled {direction}'
 
-	async def _go_back(self) -> str:
+	async def _go_back(self, session_id: str | None = None) -> str:
 		"""Go back in browser history."""
-		if not self.browser_session:
+		browser_session = self._get_browser_session(session_id)
+		if not browser_session:
 			return 'Error: No browser session active'
 
-		await self.browser_session.go_back()
+		await browser_session.go_back()
 		return 'Navigated back'
 
 	async def _close_browser(self) -> str:
@@ -754,32 +977,35 @@ class BrowserUseServer:
 			return 'Browser closed'
 		return 'No browser session to close'
 
-	async def _list_tabs(self) -> str:
+	async def _list_tabs(self, session_id: str | None = None) -> str:
 		"""List all open tabs."""
-		if not self.browser_session:
+		browser_session = self._get_browser_session(session_id)
+		if not browser_session:
 			return 'Error: No browser session active'
 
 		tabs = []
-		for i, tab in enumerate(self.browser_session.tabs):
+		for i, tab in enumerate(browser_session.tabs):
 			tabs.append({'index': i, 'url': tab.url, 'title': await tab.title() if not tab.is_closed() else 'Closed'})
 		return json.dumps(tabs, indent=2)
 
-	async def _switch_tab(self, tab_index: int) -> str:
+	async def _switch_tab(self, tab_index: int, session_id: str | None = None) -> str:
 		"""Switch to a different tab."""
-		if not self.browser_session:
+		browser_session = self._get_browser_session(session_id)
+		if not browser_session:
 			return 'Error: No browser session active'
 
-		await self.browser_session.switch_to_tab(tab_index)
-		page = await self.browser_session.get_current_page()
+		await browser_session.switch_to_tab(tab_index)
+		page = await browser_session.get_current_page()
 		return f'Switched to tab {tab_index}: {page.url}'
 
-	async def _close_tab(self, tab_index: int) -> str:
+	async def _close_tab(self, tab_index: int, session_id: str | None = None) -> str:
 		"""Close a specific tab."""
-		if not self.browser_session:
+		browser_session = self._get_browser_session(session_id)
+		if not browser_session:
 			return 'Error: No browser session active'
 
-		if 0 <= tab_index < len(self.browser_session.tabs):
-			tab = self.browser_session.tabs[tab_index]
+		if 0 <= tab_index < len(browser_session.tabs):
+			tab = browser_session.tabs[tab_index]
 			url = tab.url
 			await tab.close()
 			return f'Closed tab {tab_index}: {url}'
@@ -787,19 +1013,32 @@ class BrowserUseServer:
 
 	async def run(self):
 		"""Run the MCP server."""
-		async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-			await self.server.run(
-				read_stream,
-				write_stream,
-				InitializationOptions(
-					server_name='browser-use',
-					server_version='0.1.0',
-					capabilities=self.server.get_capabilities(
-						notification_options=NotificationOptions(),
-						experimental_capabilities={},
+		eviction_task = asyncio.create_task(self._evict_idle_sessions_periodically())
+		try:
+			async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+				await self.server.run(
+					read_stream,
+					write_stream,
+					InitializationOptions(
+						server_name='browser-use',
+						server_version='0.1.0',
+						capabilities=self.server.get_capabilities(
+							notification_options=NotificationOptions(),
+							experimental_capabilities={},
+						),
 					),
-				),
-			)
+				)
+		finally:
+			eviction_task.cancel()
+			await self._close_sessions()
+			await aclose_shared_clients()
+
+	async def _close_sessions(self) -> None:
+		"""Close all the sessions created with browser_create_session and their browsers"""
+		self.sessions.clear()
+		if self._browser_pool is not None:
+			await self._browser_pool.close()
+			self._browser_pool = None
 
 
 async def main():
@@ -0,0 +1,79 @@
+"""
+Content-addressed on-disk storage for the screenshots kept in the agent history.
+
+Keeping every step's screenshot in memory as a base64 string adds up to hundreds of MB over a long run,
+so history items only keep the path of their screenshot, named after the hash of its content. Identical
+screenshots (e.g. consecutive steps on a page that didn't change) are only stored once, and each store keeps
+its most recently used screenshots in memory, as the last few of them are sent to the LLM again.
+Serialized histories still embed the screenshots, so saved histories don't depend on the store's files.
+"""
+
+import base64
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from browser_use.llm.messages import get_base64_image_media_type
+
+logger = logging.getLogger(__name__)
+
+# enough for the last few steps (MessageManager images_per_step) of an agent
+MAX_CACHED_SCREENSHOTS = 16
+
+
+def load_screenshot(path: str | Path) -> str | None:
+	"""Load a stored screenshot as base64, or None if it no longer exists"""
+	try:
+		return base64.b64encode(Path(path).read_bytes()).decode()
+	except OSError as e:
+		logger.warning(f'⚠️ Could not load screenshot from {path}: {type(e).__name__}: {e}')
+		return None
+
+
+class ScreenshotStore:
+	"""Stores base64 screenshots as image files named after the hash of their content"""
+
+	def __init__(self, directory: str | Path):
+		self.directory = Path(directory).expanduser()
+		# screenshot path -> base64 screenshot, paths are content-addressed so a cached entry can never go stale
+		self._cached_screenshots: OrderedDict[str, str] = OrderedDict()
+		self._cached_screenshots_lock = threading.Lock()
+
+	def _cache_screenshot(self, path: str, screenshot: str) -> None:
+		with self._cached_screenshots_lock:
+			self._cached_screenshots[path] = screenshot
+			self._cached_screenshots.move_to_end(path)
+			while len(self._cached_screenshots) > MAX_CACHED_SCREENSHOTS:
+				self._cached_screenshots.popitem(last=False)
+
+	def store(self, screenshot: str) -> str:
+		"""Store a base64 screenshot (if it isn't already stored) and return the path to load it back from"""
+		digest = hashlib.blake2b(screenshot.encode(), digest_size=16).hexdigest()
+		extension = get_base64_image_media_type(screenshot).removeprefix('image/').replace('jpeg', 'jpg')
+		path = self.directory / f'{digest}.{extension}'
+
+		if not path.exists():
+			self.directory.mkdir(parents=True, exist_ok=True)
+			# write to a temporary file first, so a concurrent reader never sees a partially written image
+			tmp_path = path.with_suffix(f'.{threading.get_ident()}.tmp')
+			tmp_path.write_bytes(base64.b64decode(screenshot))
+			tmp_path.replace(path)
+
+		self._cache_screenshot(str(path), screenshot)
+		return str(path)
+
+	def load(self, path: str | Path) -> str | None:
+		"""Load a stored screenshot as base64 (from memory if it was used recently), or None if it no longer exists"""
+		path = str(path)
+		with self._cached_screenshots_lock:
+			screenshot = self._cached_screenshots.get(path)
+			if screenshot is not None:
+				self._cached_screenshots.move_to_end(path)
+				return screenshot
+
+		screenshot = load_screenshot(path)
+		if screenshot is not None:
+			self._cache_screenshot(path, screenshot)
+		return screenshot
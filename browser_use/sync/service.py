@@ -3,9 +3,13 @@ Cloud sync service for sending events to the Browser Use cloud.
 """
 
 import asyncio
+import gzip
 import json
 import logging
+import os
 import shutil
+import tempfile
+from pathlib import Path
 
 import anyio
 import httpx
@@ -17,10 +21,52 @@ from browser_use.sync.auth import TEMP_USER_ID, DeviceAuthClient
 logger = logging.getLogger(__name__)
 
 
-class CloudSync:
-	"""Service for syncing events to the Browser Use cloud"""
+def _rewrite_wal_user_ids(wal_path: Path, user_id: str, device_id: str | None) -> None:
+	"""Set user_id and device_id on every event of a WAL file.
+
+	The events are rewritten one line at a time to a temp file that then replaces the WAL, so the memory used doesn't grow
+	with the size of the WAL (step events embed a screenshot each).
+	"""
+	tmp_path = None
+	try:
+		with (
+			open(wal_path, encoding='utf-8') as wal_file,
+			tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=wal_path.parent, suffix='.tmp', delete=False) as tmp_file,
+		):
+			tmp_path = tmp_file.name
+			for line in wal_file:
+				if not line.strip():
+					continue
+				event = json.loads(line)
+				if 'user_id' in event:
+					event['user_id'] = user_id
+				# Add device_id to all events
+				event['device_id'] = device_id
+				tmp_file.write(json.dumps(event) + '\n')
+		os.replace(tmp_path, wal_path)
+	except BaseException:
+		if tmp_path:
+			Path(tmp_path).unlink(missing_ok=True)
+		raise
+
 
-	def __init__(self, base_url: str | None = None, enable_auth: bool = True):
+class CloudSync:
+	"""Service for syncing events to the Browser Use cloud
+
+	Events are queued by handle_event() and uploaded in batches by a background task, so the agent never waits on the
+	sync endpoint. A batch is sent as soon as batch_size events are queued, or flush_interval seconds after its first event.
+	"""
+
+	def __init__(
+		self,
+		base_url: str | None = None,
+		enable_auth: bool = True,
+		batch_size: int = 50,
+		flush_interval: float = 1.0,
+		max_queue_size: int = 1000,
+		max_retries: int = 3,
+		compress: bool = False,
+	):
 		# Backend API URL for all API requests - can be passed directly or defaults to env var
 		self.base_url = base_url or CONFIG.BROWSER_USE_CLOUD_API_URL
 		self.enable_auth = enable_auth
@@ -29,8 +75,18 @@ class CloudSync:
 		self.auth_task = None
 		self.session_id: str | None = None
 
+		self.batch_size = batch_size
+		self.flush_interval = flush_interval
+		self.max_retries = max_retries
+		self.compress = compress  # gzip the request bodies
+		self._queue: asyncio.Queue[BaseEvent] = asyncio.Queue(maxsize=max_queue_size)
+		self._uploader_task: asyncio.Task | None = None
+		self._flush_requested = asyncio.Event()  # set while flush() is waiting, to send partial batches right away
+		self._n_flushing = 0
+		self._client: httpx.AsyncClient | None = None  # reused by all uploads to keep connections alive
+
 	async def handle_event(self, event: BaseEvent) -> None:
-		"""Handle an event by sending it to the cloud"""
+		"""Handle an event by queueing it to be sent to the cloud"""
 		try:
 			# Extract session ID from CreateAgentSessionEvent
 			if event.event_type == 'CreateAgentSessionEvent' and hasattr(event, 'id'):
@@ -51,58 +107,147 @@ class CloudSync:
 						else:
 							logger.warning('Cannot start auth - session_id not set yet')
 
-			# Send event to cloud
-			await self._send_event(event)
+			# Queue event to be sent to cloud by the uploader
+			self._enqueue(event)
 
 		except Exception as e:
 			logger.error(f'Failed to handle {event.event_type} event: {type(e).__name__}: {e}', exc_info=True)
 
+	def _enqueue(self, event: BaseEvent) -> None:
+		if self._queue.full():
+			# the sync endpoint can't keep up (or is down), drop the oldest event rather than growing without bounds
+			dropped = self._queue.get_nowait()
+			self._queue.task_done()
+			logger.warning(f'⚠️ Cloud sync queue is full, dropping {dropped.event_type} event')
+		self._queue.put_nowait(event)
+
+		if self._uploader_task is None or self._uploader_task.done():
+			self._uploader_task = asyncio.create_task(self._upload_events())
+
+	async def _upload_events(self) -> None:
+		"""Background task sending the queued events in batches"""
+		loop = asyncio.get_running_loop()
+		while True:
+			batch = [await self._queue.get()]
+			deadline = loop.time() + self.flush_interval
+			try:
+				while len(batch) < self.batch_size:
+					if not self._queue.empty():
+						batch.append(self._queue.get_nowait())
+						continue
+					remaining = deadline - loop.time()
+					if remaining <= 0 or self._flush_requested.is_set():
+						break
+					# wait for the next event, unless flush() wants the batch sent right away
+					next_event = asyncio.ensure_future(self._queue.get())
+					flush_requested = asyncio.ensure_future(self._flush_requested.wait())
+					await asyncio.wait({next_event, flush_requested}, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+					flush_requested.cancel()
+					if next_event.done():
+						batch.append(next_event.result())
+					else:
+						next_event.cancel()  # the event stays in the queue for the next batch
+				await self._send_events(batch)
+			finally:
+				for _ in batch:
+					self._queue.task_done()
+
+	async def flush(self, timeout: float | None = None) -> None:
+		"""Send all queued events right away and wait until they are sent (or for timeout seconds)"""
+		self._n_flushing += 1
+		self._flush_requested.set()
+		try:
+			await asyncio.wait_for(self._queue.join(), timeout=timeout)
+		except TimeoutError:
+			logger.warning(f'⚠️ Cloud sync could not send {self._queue.qsize()} events within {timeout}s')
+		finally:
+			self._n_flushing -= 1
+			if not self._n_flushing:
+				self._flush_requested.clear()
+
+	async def close(self, timeout: float | None = 10.0) -> None:
+		"""Send the queued events, then stop the uploader and close its connections"""
+		await self.flush(timeout=timeout)
+		if self._uploader_task:
+			self._uploader_task.cancel()
+			await asyncio.gather(self._uploader_task, return_exceptions=True)
+			self._uploader_task = None
+		if self._client:
+			await self._client.aclose()
+			self._client = None
+
 	async def _send_event(self, event: BaseEvent) -> None:
-		"""Send event to cloud API"""
+		"""Send a single event to cloud API right away"""
+		await self._send_events([event])
+
+	async def _send_events(self, events: list[BaseEvent]) -> None:
+		"""Send a batch of events to cloud API in one request, retrying with backoff if the backend is unavailable"""
 		try:
 			headers = {}
 
-			# override user_id on event with auth client user_id if available
-			if self.auth_client:
-				event.user_id = str(self.auth_client.user_id)  # type: ignore
-			else:
-				event.user_id = TEMP_USER_ID  # type: ignore
+			# override user_id on events with auth client user_id if available
+			for event in events:
+				if self.auth_client:
+					event.user_id = str(self.auth_client.user_id)  # type: ignore
+				else:
+					event.user_id = TEMP_USER_ID  # type: ignore
 
 			# Add auth headers if available
 			if self.auth_client:
 				headers.update(self.auth_client.get_headers())
 
-			# Send event (batch format with direct BaseEvent serialization)
-			async with httpx.AsyncClient() as client:
-				# Serialize event and add device_id to all events
+			# Serialize events and add device_id to all events (batch format with direct BaseEvent serialization)
+			events_data = []
+			for event in events:
 				event_data = event.model_dump(mode='json')
 				if self.auth_client and self.auth_client.device_id:
 					event_data['device_id'] = self.auth_client.device_id
-
-				response = await client.post(
-					f'{self.base_url.rstrip("/")}/api/v1/events',
-					json={'events': [event_data]},
-					headers=headers,
-					timeout=10.0,
-				)
-
-				if response.status_code == 401 and self.auth_client and not self.auth_client.is_authenticated:
-					# Store event for retry after auth
-					self.pending_events.append(event)
-				elif response.status_code >= 400:
-					# Log error but don't raise - we want to fail silently
-					logger.debug(
-						f'Failed to send sync event: POST {response.request.url} {response.status_code} - {response.text}'
-					)
+				events_data.append(event_data)
+
+			content = json.dumps({'events': events_data}).encode()
+			headers['Content-Type'] = 'application/json'
+			if self.compress:
+				# step events carry a base64 screenshot each, which compresses well
+				content = gzip.compress(content)
+				headers['Content-Encoding'] = 'gzip'
+
+			response = await self._post_events(content, headers)
+
+			if response.status_code == 401 and self.auth_client and not self.auth_client.is_authenticated:
+				# Store events for retry after auth
+				self.pending_events.extend(events)
+			elif response.status_code >= 400:
+				# Log error but don't raise - we want to fail silently
+				logger.debug(f'Failed to send sync events: POST {response.request.url} {response.status_code} - {response.text}')
 		except httpx.TimeoutException:
-			logger.warning(f'⚠️ Event send timed out after 10 seconds: {event}')
+			logger.warning(f'⚠️ Sending {len(events)} events timed out after 10 seconds')
 		except httpx.ConnectError as e:
 			# logger.warning(f'⚠️ Failed to connect to cloud service at {self.base_url}: {e}')
 			pass
 		except httpx.HTTPError as e:
-			logger.warning(f'⚠️ HTTP error sending event {event}: {type(e).__name__}: {e}')
+			logger.warning(f'⚠️ HTTP error sending {len(events)} events: {type(e).__name__}: {e}')
 		except Exception as e:
-			logger.warning(f'⚠️ Unexpected error sending event {event}: {type(e).__name__}: {e}')
+			logger.warning(f'⚠️ Unexpected error sending {len(events)} events: {type(e).__name__}: {e}')
+
+	async def _post_events(self, content: bytes, headers: dict[str, str]) -> httpx.Response:
+		"""POST a batch of events, retrying with exponential backoff while the backend times out or is overloaded"""
+		if self._client is None:
+			self._client = httpx.AsyncClient(timeout=10.0)
+		url = f'{self.base_url.rstrip("/")}/api/v1/events'
+
+		for attempt in range(self.max_retries):
+			try:
+				response = await self._client.post(url, content=content, headers=headers)
+				if response.status_code != 429 and response.status_code < 500:
+					return response
+			except httpx.TimeoutException:
+				pass
+			# connection errors are not retried: nothing is listening (e.g. sync is pointed at a backend that isn't running)
+			# and retrying would only delay the next batches and shutdown
+			await asyncio.sleep(0.5 * 2**attempt)
+
+		# last attempt, its errors are handled by the caller
+		return await self._client.post(url, content=content, headers=headers)
 
 	async def _background_auth(self, agent_session_id: str) -> None:
 		"""Run authentication in background or show cloud URL if already authenticated"""
@@ -142,14 +287,10 @@ class CloudSync:
 		if not self.pending_events:
 			return
 
-		# Send all pending events
-		for event in self.pending_events:
-			try:
-				await self._send_event(event)
-			except Exception as e:
-				logger.warning(f'Failed to resend pending event: {e}')
-
-		self.pending_events.clear()
+		# Send all pending events in batches
+		pending_events, self.pending_events = self.pending_events, []
+		for i in range(0, len(pending_events), self.batch_size):
+			await self._send_events(pending_events[i : i + self.batch_size])
 
 	async def _update_wal_user_ids(self, session_id: str) -> None:
 		"""Update user IDs in WAL file after authentication"""
@@ -162,25 +303,7 @@ class CloudSync:
 					f'CloudSync failed to update saved event user_ids after auth: Agent EventBus WAL file not found: {wal_path}'
 				)
 
-			# Read all events
-			events = []
-			content = await anyio.Path(wal_path).read_text()
-			for line in content.splitlines():
-				if line.strip():
-					events.append(json.loads(line))
-
-			# Update user_id and device_id
-			user_id = self.auth_client.user_id
-			device_id = self.auth_client.device_id
-			for event in events:
-				if 'user_id' in event:
-					event['user_id'] = user_id
-				# Add device_id to all events
-				event['device_id'] = device_id
-
-			# Write back
-			updated_content = '\n'.join(json.dumps(event) for event in events) + '\n'
-			await anyio.Path(wal_path).write_text(updated_content)
+			await asyncio.to_thread(_rewrite_wal_user_ids, wal_path, self.auth_client.user_id, self.auth_client.device_id)
 
 		except Exception as e:
 			logger.warning(f'Failed to update WAL user IDs: {e}')
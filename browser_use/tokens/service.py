@@ -1,13 +1,17 @@
 """
 Token cost service that tracks LLM token usage and costs.
 
-Fetches pricing data from LiteLLM repository and caches it for 1 day.
+Fetches pricing data from LiteLLM repository and caches the fields we use for 1 day, refreshing it in the background.
+Works offline from the pricing snapshot bundled with the package.
 Automatically tracks token usage when LLMs are registered and invoked.
 """
 
 import asyncio
+import bisect
+import json
 import logging
 import os
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -19,7 +23,6 @@ from dotenv import load_dotenv
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.views import ChatInvokeUsage
 from browser_use.tokens.views import (
-	CachedPricingData,
 	ModelPricing,
 	ModelUsageStats,
 	ModelUsageTokens,
@@ -43,10 +46,73 @@ def xdg_cache_home() -> Path:
 	return default
 
 
+PRICING_SNAPSHOT_FILE = Path(__file__).parent / 'pricing_snapshot.json'
+CACHE_TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+
+# the only fields of the LiteLLM pricing data that ModelPricing uses
+PRICING_FIELDS = (
+	'input_cost_per_token',
+	'output_cost_per_token',
+	'max_tokens',
+	'max_input_tokens',
+	'max_output_tokens',
+	'cache_read_input_token_cost',
+	'cache_creation_input_token_cost',
+)
+
+
+def _index_pricing_data(litellm_data: dict[str, Any]) -> dict[str, dict[str, Any]]:
+	"""Keep only the fields we use from the LiteLLM pricing data (a few % of its size), keyed by model name"""
+	return {
+		model: {field: data[field] for field in PRICING_FIELDS if data.get(field) is not None}
+		for model, data in litellm_data.items()
+		if isinstance(data, dict)
+	}
+
+
+@dataclass(slots=True)
+class _UsageTotals:
+	"""Running totals of the token usage (and its cost) of one model"""
+
+	invocations: int = 0
+	prompt_tokens: int = 0
+	prompt_cached_tokens: int = 0
+	completion_tokens: int = 0
+	prompt_cost: float = 0.0
+	prompt_cached_cost: float = 0.0
+	completion_cost: float = 0.0
+
+	def add(self, usage: ChatInvokeUsage, cost: TokenCostCalculated | None) -> None:
+		self.invocations += 1
+		self.prompt_tokens += usage.prompt_tokens
+		self.prompt_cached_tokens += usage.prompt_cached_tokens or 0
+		self.completion_tokens += usage.completion_tokens
+		if cost:
+			self.prompt_cost += cost.prompt_cost
+			self.prompt_cached_cost += cost.prompt_read_cached_cost or 0
+			self.completion_cost += cost.completion_cost
+
+	def __sub__(self, other: '_UsageTotals') -> '_UsageTotals':
+		return _UsageTotals(
+			invocations=self.invocations - other.invocations,
+			prompt_tokens=self.prompt_tokens - other.prompt_tokens,
+			prompt_cached_tokens=self.prompt_cached_tokens - other.prompt_cached_tokens,
+			completion_tokens=self.completion_tokens - other.completion_tokens,
+			prompt_cost=self.prompt_cost - other.prompt_cost,
+			prompt_cached_cost=self.prompt_cached_cost - other.prompt_cached_cost,
+			completion_cost=self.completion_cost - other.completion_cost,
+		)
+
+
 class TokenCost:
-	"""Service for tracking token usage and calculating costs"""
+	"""Service for tracking token usage and calculating costs
+
+	The cost of every usage entry is calculated once when it is added, and running totals are kept per model, so usage
+	summaries don't get slower as the history grows.
+	"""
 
 	CACHE_DIR_NAME = 'browser_use/token_cost'
+	CACHE_FILE_PREFIX = 'pricing_index_'
 	CACHE_DURATION = timedelta(days=1)
 	PRICING_URL = 'https://raw.githubusercontent.com/BerriAI/litellm/main/model_prices_and_context_window.json'
 
@@ -56,8 +122,16 @@ class TokenCost:
 		self.usage_history: list[TokenUsageEntry] = []
 		self.registered_llms: dict[str, BaseChatModel] = {}
 		self._pricing_data: dict[str, Any] | None = None
+		self._model_pricing: dict[str, ModelPricing | None] = {}  # parsed from _pricing_data on first use
+		self._pricing_from_snapshot = False  # _pricing_data is the bundled snapshot, which only has the most common models
 		self._initialized = False
 		self._cache_dir = xdg_cache_home() / self.CACHE_DIR_NAME
+		self._refresh_task: asyncio.Task | None = None
+
+		# per model: when each entry was added, and the running totals up to and including that entry
+		self._usage_timestamps: dict[str, list[datetime]] = {}
+		self._usage_totals: dict[str, list[_UsageTotals]] = {}
+		self._totals_need_costs = False  # entries were added before pricing data was loaded
 
 	async def initialize(self) -> None:
 		"""Initialize the service by loading pricing data"""
@@ -67,99 +141,73 @@ class TokenCost:
 			self._initialized = True
 
 	async def _load_pricing_data(self) -> None:
-		"""Load pricing data from cache or fetch from GitHub"""
-		# Try to find a valid cache file
-		cache_file = await self._find_valid_cache()
-
-		if cache_file:
+		"""Load pricing data from the newest cached pricing index, or the bundled snapshot, refreshing it in the background if stale"""
+		cache_file = self._find_newest_cache()
+		if cache_file is not None:
 			await self._load_from_cache(cache_file)
-		else:
-			await self._fetch_and_cache_pricing_data()
 
-	async def _find_valid_cache(self) -> Path | None:
-		"""Find the most recent valid cache file"""
-		try:
-			# Ensure cache directory exists
-			self._cache_dir.mkdir(parents=True, exist_ok=True)
+		if self._pricing_data is None:
+			# works offline, with the prices the package was released with
+			await self._load_from_cache(PRICING_SNAPSHOT_FILE)
+			self._pricing_from_snapshot = self._pricing_data is not None
 
-			# List all JSON files in the cache directory
-			cache_files = list(self._cache_dir.glob('*.json'))
-
-			if not cache_files:
-				return None
+		is_stale = cache_file is None or datetime.now() - self._get_cache_timestamp(cache_file) >= self.CACHE_DURATION
+		if is_stale and (self._refresh_task is None or self._refresh_task.done()):
+			self._refresh_task = asyncio.create_task(self._fetch_and_cache_pricing_data())
 
-			# Sort by modification time (most recent first)
-			cache_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-
-			# Check each file until we find a valid one
-			for cache_file in cache_files:
-				if await self._is_cache_valid(cache_file):
-					return cache_file
-				else:
-					# Clean up old cache files
-					try:
-						os.remove(cache_file)
-					except Exception:
-						pass
-
-			return None
+	def _find_newest_cache(self) -> Path | None:
+		"""Find the most recent pricing index in the cache dir (their timestamps are in their filenames)"""
+		try:
+			cache_files = sorted(self._cache_dir.glob(f'{self.CACHE_FILE_PREFIX}*.json'))
 		except Exception:
 			return None
+		return cache_files[-1] if cache_files else None
 
-	async def _is_cache_valid(self, cache_file: Path) -> bool:
-		"""Check if a specific cache file is valid and not expired"""
+	def _get_cache_timestamp(self, cache_file: Path) -> datetime:
 		try:
-			if not cache_file.exists():
-				return False
-
-			# Read the cached data
-			async with aiofiles.open(cache_file, 'r') as f:
-				content = await f.read()
-				cached = CachedPricingData.model_validate_json(content)
-
-			# Check if cache is still valid
-			return datetime.now() - cached.timestamp < self.CACHE_DURATION
-		except Exception:
-			return False
+			return datetime.strptime(cache_file.stem.removeprefix(self.CACHE_FILE_PREFIX), CACHE_TIMESTAMP_FORMAT)
+		except ValueError:
+			return datetime.min
 
 	async def _load_from_cache(self, cache_file: Path) -> None:
-		"""Load pricing data from a specific cache file"""
+		"""Load pricing data from a pricing index file"""
 		try:
 			async with aiofiles.open(cache_file, 'r') as f:
 				content = await f.read()
-				cached = CachedPricingData.model_validate_json(content)
-				self._pricing_data = cached.data
+			self._set_pricing_data(json.loads(content)['models'])
 		except Exception as e:
-			print(f'Error loading cached pricing data from {cache_file}: {e}')
-			# Fall back to fetching
-			await self._fetch_and_cache_pricing_data()
+			logger.debug(f'Error loading pricing data from {cache_file}: {type(e).__name__}: {e}')
+
+	def _set_pricing_data(self, pricing_data: dict[str, Any]) -> None:
+		self._pricing_data = pricing_data
+		self._pricing_from_snapshot = False
+		self._model_pricing = {}
+		# the costs of the existing entries use the new prices too
+		self._totals_need_costs = bool(self.usage_history)
 
 	async def _fetch_and_cache_pricing_data(self) -> None:
-		"""Fetch pricing data from LiteLLM GitHub and cache it with timestamp"""
+		"""Fetch pricing data from LiteLLM GitHub, and cache the fields we use as a pricing index named after its timestamp"""
 		try:
 			async with httpx.AsyncClient() as client:
 				response = await client.get(self.PRICING_URL, timeout=30)
 				response.raise_for_status()
 
-				self._pricing_data = response.json()
-
-			# Create cache object with timestamp
-			cached = CachedPricingData(timestamp=datetime.now(), data=self._pricing_data or {})
+			pricing_data = _index_pricing_data(response.json())
+			self._set_pricing_data(pricing_data)
 
 			# Ensure cache directory exists
 			self._cache_dir.mkdir(parents=True, exist_ok=True)
 
-			# Create cache file with timestamp in filename
-			timestamp_str = datetime.now().strftime('%Y%m%d_%H%M%S')
-			cache_file = self._cache_dir / f'pricing_{timestamp_str}.json'
-
+			timestamp = datetime.now()
+			cache_file = self._cache_dir / f'{self.CACHE_FILE_PREFIX}{timestamp.strftime(CACHE_TIMESTAMP_FORMAT)}.json'
 			async with aiofiles.open(cache_file, 'w') as f:
-				await f.write(cached.model_dump_json(indent=2))
+				await f.write(json.dumps({'timestamp': timestamp.isoformat(), 'models': pricing_data}))
+
+			await self.clean_old_caches()
 
 		except Exception as e:
-			print(f'Error fetching pricing data: {e}')
-			# Fall back to empty pricing data
-			self._pricing_data = {}
+			# the pricing data that is already loaded (cached or bundled) is used until the next refresh
+			logger.debug(f'Error fetching pricing data: {type(e).__name__}: {e}')
 
 	async def get_model_pricing(self, model_name: str) -> ModelPricing | None:
 		"""Get pricing information for a specific model"""
@@ -167,11 +215,29 @@ class TokenCost:
 		if not self._initialized:
 			await self.initialize()
 
-		if not self._pricing_data or model_name not in self._pricing_data:
+		return self._get_loaded_model_pricing(model_name)
+
+	def _get_loaded_model_pricing(self, model_name: str) -> ModelPricing | None:
+		if model_name in self._model_pricing:
+			return self._model_pricing[model_name]
+
+		if not self._pricing_data:
+			return None
+
+		if model_name not in self._pricing_data:
+			# remembered until the pricing data changes, so this is only logged once per model
+			self._model_pricing[model_name] = None
+			if self._pricing_from_snapshot:
+				logger.debug(
+					f'No pricing for model {model_name} in the bundled pricing snapshot, its cost is not calculated '
+					f'until the pricing data is refreshed from {self.PRICING_URL}'
+				)
+			else:
+				logger.debug(f'No pricing for model {model_name}, its cost is not calculated')
 			return None
 
 		data = self._pricing_data[model_name]
-		return ModelPricing(
+		pricing = self._model_pricing[model_name] = ModelPricing(
 			model=model_name,
 			input_cost_per_token=data.get('input_cost_per_token'),
 			output_cost_per_token=data.get('output_cost_per_token'),
@@ -181,12 +247,23 @@ class TokenCost:
 			cache_read_input_token_cost=data.get('cache_read_input_token_cost'),
 			cache_creation_input_token_cost=data.get('cache_creation_input_token_cost'),
 		)
+		return pricing
 
 	async def calculate_cost(self, model: str, usage: ChatInvokeUsage) -> TokenCostCalculated | None:
 		if not self.include_cost:
 			return None
 
-		data = await self.get_model_pricing(model)
+		if not self._initialized:
+			await self.initialize()
+
+		return self._calculate_loaded_cost(model, usage)
+
+	def _calculate_loaded_cost(self, model: str, usage: ChatInvokeUsage) -> TokenCostCalculated | None:
+		"""Calculate the cost of a usage with the pricing data that is already loaded"""
+		if not self.include_cost:
+			return None
+
+		data = self._get_loaded_model_pricing(model)
 		if data is None:
 			return None
 
@@ -211,7 +288,7 @@ class TokenCost:
 		)
 
 	def add_usage(self, model: str, usage: ChatInvokeUsage) -> TokenUsageEntry:
-		"""Add token usage entry to history (without calculating cost)"""
+		"""Add token usage entry to history, and to the running totals of its model"""
 		entry = TokenUsageEntry(
 			model=model,
 			timestamp=datetime.now(),
@@ -219,9 +296,50 @@ class TokenCost:
 		)
 
 		self.usage_history.append(entry)
+		self._add_to_totals(entry)
 
 		return entry
 
+	def _add_to_totals(self, entry: TokenUsageEntry) -> None:
+		timestamps = self._usage_timestamps.setdefault(entry.model, [])
+		totals = self._usage_totals.setdefault(entry.model, [])
+
+		if self.include_cost and not self._initialized:
+			self._totals_need_costs = True  # costed once the pricing data is loaded, see _ensure_totals_costed()
+		new_totals = replace(totals[-1]) if totals else _UsageTotals()
+		new_totals.add(entry.usage, self._calculate_loaded_cost(entry.model, entry.usage))
+
+		# keep timestamps sorted even if the clock goes backwards, so time windows can be found with bisect
+		timestamps.append(max(entry.timestamp, timestamps[-1]) if timestamps else entry.timestamp)
+		totals.append(new_totals)
+
+	def _reset_totals(self) -> None:
+		self._usage_timestamps = {}
+		self._usage_totals = {}
+		self._totals_need_costs = False
+
+	async def _ensure_totals_costed(self) -> None:
+		"""Recompute the running totals if entries were added before the pricing data was loaded"""
+		if not self._totals_need_costs:
+			return
+		await self.initialize()
+		self._reset_totals()
+		for entry in self.usage_history:
+			self._add_to_totals(entry)
+
+	def _get_totals(self, model: str, since: datetime | None = None) -> _UsageTotals:
+		"""Totals of the usage of a model (since a given time), in O(log n)"""
+		totals = self._usage_totals.get(model)
+		if not totals:
+			return _UsageTotals()
+		if since is None:
+			return totals[-1]
+
+		start = bisect.bisect_left(self._usage_timestamps[model], since)
+		if start == 0:
+			return totals[-1]
+		return totals[-1] - totals[start - 1]
+
 	# async def _log_non_usage_llm(self, llm: BaseChatModel) -> None:
 	# 	"""Log non-usage to the logger"""
 	# 	C_CYAN = '\033[96m'
@@ -347,85 +465,58 @@ class TokenCost:
 
 	def get_usage_tokens_for_model(self, model: str) -> ModelUsageTokens:
 		"""Get usage tokens for a specific model"""
-		filtered_usage = [u for u in self.usage_history if u.model == model]
+		totals = self._get_totals(model)
 
 		return ModelUsageTokens(
 			model=model,
-			prompt_tokens=sum(u.usage.prompt_tokens for u in filtered_usage),
-			prompt_cached_tokens=sum(u.usage.prompt_cached_tokens or 0 for u in filtered_usage),
-			completion_tokens=sum(u.usage.completion_tokens for u in filtered_usage),
-			total_tokens=sum(u.usage.prompt_tokens + u.usage.completion_tokens for u in filtered_usage),
+			prompt_tokens=totals.prompt_tokens,
+			prompt_cached_tokens=totals.prompt_cached_tokens,
+			completion_tokens=totals.completion_tokens,
+			total_tokens=totals.prompt_tokens + totals.completion_tokens,
 		)
 
 	async def get_usage_summary(self, model: str | None = None, since: datetime | None = None) -> UsageSummary:
-		"""Get summary of token usage and costs (costs calculated on-the-fly)"""
-		filtered_usage = self.usage_history
-
-		if model:
-			filtered_usage = [u for u in filtered_usage if u.model == model]
-
-		if since:
-			filtered_usage = [u for u in filtered_usage if u.timestamp >= since]
-
-		if not filtered_usage:
-			return UsageSummary(
-				total_prompt_tokens=0,
-				total_prompt_cost=0.0,
-				total_prompt_cached_tokens=0,
-				total_prompt_cached_cost=0.0,
-				total_completion_tokens=0,
-				total_completion_cost=0.0,
-				total_tokens=0,
-				total_cost=0.0,
-				entry_count=0,
-			)
+		"""Get summary of token usage and costs (from the running totals of each model)"""
+		await self._ensure_totals_costed()
 
-		# Calculate totals
-		total_prompt = sum(u.usage.prompt_tokens for u in filtered_usage)
-		total_completion = sum(u.usage.completion_tokens for u in filtered_usage)
-		total_tokens = total_prompt + total_completion
-		total_prompt_cached = sum(u.usage.prompt_cached_tokens or 0 for u in filtered_usage)
-		models = list({u.model for u in filtered_usage})
+		models = [model] if model else list(self._usage_totals)
 
-		# Calculate per-model stats with record-by-record cost calculation
+		# Calculate per-model stats and overall totals
 		model_stats: dict[str, ModelUsageStats] = {}
-		total_prompt_cost = 0.0
-		total_completion_cost = 0.0
-		total_prompt_cached_cost = 0.0
-
-		for entry in filtered_usage:
-			if entry.model not in model_stats:
-				model_stats[entry.model] = ModelUsageStats(model=entry.model)
-
-			stats = model_stats[entry.model]
-			stats.prompt_tokens += entry.usage.prompt_tokens
-			stats.completion_tokens += entry.usage.completion_tokens
-			stats.total_tokens += entry.usage.prompt_tokens + entry.usage.completion_tokens
-			stats.invocations += 1
-
-			if self.include_cost:
-				# Calculate cost record by record using the updated calculate_cost function
-				cost = await self.calculate_cost(entry.model, entry.usage)
-				if cost:
-					total_prompt_cost += cost.prompt_cost
-					total_completion_cost += cost.completion_cost
-					total_prompt_cached_cost += cost.prompt_read_cached_cost or 0
-
-		# Calculate averages
-		for stats in model_stats.values():
-			if stats.invocations > 0:
-				stats.average_tokens_per_invocation = stats.total_tokens / stats.invocations
+		overall = _UsageTotals()
+		for model_name in models:
+			totals = self._get_totals(model_name, since)
+			if not totals.invocations:
+				continue
+
+			total_tokens = totals.prompt_tokens + totals.completion_tokens
+			model_stats[model_name] = ModelUsageStats(
+				model=model_name,
+				prompt_tokens=totals.prompt_tokens,
+				completion_tokens=totals.completion_tokens,
+				total_tokens=total_tokens,
+				cost=totals.prompt_cost + totals.completion_cost,
+				invocations=totals.invocations,
+				average_tokens_per_invocation=total_tokens / totals.invocations,
+			)
+			overall.invocations += totals.invocations
+			overall.prompt_tokens += totals.prompt_tokens
+			overall.prompt_cached_tokens += totals.prompt_cached_tokens
+			overall.completion_tokens += totals.completion_tokens
+			overall.prompt_cost += totals.prompt_cost
+			overall.prompt_cached_cost += totals.prompt_cached_cost
+			overall.completion_cost += totals.completion_cost
 
 		return UsageSummary(
-			total_prompt_tokens=total_prompt,
-			total_prompt_cost=total_prompt_cost,
-			total_prompt_cached_tokens=total_prompt_cached,
-			total_prompt_cached_cost=total_prompt_cached_cost,
-			total_completion_tokens=total_completion,
-			total_completion_cost=total_completion_cost,
-			total_tokens=total_tokens,
-			total_cost=total_prompt_cost + total_completion_cost + total_prompt_cached_cost,
-			entry_count=len(filtered_usage),
+			total_prompt_tokens=overall.prompt_tokens,
+			total_prompt_cost=overall.prompt_cost,
+			total_prompt_cached_tokens=overall.prompt_cached_tokens,
+			total_prompt_cached_cost=overall.prompt_cached_cost,
+			total_completion_tokens=overall.completion_tokens,
+			total_completion_cost=overall.completion_cost,
+			total_tokens=overall.prompt_tokens + overall.completion_tokens,
+			total_cost=overall.prompt_cost + overall.completion_cost + overall.prompt_cached_cost,
+			entry_count=overall.invocations,
 			by_model=model_stats,
 		)
 
@@ -491,20 +582,10 @@ class TokenCost:
 
 			# Format cost display (only if cost tracking is enabled)
 			if self.include_cost:
-				# Calculate per-model costs on-the-fly
-				total_model_cost = 0.0
-				model_prompt_cost = 0.0
-				model_completion_cost = 0.0
-
-				# Calculate costs for this model
-				for entry in self.usage_history:
-					if entry.model == model:
-						cost = await self.calculate_cost(entry.model, entry.usage)
-						if cost:
-							model_prompt_cost += cost.prompt_cost
-							model_completion_cost += cost.completion_cost
-
-				total_model_cost = model_prompt_cost + model_completion_cost
+				model_totals = self._get_totals(model)
+				model_prompt_cost = model_totals.prompt_cost
+				model_completion_cost = model_totals.completion_cost
+				total_model_cost = stats.cost
 
 				if total_model_cost > 0:
 					cost_part = f' (${C_MAGENTA}{total_model_cost:.4f}{C_RESET})'
@@ -533,6 +614,7 @@ class TokenCost:
 	def clear_history(self) -> None:
 		"""Clear usage history"""
 		self.usage_history = []
+		self._reset_totals()
 
 	async def refresh_pricing_data(self) -> None:
 		"""Force refresh of pricing data from GitHub"""
@@ -542,17 +624,17 @@ class TokenCost:
 	async def clean_old_caches(self, keep_count: int = 3) -> None:
 		"""Clean up old cache files, keeping only the most recent ones"""
 		try:
-			# List all JSON files in the cache directory
 			cache_files = list(self._cache_dir.glob('*.json'))
 
-			if len(cache_files) <= keep_count:
-				return
+			# Full LiteLLM files cached by older versions are never used anymore
+			old_cache_files = [f for f in cache_files if not f.name.startswith(self.CACHE_FILE_PREFIX)]
 
-			# Sort by modification time (oldest first)
-			cache_files.sort(key=lambda f: f.stat().st_mtime)
+			# Pricing indexes sort by the timestamp in their filename (oldest first)
+			pricing_indexes = sorted(f for f in cache_files if f.name.startswith(self.CACHE_FILE_PREFIX))
+			old_cache_files += pricing_indexes[: max(len(pricing_indexes) - keep_count, 0)]
 
 			# Remove all but the most recent files
-			for cache_file in cache_files[:-keep_count]:
+			for cache_file in old_cache_files:
 				try:
 					os.remove(cache_file)
 				except Exception:
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, TypeVar
+from typing import TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -61,13 +61,6 @@ class ModelPricing(BaseModel):
 	max_output_tokens: int | None
 
 
-class CachedPricingData(BaseModel):
-	"""Cached pricing data with timestamp"""
-
-	timestamp: datetime
-	data: dict[str, Any]
-
-
 class ModelUsageStats(BaseModel):
 	"""Usage statistics for a single model"""
 
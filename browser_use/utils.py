@@ -2,11 +2,12 @@ import asyncio
 import logging
 import os
 import platform
+import re
 import signal
 import time
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Iterable
 from fnmatch import fnmatch
-from functools import cache, wraps
+from functools import cache, lru_cache, wraps
 from pathlib import Path
 from sys import stderr
 from typing import Any, ParamSpec, TypeVar
@@ -529,6 +530,234 @@ def match_url_with_domain_pattern(url: str, domain_pattern: str, log_warnings: b
 		return False
 
 
+_GLOB_CHARS = frozenset('*?[')
+
+
+class _DomainPatternSet:
+	"""The domain parts of the patterns sharing one scheme pattern, indexed for lookup by hostname"""
+
+	def __init__(self) -> None:
+		self.exact: dict[str, list[int]] = {}  # example.com -> pattern indices
+		self.suffixes: dict[str, list[int]] = {}  # *.example.com -> pattern indices, keyed by example.com
+		self.any_domain: list[int] = []  # *
+		self.globs: list[tuple[int, str]] = []  # the other wildcard patterns that are allowed, e.g. example.*.com
+
+	def add(self, index: int, pattern_domain: str, exact_only: bool = False) -> None:
+		# like match_url_with_domain_pattern, any pattern matches a hostname that is literally equal to it
+		self.exact.setdefault(pattern_domain, []).append(index)
+		if exact_only:
+			return
+
+		if pattern_domain == '*':
+			self.any_domain.append(index)
+		elif pattern_domain.startswith('*.') and not _GLOB_CHARS.intersection(pattern_domain[2:]):
+			self.suffixes.setdefault(pattern_domain[2:], []).append(index)
+		elif '*' in pattern_domain:
+			self.globs.append((index, pattern_domain))
+
+	def match(self, domain: str, matched: set[int]) -> None:
+		matched.update(self.exact.get(domain, ()))
+		matched.update(self.any_domain)
+
+		if self.suffixes:
+			# *.example.com matches example.com and all its subdomains, so look up the hostname and each of its parent domains
+			suffix = domain
+			while True:
+				matched.update(self.suffixes.get(suffix, ()))
+				dot = suffix.find('.')
+				if dot == -1:
+					break
+				suffix = suffix[dot + 1 :]
+
+		for index, pattern_domain in self.globs:
+			if pattern_domain.startswith('*.'):
+				parent_domain = pattern_domain[2:]
+				if domain == parent_domain or fnmatch(domain, parent_domain):
+					matched.add(index)
+					continue
+			if fnmatch(domain, pattern_domain):
+				matched.add(index)
+
+
+class DomainMatcher:
+	"""
+	Matches URLs against a list of domain patterns. SECURITY CRITICAL.
+
+	Same pattern syntax and results as match_url_with_domain_pattern(), but the patterns are parsed and validated
+	once up front, exact and *.domain patterns are looked up by hostname instead of being tried one by one (so a
+	large allow-list costs about the same per URL as a small one), and the results for recent URLs are cached.
+
+	Build one matcher per list of patterns and keep it around, compiling the patterns is O(number of patterns).
+	"""
+
+	def __init__(self, domain_patterns: Iterable[str], log_warnings: bool = False, cache_size: int = 1024):
+		self.domain_patterns = tuple(domain_patterns)
+
+		# scheme -> domain patterns, plus the (few) scheme globs like http*:// that have to be fnmatched
+		self._by_scheme: dict[str, _DomainPatternSet] = {}
+		self._by_scheme_glob: dict[str, _DomainPatternSet] = {}
+
+		for index, domain_pattern in enumerate(self.domain_patterns):
+			pattern_scheme, pattern_domain, is_supported = self._parse_pattern(domain_pattern, log_warnings)
+			by_scheme = self._by_scheme_glob if _GLOB_CHARS.intersection(pattern_scheme) else self._by_scheme
+			by_scheme.setdefault(pattern_scheme, _DomainPatternSet()).add(index, pattern_domain, exact_only=not is_supported)
+
+		self._matching_pattern_indices = lru_cache(maxsize=cache_size)(self._find_matching_pattern_indices)
+
+	@staticmethod
+	def _parse_pattern(domain_pattern: str, log_warnings: bool = False) -> tuple[str, str, bool]:
+		"""Split a pattern into (scheme, domain, is_supported), unsafe wildcard patterns are not supported"""
+		domain_pattern = domain_pattern.lower()
+
+		if '://' in domain_pattern:
+			pattern_scheme, pattern_domain = domain_pattern.split('://', 1)
+		else:
+			pattern_scheme = 'https'  # Default to matching only https for security
+			pattern_domain = domain_pattern
+
+		# Strip ports from patterns, we only match against the hostname of the URL
+		if ':' in pattern_domain and not pattern_domain.startswith(':'):
+			pattern_domain = pattern_domain.split(':', 1)[0]
+
+		if '*' in pattern_domain and pattern_domain != '*':
+			error = None
+			# *.*.domain and example.* are unsafe
+			if pattern_domain.count('*.') > 1 or pattern_domain.count('.*') > 1:
+				error = f'⛔️ Multiple wildcards in pattern=[{domain_pattern}] are not supported'
+			elif pattern_domain.endswith('.*'):
+				error = f'⛔️ Wildcard TLDs like in pattern=[{domain_pattern}] are not supported for security'
+			elif '*' in pattern_domain.replace('*.', ''):
+				error = f'⛔️ Only *.domain style patterns are supported, ignoring pattern=[{domain_pattern}]'
+			if error:
+				if log_warnings:
+					logger.error(error)
+				return pattern_scheme, pattern_domain, False
+
+		return pattern_scheme, pattern_domain, True
+
+	def _find_matching_pattern_indices(self, url: str) -> tuple[int, ...]:
+		# Note: new tab pages should be handled at the callsite, not here
+		if is_new_tab_page(url):
+			return ()
+
+		try:
+			parsed_url = urlparse(url)
+			scheme = parsed_url.scheme.lower() if parsed_url.scheme else ''
+			domain = parsed_url.hostname.lower() if parsed_url.hostname else ''
+		except Exception as e:
+			logger.error(f'⛔️ Error matching URL {url} with domain patterns: {type(e).__name__}: {e}')
+			return ()
+
+		if not scheme or not domain:
+			return ()
+
+		matched: set[int] = set()
+		if scheme in self._by_scheme:
+			self._by_scheme[scheme].match(domain, matched)
+		for pattern_scheme, domain_patterns in self._by_scheme_glob.items():
+			if fnmatch(scheme, pattern_scheme):
+				domain_patterns.match(domain, matched)
+		return tuple(sorted(matched))
+
+	def matching_patterns(self, url: str) -> list[str]:
+		"""Get all the patterns that match the URL, in the order they were given"""
+		return [self.domain_patterns[index] for index in self._matching_pattern_indices(url)]
+
+	def first_matching_pattern(self, url: str) -> str | None:
+		"""Get the first of the patterns that matches the URL, or None if none of them match"""
+		indices = self._matching_pattern_indices(url)
+		return self.domain_patterns[indices[0]] if indices else None
+
+	def matches(self, url: str) -> bool:
+		"""Check if the URL matches any of the patterns"""
+		return bool(self._matching_pattern_indices(url))
+
+
+SECRET_PLACEHOLDER_PATTERN = re.compile(r'<secret>(.*?)</secret>')
+
+
+def _literal_trie_pattern(literals: Iterable[str]) -> str:
+	"""
+	Build a regex matching any of the literals, shaped like a trie of them: at each position only the branch
+	starting with the current character is tried, and the longest literal starting at a position wins.
+	"""
+	trie: dict[str, dict] = {}
+	for literal in literals:
+		node = trie
+		for char in literal:
+			node = node.setdefault(char, {})
+		node[''] = {}  # end of a literal
+
+	def to_pattern(node: dict[str, dict]) -> str:
+		# collapse runs of single-child nodes into one literal, so the nesting only grows where literals branch off
+		prefix = []
+		while len(node) == 1 and '' not in node:
+			(char, node), *_ = node.items()
+			prefix.append(char)
+
+		branches = [re.escape(char) + to_pattern(child) for char, child in node.items() if char]
+		pattern = branches[0] if len(branches) == 1 else f'(?:{"|".join(branches)})' if branches else ''
+		if pattern and '' in node:
+			# the greedy ? tries the longer literals first and only falls back to ending here if they don't match
+			pattern = f'(?:{pattern})?'
+		return re.escape(''.join(prefix)) + pattern
+
+	return to_pattern(trie)
+
+
+class SensitiveDataRedactor:
+	"""
+	Replaces the values of sensitive_data with their <secret>placeholder</secret> tags, and back.
+
+	The secret values are compiled once into a single trie-shaped regex, so a text is redacted in one pass
+	no matter how many secrets there are. Where secrets overlap the longest one is replaced, and if several
+	placeholders share the same value the first one is used.
+	"""
+
+	def __init__(self, sensitive_data: dict[str, str | dict[str, str]] | None):
+		# secret value -> placeholder name, for every domain: values are hidden from the LLM wherever they show up
+		self.placeholders: dict[str, str] = {}
+		for key_or_domain, content in (sensitive_data or {}).items():
+			if isinstance(content, dict):
+				# New format: {domain: {key: value}}
+				for key, value in content.items():
+					if value:  # Skip empty values
+						self.placeholders.setdefault(value, key)
+			elif content:
+				# Old format: {key: value}
+				self.placeholders.setdefault(content, key_or_domain)
+
+		self._pattern = re.compile(_literal_trie_pattern(self.placeholders)) if self.placeholders else None
+
+	def __bool__(self) -> bool:
+		return self._pattern is not None
+
+	def redact(self, text: str) -> str:
+		"""Replace every secret value in the text with its <secret>placeholder</secret> tag"""
+		if self._pattern is None:
+			return text
+		return self._pattern.sub(lambda match: f'<secret>{self.placeholders[match.group()]}</secret>', text)
+
+	@staticmethod
+	def restore(text: str, secrets: dict[str, str], used_placeholders: set[str], missing_placeholders: set[str]) -> str:
+		"""
+		Replace every <secret>placeholder</secret> tag in the text with the value in secrets, in one pass.
+
+		Placeholders that were replaced are added to used_placeholders, tags for placeholders that are not in
+		secrets are kept as they are and added to missing_placeholders.
+		"""
+
+		def replace(match: re.Match[str]) -> str:
+			placeholder = match.group(1)
+			if placeholder in secrets:
+				used_placeholders.add(placeholder)
+				return secrets[placeholder]
+			missing_placeholders.add(placeholder)
+			return match.group()
+
+		return SECRET_PLACEHOLDER_PATTERN.sub(replace, text)
+
+
 def merge_dicts(a: dict, b: dict, path: tuple[str, ...] = ()):
 	for key in b:
 		if key in a:
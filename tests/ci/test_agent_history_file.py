@@ -0,0 +1,76 @@
+"""
+Tests for saving the agent history step by step to a JSONL file and loading it back.
+"""
+
+import json
+
+from browser_use.agent.views import ActionResult, AgentHistory, AgentHistoryList, AgentOutput, StepMetadata
+from browser_use.browser.views import BrowserStateHistory
+from browser_use.controller.service import Controller
+
+ActionModel = Controller().registry.create_action_model()
+AgentOutputModel = AgentOutput.type_with_custom_actions(ActionModel)
+
+
+def history_item(step: int) -> AgentHistory:
+	model_output = AgentOutputModel.model_validate(
+		{
+			'evaluation_previous_goal': 'Success',
+			'memory': f'Step {step}',
+			'next_goal': f'Go to page {step}',
+			'action': [{'go_to_url': {'url': f'https://example.com/{step}', 'new_tab': False}}],
+		}
+	)
+	return AgentHistory(
+		model_output=model_output,
+		result=[ActionResult(extracted_content=f'Navigated to page {step}', include_in_memory=True)],
+		state=BrowserStateHistory(
+			url=f'https://example.com/{step - 1}', title='Example', tabs=[], interacted_element=[None], screenshot_path=None
+		),
+		metadata=StepMetadata(step_start_time=step, step_end_time=step + 1, step_number=step),
+	)
+
+
+def test_history_is_appended_one_step_per_line(tmp_path):
+	history_file = tmp_path / 'history' / 'agent_history.jsonl'
+	items = [history_item(step) for step in range(1, 4)]
+
+	AgentHistoryList.append_to_file(history_file, items[:1])
+	AgentHistoryList.append_to_file(history_file, items[1:])
+
+	lines = history_file.read_text().splitlines()
+	assert len(lines) == 3
+	assert [json.loads(line) for line in lines] == [item.model_dump() for item in items]
+
+	loaded = AgentHistoryList.load_from_file(history_file, AgentOutputModel)
+	assert loaded.model_dump() == AgentHistoryList(history=items).model_dump()
+	assert loaded.urls() == ['https://example.com/0', 'https://example.com/1', 'https://example.com/2']
+	assert loaded.model_actions()[2]['go_to_url']['url'] == 'https://example.com/3'
+
+
+def test_history_file_is_read_lazily_and_survives_crashes(tmp_path):
+	history_file = tmp_path / 'agent_history.jsonl'
+	AgentHistoryList.append_to_file(history_file, [history_item(1), history_item(2)])
+
+	# the process crashed in the middle of writing step 3, and the run was resumed afterwards
+	with open(history_file, 'a') as f:
+		f.write(json.dumps(history_item(3).model_dump())[:100])
+	AgentHistoryList.append_to_file(history_file, [history_item(4)])
+	AgentHistoryList.append_to_file(history_file, [history_item(5)])
+
+	steps = AgentHistoryList.iter_from_file(history_file, AgentOutputModel)
+	first = next(steps)
+	assert isinstance(first, AgentHistory)
+	assert first.metadata and first.metadata.step_number == 1
+	assert [step.metadata.step_number for step in steps if step.metadata] == [2, 4, 5]
+
+
+def test_json_history_files_still_load(tmp_path):
+	history = AgentHistoryList(history=[history_item(1), history_item(2)])
+	history_file = tmp_path / 'AgentHistory.json'
+	history.save_to_file(history_file)
+
+	assert AgentHistoryList.load_from_file(history_file, AgentOutputModel).model_dump() == history.model_dump()
+	assert [step.model_dump() for step in AgentHistoryList.iter_from_file(history_file, AgentOutputModel)] == [
+		step.model_dump() for step in history.history
+	]
@@ -0,0 +1,97 @@
+"""
+Tests for AgentPool: many agents in one event loop over a bounded number of shared browsers.
+"""
+
+import asyncio
+
+from browser_use import AgentPool, BrowserProfile
+from browser_use.agent.pool import _PooledLLM
+from browser_use.llm.clients import get_shared_http_client, release_shared_clients, use_shared_clients
+from tests.ci.conftest import create_mock_llm
+
+
+class FakeLLM:
+	model = 'fake-llm'
+
+	def __init__(self):
+		self.running = 0
+		self.max_running = 0
+		self.calls: list[str] = []
+
+	async def ainvoke(self, messages, output_format=None):
+		self.calls.append(messages[0])
+		self.running += 1
+		self.max_running = max(self.max_running, self.running)
+		await asyncio.sleep(0.01)
+		self.running -= 1
+		return messages[0]
+
+
+async def test_pooled_llm_limits_concurrent_calls_in_fifo_order():
+	llm = FakeLLM()
+	semaphore = asyncio.Semaphore(2)
+	agents_llms = [_PooledLLM(llm, semaphore) for _ in range(10)]  # type: ignore[arg-type]
+
+	results = await asyncio.gather(*(pooled.ainvoke([f'call {i}']) for i, pooled in enumerate(agents_llms)))  # type: ignore[list-item]
+
+	assert results == [f'call {i}' for i in range(10)]
+	assert llm.max_running == 2
+	assert llm.calls == [f'call {i}' for i in range(10)]
+	# everything else is delegated to the shared llm
+	assert agents_llms[0].model == 'fake-llm'
+
+
+async def test_pooled_llm_wrappers_are_per_agent():
+	llm = FakeLLM()
+	first, second = _PooledLLM(llm, None), _PooledLLM(llm, None)  # type: ignore[arg-type]
+
+	async def wrapped(messages, output_format=None):
+		return 'wrapped'
+
+	setattr(first, 'ainvoke', wrapped)
+
+	assert await first.ainvoke(['call']) == 'wrapped'
+	assert await second.ainvoke(['call']) == 'call'
+
+
+async def test_agent_pool_only_releases_its_own_use_of_the_shared_clients(monkeypatch):
+	pool = AgentPool(llm=FakeLLM())  # type: ignore[arg-type]
+
+	async def run_task(task, max_steps, **agent_kwargs):
+		return task
+
+	monkeypatch.setattr(pool, '_run_task', run_task)
+
+	# another agent on the same loop that never went through the pool
+	use_shared_clients()
+	http_client = get_shared_http_client()
+
+	assert await pool.run_task('task') == 'task'
+	await pool.close()
+	assert not http_client.is_closed
+
+	await release_shared_clients()
+	assert http_client.is_closed
+
+
+async def test_agent_pool_runs_tasks_in_shared_browser(httpserver):
+	httpserver.expect_request('/').respond_with_data('<html><body><h1>Pool</h1></body></html>')
+
+	async with AgentPool(
+		llm=create_mock_llm(),
+		browser_profile=BrowserProfile(headless=True, user_data_dir=None),
+		max_browsers=1,
+		max_agents_per_browser=3,
+		max_concurrent_llm_calls=2,
+		max_queued_tasks=4,
+	) as pool:
+		histories = await pool.run_tasks([f'task {i}' for i in range(5)], max_steps=2)
+
+		assert len(histories) == 5
+		assert all(history.is_done() for history in histories)
+		# all agents ran in the one browser, and their contexts were recycled for the next tasks
+		assert pool.n_browsers == 1
+		assert pool.n_running_agents == 0
+		assert pool.browser_pool.n_ready == 3
+
+	assert pool.n_browsers == 0
@@ -0,0 +1,107 @@
+"""
+Tests for BrowserPool: pre-launched browsers handing out clean, recycled browser contexts.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from browser_use import BrowserPool, BrowserProfile
+from browser_use.browser import pool as browser_pool
+from browser_use.browser.pool import _WarmBrowser, _WarmContext
+from browser_use.browser.views import BrowserError
+
+
+def test_warm_context_tracks_visited_origins():
+	warm_context = _WarmContext(browser_session=MagicMock(), warm_browser=_WarmBrowser(browser_session=MagicMock()))
+
+	for url in [
+		'https://example.com/login?next=/',
+		'https://example.com/account',
+		'http://localhost:8080/page',
+		'about:blank',
+		'chrome://new-tab-page/',
+		'data:text/html,<h1>hi</h1>',
+	]:
+		warm_context._track_url(url)
+
+	assert warm_context.visited_origins == {'https://example.com', 'http://localhost:8080'}
+
+
+async def test_acquire_fails_when_browsers_cant_be_launched(monkeypatch):
+	monkeypatch.setattr(browser_pool, 'LAUNCH_RETRY_DELAYS', (0, 0))
+	pool = BrowserPool(browser_profile=BrowserProfile(headless=True, user_data_dir=None))
+	launches = 0
+
+	async def add_browser():
+		nonlocal launches
+		launches += 1
+		raise RuntimeError('no browser installed')
+
+	monkeypatch.setattr(pool, '_add_browser', add_browser)
+
+	# the waiting acquire() calls are woken up with the error once the retries are exhausted, instead of waiting forever
+	results = await asyncio.wait_for(asyncio.gather(pool.acquire(), pool.acquire(), return_exceptions=True), timeout=5)
+	assert all(isinstance(result, BrowserError) and 'no browser installed' in str(result) for result in results)
+	assert launches == 3
+
+	# the next acquire() launches again
+	with pytest.raises(BrowserError):
+		await asyncio.wait_for(pool.acquire(), timeout=5)
+	assert launches == 6
+
+	await pool.close()
+
+
+async def test_browser_pool_recycles_clean_contexts(httpserver):
+	httpserver.expect_request('/').respond_with_data(
+		'<html><body><script>localStorage.setItem("seen", "yes")</script></body></html>',
+		headers={'Set-Cookie': 'session=secret'},
+		content_type='text/html',
+	)
+	httpserver.expect_request('/check').respond_with_data('<html><body>check</body></html>', content_type='text/html')
+	url = httpserver.url_for('/')
+
+	async with BrowserPool(browser_profile=BrowserProfile(headless=True, user_data_dir=None), size=1) as pool:
+		assert pool.n_browsers == 1
+		assert pool.n_ready == 1
+
+		async with pool.session() as browser_session:
+			assert pool.n_in_use == 1
+			page = await browser_session.navigate(url)
+			await browser_session.create_new_tab('about:blank')
+			assert await page.evaluate('localStorage.getItem("seen")') == 'yes'
+			assert await browser_session.get_cookies()
+
+		assert pool.n_in_use == 0
+		assert pool.n_ready == 1
+
+		async with pool.session() as recycled_session:
+			# same warm context, but nothing of the previous task is left in it
+			assert recycled_session is browser_session
+			assert recycled_session.browser_context is not None
+			assert len(recycled_session.browser_context.pages) == 1
+			assert await recycled_session.get_cookies() == []
+			page = await recycled_session.navigate(httpserver.url_for('/check'))
+			assert await page.evaluate('localStorage.getItem("seen")') is None
+
+	assert pool.n_browsers == 0
+
+
+async def test_browser_pool_retires_browsers_after_max_uses():
+	async with BrowserPool(
+		browser_profile=BrowserProfile(headless=True, user_data_dir=None), size=1, max_uses_per_browser=2
+	) as pool:
+		first_browser = pool._browsers[0]
+
+		for _ in range(2):
+			async with pool.session() as browser_session:
+				assert browser_session.browser is first_browser.browser_session.browser
+
+		# the retired browser was replaced by a fresh one
+		browser_session = await pool.acquire(timeout=30)
+		assert browser_session.browser is not first_browser.browser_session.browser
+		assert not first_browser.is_connected
+		assert pool.n_browsers == 1
+		await pool.release(browser_session)
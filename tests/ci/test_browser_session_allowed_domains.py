@@ -101,3 +101,17 @@ class TestUrlAllowlistSecurity:
 		# Shouldn't match potentially malicious domains with a similar structure
 		# This demonstrates why the previous pattern was risky and why it's now rejected
 		assert browser_session._is_url_allowed('https://www.google.evil.com') is False
+
+	def test_allowed_domains_are_compiled_once(self):
+		"""Test that the allow-list is only compiled again when a new list is assigned."""
+		browser_profile = BrowserProfile(allowed_domains=['example.com'], headless=True, user_data_dir=None)
+		browser_session = BrowserSession(browser_profile=browser_profile)
+
+		assert browser_session._is_url_allowed('https://example.com') is True
+		matcher = browser_session._allowed_domains_matcher
+		assert browser_session._is_url_allowed('https://example.org') is False
+		assert browser_session._allowed_domains_matcher is matcher
+
+		browser_session.browser_profile.allowed_domains = ['example.org']
+		assert browser_session._is_url_allowed('https://example.org') is True
+		assert browser_session._is_url_allowed('https://example.com') is False
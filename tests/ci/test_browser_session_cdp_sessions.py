@@ -0,0 +1,117 @@
+"""
+Tests for the per-page CDP session pool of BrowserSession (_get_cdp_session / _send_cdp_command).
+"""
+
+import pytest
+
+from browser_use.browser import BrowserProfile, BrowserSession
+
+
+class FakeCDPSession:
+	def __init__(self, fail: bool = False):
+		self.fail = fail
+		self.detached = False
+		self.sent = []
+
+	async def send(self, method, params=None):
+		if self.fail:
+			raise Exception('Target page, context or browser has been closed')
+		self.sent.append(method)
+		return {'method': method}
+
+	async def detach(self):
+		self.detached = True
+
+
+class FakeContext:
+	def __init__(self):
+		self.created: list[FakeCDPSession] = []
+		self.fail_next = False
+
+	async def new_cdp_session(self, page):
+		cdp_session = FakeCDPSession(fail=self.fail_next)
+		self.fail_next = False
+		self.created.append(cdp_session)
+		return cdp_session
+
+
+class FakePage:
+	def __init__(self, context: FakeContext):
+		self.context = context
+		self.close_listeners = []
+		self.closed = False
+
+	def once(self, event, listener):
+		assert event == 'close'
+		self.close_listeners.append(listener)
+
+	def is_closed(self):
+		return self.closed
+
+	def close(self):
+		self.closed = True
+		for listener in self.close_listeners:
+			listener(self)
+
+
+@pytest.fixture
+def browser_session():
+	return BrowserSession(browser_profile=BrowserProfile(user_data_dir=None))
+
+
+async def test_cdp_session_is_reused_per_page(browser_session):
+	context = FakeContext()
+	page, other_page = FakePage(context), FakePage(context)
+
+	await browser_session._send_cdp_command(page, 'Page.captureScreenshot')  # type: ignore[arg-type]
+	await browser_session._send_cdp_command(page, 'Input.synthesizeScrollGesture')  # type: ignore[arg-type]
+	await browser_session._send_cdp_command(other_page, 'Page.captureScreenshot')  # type: ignore[arg-type]
+
+	assert len(context.created) == 2
+	assert context.created[0].sent == ['Page.captureScreenshot', 'Input.synthesizeScrollGesture']
+	assert not any(cdp_session.detached for cdp_session in context.created)
+
+	# closing the page drops its session from the pool
+	page.close()
+	assert list(browser_session._cdp_sessions) == [other_page]
+
+
+async def test_broken_cdp_session_is_replaced(browser_session):
+	context = FakeContext()
+	page = FakePage(context)
+
+	await browser_session._send_cdp_command(page, 'Page.captureScreenshot')  # type: ignore[arg-type]
+	context.created[0].fail = True
+
+	# the pooled session broke (e.g. the page navigated to another renderer process): retried once on a fresh one
+	assert await browser_session._send_cdp_command(page, 'Page.captureScreenshot') == {'method': 'Page.captureScreenshot'}  # type: ignore[arg-type]
+	assert len(context.created) == 2
+	assert context.created[0].detached
+	assert browser_session._cdp_sessions[page] is context.created[1]  # type: ignore[index]
+
+	# if the fresh session fails too, the error is raised and nothing broken stays in the pool
+	context.created[1].fail = True
+	context.fail_next = True
+	with pytest.raises(Exception, match='has been closed'):
+		await browser_session._send_cdp_command(page, 'Page.captureScreenshot')  # type: ignore[arg-type]
+	assert len(context.created) == 3
+	assert page not in browser_session._cdp_sessions
+
+
+async def test_non_idempotent_cdp_command_is_not_retried(browser_session):
+	context = FakeContext()
+	page = FakePage(context)
+
+	await browser_session._send_cdp_command(page, 'Page.captureScreenshot')  # type: ignore[arg-type]
+	context.created[0].fail = True
+
+	# the command may already have run before the session broke, so it must not be sent a second time
+	with pytest.raises(Exception, match='has been closed'):
+		await browser_session._send_cdp_command(page, 'Input.synthesizeScrollGesture')  # type: ignore[arg-type]
+	assert len(context.created) == 1
+	assert context.created[0].detached
+	assert page not in browser_session._cdp_sessions
+
+	# the next command gets a fresh session
+	await browser_session._send_cdp_command(page, 'Input.synthesizeScrollGesture')  # type: ignore[arg-type]
+	assert context.created[1].sent == ['Input.synthesizeScrollGesture']
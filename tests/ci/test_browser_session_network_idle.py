@@ -0,0 +1,99 @@
+"""
+Tests for BrowserSession._wait_for_stable_network, driven by a fake page that emits playwright-style network events.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser.profile import compile_url_substring_matcher
+
+
+class FakePage:
+	def __init__(self):
+		self.listeners = {}
+
+	def on(self, event, listener):
+		self.listeners[event] = listener
+
+	def remove_listener(self, event, listener):
+		assert self.listeners.pop(event) is listener
+
+	async def emit(self, event, payload):
+		await self.listeners[event](payload)
+
+
+class FakeRequest:
+	def __init__(self, url: str, resource_type: str = 'script'):
+		self.url = url
+		self.resource_type = resource_type
+		self.headers = {}
+
+
+def fake_response(request, content_type: str = 'application/javascript'):
+	return SimpleNamespace(request=request, headers={'content-type': content_type})
+
+
+async def wait_for_stable_network(browser_session: BrowserSession, page: FakePage, traffic) -> float:
+	"""Run _wait_for_stable_network while traffic(page) plays network events, return how long it waited"""
+
+	async def get_current_page(self):
+		return page
+
+	with patch.object(BrowserSession, 'get_current_page', get_current_page):
+		loop = asyncio.get_running_loop()
+		start = loop.time()
+		waiter = asyncio.create_task(browser_session._wait_for_stable_network())
+		await asyncio.sleep(0)  # let the waiter attach its listeners
+		await traffic(page)
+		await waiter
+		return loop.time() - start
+
+
+async def test_returns_once_the_idle_window_has_passed():
+	browser_session = BrowserSession(
+		browser_profile=BrowserProfile(wait_for_network_idle_page_load_time=0.2, maximum_wait_page_load_time=5)
+	)
+	page = FakePage()
+
+	async def traffic(page):
+		request = FakeRequest('https://example.com/app.js')
+		await page.emit('request', request)
+		await asyncio.sleep(0.3)
+		await page.emit('response', fake_response(request))
+
+	elapsed = await wait_for_stable_network(browser_session, page, traffic)
+	# 0.3s of traffic + 0.2s idle window, not rounded up to a polling interval and far from the 5s timeout
+	assert 0.5 <= elapsed < 0.65
+	assert page.listeners == {}
+
+
+async def test_failed_and_ignored_requests_are_not_waited_for():
+	browser_session = BrowserSession(
+		browser_profile=BrowserProfile(
+			wait_for_network_idle_page_load_time=0.1,
+			maximum_wait_page_load_time=5,
+			network_idle_ignored_url_patterns=['never-finishes.example'],
+		)
+	)
+	page = FakePage()
+
+	async def traffic(page):
+		await page.emit('request', FakeRequest('https://NEVER-FINISHES.example/poll'))
+		failed = FakeRequest('https://example.com/broken.js')
+		await page.emit('request', failed)
+		await page.emit('requestfailed', failed)
+
+	elapsed = await wait_for_stable_network(browser_session, page, traffic)
+	assert elapsed < 0.3
+
+
+def test_ignored_url_matcher():
+	matcher = compile_url_substring_matcher(('analytics', 'crisp.chat', 'wss://'))
+	assert matcher is not None
+	assert matcher.search('https://www.google-analytics.com/collect')
+	assert matcher.search('wss://example.com/socket')
+	assert not matcher.search('https://crispXchat.example.com')  # patterns are literal substrings, not regexes
+	assert compile_url_substring_matcher(()) is None
+	assert BrowserProfile().network_idle_ignored_url_patterns  # the defaults ignore analytics, ads, chat widgets, ...
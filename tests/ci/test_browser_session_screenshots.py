@@ -4,9 +4,29 @@ Test that screenshots work correctly in headless browser mode.
 
 import asyncio
 import base64
+import struct
 import time
 
 from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.llm.messages import get_base64_image_media_type
+
+
+def jpeg_size(data: bytes) -> tuple[int, int]:
+	"""(width, height) from the SOF marker of a JPEG"""
+	offset = 2
+	while offset < len(data):
+		marker, length = struct.unpack('>HH', data[offset : offset + 4])
+		if marker in (0xFFC0, 0xFFC1, 0xFFC2):
+			height, width = struct.unpack('>HH', data[offset + 5 : offset + 9])
+			return width, height
+		offset += 2 + length
+	raise ValueError('no SOF marker found')
+
+
+def test_base64_image_media_type():
+	assert get_base64_image_media_type('iVBORw0KGgoAAAANSUhEUgAAAAQAAAAE') == 'image/png'
+	assert get_base64_image_media_type(base64.b64encode(b'\xff\xd8\xff\xe0').decode()) == 'image/jpeg'
+	assert get_base64_image_media_type(base64.b64encode(b'RIFF\x00\x00\x00\x00WEBPVP8 ').decode()) == 'image/webp'
 
 
 class TestHeadlessScreenshots:
@@ -373,3 +393,36 @@ class TestHeadlessScreenshots:
 
 		finally:
 			await browser_session.kill()
+
+	async def test_screenshot_format_and_max_size(self, httpserver):
+		"""Test that the BrowserProfile screenshot policy is applied at capture time"""
+		browser_session = BrowserSession(
+			browser_profile=BrowserProfile(
+				headless=True,
+				user_data_dir=None,
+				keep_alive=False,
+				viewport={'width': 1280, 'height': 800},
+				device_scale_factor=1,
+				screenshot_format='jpeg',
+				screenshot_quality=60,
+				screenshot_max_size={'width': 640, 'height': 640},
+				screenshot_grayscale=True,
+			)
+		)
+
+		try:
+			await browser_session.start()
+			httpserver.expect_request('/').respond_with_data(
+				'<html><body style="background: red"><h1>Screenshot policy</h1></body></html>',
+				content_type='text/html',
+			)
+			page = await browser_session.get_current_page()
+			await page.goto(httpserver.url_for('/'))
+
+			screenshot = await browser_session.take_screenshot()
+			assert screenshot is not None
+			assert get_base64_image_media_type(screenshot) == 'image/jpeg'
+			# downscaled to fit 640x640, keeping the aspect ratio of the 1280x800 viewport
+			assert jpeg_size(base64.b64decode(screenshot)) == (640, 400)
+		finally:
+			await browser_session.kill()
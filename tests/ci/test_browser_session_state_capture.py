@@ -0,0 +1,127 @@
+"""
+Tests for the concurrent state capture in BrowserSession._get_updated_state, with the browser round-trips faked.
+"""
+
+import asyncio
+from contextlib import ExitStack
+from unittest.mock import patch
+
+import pytest
+
+from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser.views import PageInfo, TabInfo
+from browser_use.dom.service import DomService
+from browser_use.dom.views import DOMElementNode, DOMState
+
+DELAY = 0.2
+
+
+class FakePage:
+	url = 'https://example.com/'
+
+	async def evaluate(self, expression):
+		return 1
+
+	async def title(self):
+		await asyncio.sleep(DELAY)
+		return 'Example'
+
+
+def fake_state_capture(browser_session: BrowserSession, events: list[str], fail: str | None = None) -> ExitStack:
+	"""Patch every browser round-trip of _get_updated_state with one that takes DELAY seconds"""
+	page = FakePage()
+
+	def component(name: str, result):
+		async def fake(*args, **kwargs):
+			events.append(f'{name} started')
+			await asyncio.sleep(DELAY)
+			if name == fail:
+				raise RuntimeError(f'{name} failed')
+			events.append(f'{name} done')
+			return result
+
+		return fake
+
+	async def get_current_page(self):
+		return page
+
+	async def no_op(*args, **kwargs):
+		return None
+
+	body = DOMElementNode(tag_name='body', xpath='/body', attributes={}, children=[], is_visible=True, parent=None)
+	page_info = PageInfo(
+		viewport_width=1280,
+		viewport_height=720,
+		page_width=1280,
+		page_height=720,
+		scroll_x=0,
+		scroll_y=0,
+		pixels_above=0,
+		pixels_below=0,
+		pixels_left=0,
+		pixels_right=0,
+	)
+	patches = ExitStack()
+	for target, name, replacement in [
+		(BrowserSession, 'get_current_page', get_current_page),
+		(BrowserSession, 'remove_highlights', no_op),
+		(BrowserSession, '_auto_download_pdf_if_needed', no_op),
+		(DomService, 'get_clickable_elements', component('dom', DOMState(element_tree=body, selector_map={0: body}))),
+		(BrowserSession, 'take_screenshot', component('screenshot', 'iVBORw0KGgo=')),
+		(BrowserSession, 'get_tabs_info', component('tabs', [TabInfo(page_id=0, url=page.url, title='Example')])),
+		(BrowserSession, 'get_page_info', component('page_info', page_info)),
+		(BrowserSession, 'get_scroll_info', component('scroll', (0, 100))),
+	]:
+		patches.enter_context(patch.object(target, name, replacement))
+	return patches
+
+
+async def test_components_are_captured_concurrently():
+	browser_session = BrowserSession(browser_profile=BrowserProfile(user_data_dir=None, highlight_elements=True))
+	events = []
+
+	with fake_state_capture(browser_session, events):
+		loop = asyncio.get_running_loop()
+		start = loop.time()
+		state = await browser_session._get_updated_state()
+		elapsed = loop.time() - start
+
+	# DOM processing followed by the screenshot of its highlights, everything else alongside: 2 round-trips instead of 6
+	assert elapsed < 3 * DELAY
+	assert events.index('dom done') < events.index('screenshot started')
+	assert state.title == 'Example'
+	assert state.screenshot == 'iVBORw0KGgo='
+	assert (state.pixels_above, state.pixels_below) == (0, 100)
+	assert [tab.title for tab in state.tabs] == ['Example']
+	assert list(state.selector_map) == [0]
+
+
+async def test_screenshot_runs_alongside_dom_processing_without_highlights():
+	browser_session = BrowserSession(browser_profile=BrowserProfile(user_data_dir=None, highlight_elements=False))
+	events = []
+
+	with fake_state_capture(browser_session, events):
+		await browser_session._get_updated_state()
+
+	assert events.index('screenshot started') < events.index('dom done')
+
+
+async def test_component_fallbacks_are_kept():
+	browser_session = BrowserSession(browser_profile=BrowserProfile(user_data_dir=None))
+
+	with fake_state_capture(browser_session, [], fail='screenshot'):
+		state = await browser_session._get_updated_state()
+	assert state.screenshot is None
+
+	with fake_state_capture(browser_session, [], fail='scroll'):
+		state = await browser_session._get_updated_state()
+	assert (state.pixels_above, state.pixels_below) == (0, 0)
+
+	# components without a fallback fail the capture, which then falls back to the last known good state
+	with fake_state_capture(browser_session, [], fail='tabs'):
+		assert await browser_session._get_updated_state() is browser_session.browser_state_summary
+
+	del browser_session.browser_state_summary
+	with fake_state_capture(browser_session, [], fail='page_info'):
+		with pytest.raises(RuntimeError, match='page_info failed'):
+			await browser_session._get_updated_state()
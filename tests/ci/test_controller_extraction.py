@@ -0,0 +1,138 @@
+"""
+Tests for the page content handling of the extract_structured_data action.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import markdownify
+import pytest
+
+from browser_use.controller import service as controller_service
+from browser_use.controller.extraction import get_page_markdown, split_into_chunks
+from browser_use.controller.service import Controller
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm.views import ChatInvokeCompletion
+
+
+def test_short_content_is_one_chunk():
+	assert split_into_chunks('line 1\nline 2\n', chunk_size=100, max_chunks=8) == ['line 1\nline 2\n']
+
+
+def test_chunks_are_cut_on_line_boundaries():
+	content = ''.join(f'item {i:03}\n' for i in range(100))  # 9 characters per line
+	chunks = split_into_chunks(content, chunk_size=100, max_chunks=20)
+
+	assert ''.join(chunks) == content
+	assert all(len(chunk) <= 100 and chunk.endswith('\n') for chunk in chunks)
+	assert len(chunks) == 10
+
+
+def test_lines_longer_than_a_chunk_are_split():
+	content = 'x' * 250
+	assert split_into_chunks(content, chunk_size=100, max_chunks=8) == ['x' * 100, 'x' * 100, 'x' * 50]
+
+
+@pytest.mark.parametrize('max_chunks', [1, 3])
+def test_content_beyond_max_chunks_loses_its_middle(max_chunks):
+	content = ''.join(f'item {i:04}\n' for i in range(1000))
+	chunks = split_into_chunks(content, chunk_size=100, max_chunks=max_chunks)
+
+	assert len(chunks) == max_chunks
+	joined = ''.join(chunks)
+	assert joined.startswith('item 0000\n')
+	assert joined.endswith('item 0999\n')
+	assert '... left out the middle because it was too long ...' in joined
+
+
+class RecordingLLM:
+	model = 'recording-llm'
+
+	def __init__(self):
+		self.prompts: list[str] = []
+
+	async def ainvoke(self, messages, output_format=None):
+		prompt = messages[0].content
+		self.prompts.append(prompt)
+		if prompt.startswith('You merge'):
+			return ChatInvokeCompletion(completion='{"items": "merged"}', usage=None)
+		return ChatInvokeCompletion(completion=f'{{"part": {len(self.prompts)}}}', usage=None)
+
+
+async def run_extraction(monkeypatch, tmp_path, content: str, llm: RecordingLLM, controller: Controller):
+	monkeypatch.setattr(controller_service, 'get_page_markdown', AsyncMock(return_value=content))
+	page = MagicMock(url='https://example.com/catalogue')
+	browser_session = MagicMock()
+	browser_session.get_current_page = AsyncMock(return_value=page)
+
+	return await controller.registry.execute_action(
+		'extract_structured_data',
+		{'query': 'all products', 'extract_links': False},
+		browser_session=browser_session,
+		page_extraction_llm=llm,  # type: ignore[arg-type]
+		file_system=FileSystem(tmp_path),
+	)
+
+
+async def test_short_pages_are_extracted_with_one_call(monkeypatch, tmp_path):
+	llm = RecordingLLM()
+	result = await run_extraction(monkeypatch, tmp_path, 'product 1\nproduct 2\n', llm, Controller())
+
+	assert len(llm.prompts) == 1
+	assert 'product 1\nproduct 2' in llm.prompts[0]
+	assert '{"part": 1}' in result.extracted_content
+
+
+async def test_long_pages_are_extracted_with_map_reduce(monkeypatch, tmp_path):
+	llm = RecordingLLM()
+	content = ''.join(f'product {i:05}\n' for i in range(6000))  # 84 000 characters, 3 chunks
+
+	result = await run_extraction(monkeypatch, tmp_path, content, llm, Controller(max_extraction_chunks=8))
+
+	chunk_prompts, merge_prompt = llm.prompts[:-1], llm.prompts[-1]
+	assert len(chunk_prompts) == 3
+	# nothing is left out: every product is in exactly one chunk
+	for i in (0, 2999, 5999):
+		assert sum(f'product {i:05}\n' in prompt for prompt in chunk_prompts) == 1
+	assert merge_prompt.startswith('You merge')
+	assert all(f'<part_{i}_result>' in merge_prompt for i in (1, 2, 3))
+	assert '{"items": "merged"}' in result.extracted_content
+
+
+async def test_map_reduce_is_opt_in(monkeypatch, tmp_path):
+	llm = RecordingLLM()
+	content = ''.join(f'product {i:05}\n' for i in range(6000))
+
+	await run_extraction(monkeypatch, tmp_path, content, llm, Controller())
+
+	assert len(llm.prompts) == 1
+	assert '... left out the middle because it was too long ...' in llm.prompts[0]
+
+
+async def test_page_markdown_is_cached_until_the_dom_changes(browser_session, httpserver, monkeypatch):
+	httpserver.expect_request('/catalogue').respond_with_data(
+		'<html><body><h1>Catalogue</h1><iframe src="/frame"></iframe></body></html>', content_type='text/html'
+	)
+	httpserver.expect_request('/frame').respond_with_data(
+		'<html><body><p>Framed product</p></body></html>', content_type='text/html'
+	)
+	page = await browser_session.navigate(httpserver.url_for('/catalogue'))
+
+	conversions = []
+	original_markdownify = markdownify.markdownify
+
+	def counting_markdownify(html, **kwargs):
+		conversions.append(html)
+		return original_markdownify(html, **kwargs)
+
+	monkeypatch.setattr(markdownify, 'markdownify', counting_markdownify)
+
+	first = await get_page_markdown(page, extract_links=False)
+	assert 'Catalogue' in first and 'Framed product' in first
+	assert len(conversions) == 2  # the page and its iframe
+
+	assert await get_page_markdown(page, extract_links=False) == first
+	assert len(conversions) == 2
+
+	await page.evaluate("document.body.insertAdjacentHTML('beforeend', '<p>New product</p>')")
+	assert 'New product' in await get_page_markdown(page, extract_links=False)
+	assert len(conversions) == 3  # only the page changed, the iframe is still cached
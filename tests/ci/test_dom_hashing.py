@@ -0,0 +1,137 @@
+"""
+Tests for element hashing (HistoryTreeProcessor.hash_tree and the per-element hashes built on top of it).
+"""
+
+from browser_use.dom.clickable_element_processor.service import ClickableElementProcessor
+from browser_use.dom.history_tree_processor.service import HistoryTreeIndex, HistoryTreeProcessor
+from browser_use.dom.history_tree_processor.view import DOMHistoryElement
+from browser_use.dom.views import DOMElementNode, DOMTextNode
+
+
+def build_tree() -> DOMElementNode:
+	body = DOMElementNode(tag_name='body', xpath='/body', attributes={}, children=[], is_visible=True, parent=None)
+	for i in range(3):
+		form = DOMElementNode(
+			tag_name='form', xpath=f'html/body/form[{i + 1}]', attributes={}, children=[], is_visible=True, parent=body
+		)
+		button = DOMElementNode(
+			tag_name='button',
+			xpath=f'html/body/form[{i + 1}]/button',
+			attributes={'type': 'submit', 'name': f'save-{i}'},
+			children=[],
+			is_visible=True,
+			highlight_index=i,
+			parent=form,
+		)
+		button.children.append(DOMTextNode(text='Save', is_visible=True, parent=button))
+		form.children.append(button)
+		body.children.append(form)
+	return body
+
+
+def all_elements(node: DOMElementNode) -> list[DOMElementNode]:
+	elements = [node]
+	for child in node.children:
+		if isinstance(child, DOMElementNode):
+			elements.extend(all_elements(child))
+	return elements
+
+
+def test_hash_tree_matches_hashing_each_element():
+	body = build_tree()
+	hashes = HistoryTreeProcessor.hash_tree(body)
+
+	assert list(hashes) == all_elements(body)  # document order
+	for element, hashed_element in hashes.items():
+		assert hashed_element == HistoryTreeProcessor._hash_dom_element(element)
+		assert element.hash is hashed_element
+
+	# hashing a subtree gives the same branch path hashes as hashing the whole tree
+	form = body.children[1]
+	assert isinstance(form, DOMElementNode)
+	assert HistoryTreeProcessor.hash_tree(form)[form].branch_path_hash == hashes[form].branch_path_hash
+
+
+def test_history_element_hashes_like_the_live_element():
+	button = build_tree().children[2].children[0]  # type: ignore[attr-defined]
+	assert isinstance(button, DOMElementNode)
+
+	history_element = DOMHistoryElement(
+		tag_name=button.tag_name,
+		xpath=button.xpath,
+		highlight_index=button.highlight_index,
+		entire_parent_branch_path=HistoryTreeProcessor._get_parent_branch_path(button),
+		attributes=button.attributes,
+	)
+	assert HistoryTreeProcessor._hash_dom_history_element(history_element) == button.hash
+	assert HistoryTreeProcessor.compare_history_element_and_dom_element(history_element, button)
+
+
+def test_branch_path_hash_depends_on_the_whole_path():
+	hash_path = HistoryTreeProcessor._parent_branch_path_hash
+	assert hash_path(['form', 'button']) != hash_path(['div', 'button'])
+	assert hash_path(['form', 'button']) != hash_path(['formbutton'])
+	assert hash_path(['a/b']) != hash_path(['a', 'b'])
+	assert hash_path([]) != hash_path([''])
+
+
+def test_clickable_element_hashes_are_stable_across_trees():
+	first, second = build_tree(), build_tree()
+	first_hashes = ClickableElementProcessor.get_clickable_elements_hashes(first)
+	assert first_hashes == ClickableElementProcessor.get_clickable_elements_hashes(second)
+
+	# an element moving to a different branch is a new element
+	moved = second.children[2].children[0]  # type: ignore[attr-defined]
+	assert isinstance(moved, DOMElementNode)
+	moved.tag_name = 'a'
+	for element in all_elements(second):
+		element._hash = None
+	assert ClickableElementProcessor.hash_dom_element(moved) not in first_hashes
+
+
+def history_element_for(element: DOMElementNode, **changes) -> DOMHistoryElement:
+	fields = {
+		'tag_name': element.tag_name,
+		'xpath': element.xpath,
+		'highlight_index': element.highlight_index,
+		'entire_parent_branch_path': HistoryTreeProcessor._get_parent_branch_path(element),
+		'attributes': element.attributes,
+	}
+	return DOMHistoryElement(**(fields | changes))
+
+
+def buttons(tree: DOMElementNode) -> list[DOMElementNode]:
+	return [element for element in all_elements(tree) if element.highlight_index is not None]
+
+
+def test_tree_index_finds_exact_matches():
+	recorded, replayed = build_tree(), build_tree()
+	index = HistoryTreeIndex(replayed)
+
+	for recorded_button, replayed_button in zip(buttons(recorded), buttons(replayed)):
+		history_element = history_element_for(recorded_button)
+		assert index.find(history_element) is replayed_button
+		assert HistoryTreeProcessor.find_history_element_in_tree(history_element, replayed) is replayed_button
+
+
+def test_tree_index_fuzzy_fallbacks():
+	tree = build_tree()
+	index = HistoryTreeIndex(tree)
+	second = buttons(tree)[1]
+
+	# the element moved: same attributes, different xpath and branch path
+	moved = history_element_for(second, xpath='html/body/div/button', entire_parent_branch_path=['div', 'button'])
+	assert index.find(moved) is None
+	assert index.find(moved, fuzzy=True) is second
+
+	# the element's attributes changed, but it is still at the same xpath
+	renamed = history_element_for(second, attributes={'type': 'submit', 'name': 'renamed'})
+	assert index.find(renamed) is None
+	assert index.find(renamed, fuzzy=True) is second
+
+	# both changed, or the match is ambiguous: no element is better than the wrong element
+	assert index.find(history_element_for(second, xpath='html/body/p', attributes={}), fuzzy=True) is None
+	ambiguous = history_element_for(second, xpath='html/body/p', attributes={'type': 'submit'})
+	for button in buttons(tree):
+		button.attributes = {'type': 'submit'}
+	assert HistoryTreeIndex(tree).find(ambiguous, fuzzy=True) is None
@@ -0,0 +1,257 @@
+"""
+Tests for incremental DOM snapshots (BrowserProfile(incremental_dom_snapshots=True)).
+
+The delta-patching logic is tested directly against DomService with hand-written buildDomTree
+results, the end-to-end behaviour is tested against a real page.
+"""
+
+import pytest
+
+from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.dom.service import DomService, DOMSnapshot
+from browser_use.dom.views import DOMElementNode, DOMTextNode
+
+
+def _element(tag_name: str, xpath: str, children: list[str], highlight_index: int | None = None) -> dict:
+	node = {
+		'tagName': tag_name,
+		'xpath': xpath,
+		'attributes': {},
+		'children': children,
+		'isVisible': True,
+		'isTopElement': True,
+	}
+	if highlight_index is not None:
+		node['isInteractive'] = True
+		node['highlightIndex'] = highlight_index
+	return node
+
+
+def _text(text: str) -> dict:
+	return {'type': 'TEXT_NODE', 'text': text, 'isVisible': True}
+
+
+FULL_SNAPSHOT = {
+	'mode': 'full',
+	'snapshotId': 'snap-1',
+	'rootId': '5',
+	'map': {
+		'0': _text('Home'),
+		'1': _element('a', 'html/body/a', ['0'], highlight_index=0),
+		'2': _text('Toast v1'),
+		'3': _element('div', 'html/body/div', ['2']),
+		'4': _element('button', 'html/body/button', [], highlight_index=1),
+		'5': _element('body', '/body', ['1', '3', '4']),
+	},
+}
+
+
+@pytest.fixture
+async def dom_service():
+	"""DomService that has already processed FULL_SNAPSHOT (no page needed for tree construction)."""
+	service = DomService(page=None)  # type: ignore[arg-type]
+	await service._construct_dom_tree(FULL_SNAPSHOT)
+	return service
+
+
+async def test_full_snapshot_is_kept_for_incremental_mode(dom_service):
+	snapshot = dom_service.snapshot
+	assert isinstance(snapshot, DOMSnapshot)
+	assert snapshot.snapshot_id == 'snap-1'
+	assert snapshot.element_tree.tag_name == 'body'
+	assert set(snapshot.node_map) == set(FULL_SNAPSHOT['map'])
+	assert set(snapshot.selector_map) == {0, 1}
+
+
+async def test_non_incremental_result_does_not_keep_a_snapshot():
+	service = DomService(page=None)  # type: ignore[arg-type]
+	non_incremental = {key: value for key, value in FULL_SNAPSHOT.items() if key not in ('mode', 'snapshotId')}
+	await service._construct_dom_tree(non_incremental)
+	assert service.snapshot is None
+
+
+SECOND_DELTA = {
+	'mode': 'delta',
+	'snapshotId': 'snap-2',
+	'baseSnapshotId': 'snap-1',
+	'rootId': '5',
+	'map': {
+		'6': _text('Toast v2'),
+		'7': _element('button', 'html/body/div/button', [], highlight_index=2),
+		'8': _element('div', 'html/body/div', ['6', '7']),
+	},
+	'replaced': {'3': '8'},
+	'removed': ['3', '2'],
+}
+
+
+async def test_delta_replaces_changed_subtree_in_a_copy(dom_service):
+	previous_tree = dom_service.snapshot.element_tree
+	previous_children = list(previous_tree.children)
+	previous_selector_map = dom_service.snapshot.selector_map
+	link = previous_selector_map[0]
+
+	root, selector_map = dom_service._apply_dom_delta(SECOND_DELTA)
+
+	# only the path to the changed subtree is copied, the previous tree is left alone
+	assert root is not previous_tree
+	assert previous_tree.children == previous_children
+	assert all(child.parent is previous_tree for child in previous_tree.children)
+	assert isinstance(previous_tree.children[1].children[0], DOMTextNode)
+	assert previous_tree.children[1].children[0].text == 'Toast v1'
+	assert root.children[0] is previous_tree.children[0]
+	assert root.children[0].parent is previous_tree  # shared nodes keep the parent of the tree they were built in
+	assert [child.tag_name for child in root.children if isinstance(child, DOMElementNode)] == ['a', 'div', 'button']
+
+	toast = root.children[1]
+	assert isinstance(toast, DOMElementNode)
+	assert toast.parent is root
+	assert isinstance(toast.children[0], DOMTextNode) and toast.children[0].text == 'Toast v2'
+	assert all(child.parent is toast for child in toast.children)
+
+	# untouched elements keep their identity and index, new ones are added
+	assert selector_map[0] is link
+	assert selector_map[2] is toast.children[1]
+	assert set(selector_map) == {0, 1, 2}
+
+	# the selector map handed out with the previous state is left alone
+	assert set(previous_selector_map) == {0, 1}
+	assert dom_service.snapshot.snapshot_id == 'snap-2'
+
+
+async def test_delta_applies_on_top_of_copied_nodes(dom_service):
+	dom_service._apply_dom_delta(SECOND_DELTA)
+	tree = dom_service.snapshot.element_tree
+
+	# the next delta finds the copied body through node_map, and copies it again
+	root, selector_map = dom_service._apply_dom_delta(
+		{
+			'mode': 'delta',
+			'snapshotId': 'snap-3',
+			'baseSnapshotId': 'snap-2',
+			'rootId': '5',
+			'map': {'9': _element('button', 'html/body/button', [], highlight_index=1)},
+			'replaced': {'4': '9'},
+			'removed': ['4'],
+		}
+	)
+
+	assert root is not tree and dom_service.snapshot.node_map['5'] is root
+	assert [child.tag_name for child in root.children if isinstance(child, DOMElementNode)] == ['a', 'div', 'button']
+	assert selector_map[1] is root.children[2] and root.children[2].parent is root
+	assert tree.children[2] is not root.children[2]
+	assert set(selector_map) == {0, 1, 2}
+
+
+async def test_delta_under_a_shared_node_copies_the_latest_ancestors(dom_service):
+	# the first delta copies body, the div stays shared and its .parent still points to the first body
+	dom_service._apply_dom_delta(
+		{
+			'mode': 'delta',
+			'snapshotId': 'snap-2',
+			'baseSnapshotId': 'snap-1',
+			'rootId': '5',
+			'map': {'9': _element('button', 'html/body/button', [], highlight_index=1)},
+			'replaced': {'4': '9'},
+			'removed': ['4'],
+		}
+	)
+	tree = dom_service.snapshot.element_tree
+
+	root, _ = dom_service._apply_dom_delta(
+		{
+			'mode': 'delta',
+			'snapshotId': 'snap-3',
+			'baseSnapshotId': 'snap-2',
+			'rootId': '5',
+			'map': {'10': _text('Toast v2')},
+			'replaced': {'2': '10'},
+			'removed': ['2'],
+		}
+	)
+
+	# the path is copied from the latest tree, so the first delta's button is kept
+	assert root is not tree and root.children[2] is tree.children[2]
+	toast = root.children[1]
+	assert isinstance(toast, DOMElementNode) and toast is not tree.children[1] and toast.parent is root
+	assert isinstance(toast.children[0], DOMTextNode) and toast.children[0].text == 'Toast v2'
+
+
+async def test_delta_removes_subtree_and_its_highlight(dom_service):
+	root, selector_map = dom_service._apply_dom_delta(
+		{
+			'mode': 'delta',
+			'snapshotId': 'snap-2',
+			'baseSnapshotId': 'snap-1',
+			'rootId': '5',
+			'map': {},
+			'replaced': {'4': None},
+			'removed': ['4'],
+		}
+	)
+
+	assert [child.tag_name for child in root.children if isinstance(child, DOMElementNode)] == ['a', 'div']
+	assert set(selector_map) == {0}
+	assert '4' not in dom_service.snapshot.node_map
+
+
+async def test_delta_for_another_snapshot_is_rejected(dom_service):
+	with pytest.raises(ValueError):
+		dom_service._apply_dom_delta(
+			{
+				'mode': 'delta',
+				'snapshotId': 'snap-9',
+				'baseSnapshotId': 'snap-8',
+				'rootId': '5',
+				'map': {},
+				'replaced': {},
+				'removed': [],
+			}
+		)
+
+
+@pytest.fixture
+async def incremental_browser_session():
+	session = BrowserSession(
+		browser_profile=BrowserProfile(
+			user_data_dir=None,
+			headless=True,
+			incremental_dom_snapshots=True,
+		)
+	)
+	async with session:
+		yield session
+
+
+async def test_incremental_snapshot_matches_full_walk(incremental_browser_session, httpserver):
+	httpserver.expect_request('/').respond_with_data(
+		"""<html><body>
+			<a href="/one">One</a>
+			<div id="toasts"><span>Nothing yet</span></div>
+			<button id="save">Save</button>
+		</body></html>""",
+		content_type='text/html',
+	)
+	page = await incremental_browser_session.get_current_page()
+	await page.goto(httpserver.url_for('/'))
+
+	first = await incremental_browser_session.get_state_summary(cache_clickable_elements_hashes=False)
+	first_xpaths = {node.xpath for node in first.selector_map.values()}
+
+	await page.evaluate(
+		"""() => {
+			const toasts = document.getElementById('toasts');
+			toasts.innerHTML = '<span>Saved!</span><button id="undo">Undo</button>';
+		}"""
+	)
+	second = await incremental_browser_session.get_state_summary(cache_clickable_elements_hashes=False)
+
+	# the untouched elements keep their highlight indices across the delta
+	for index, node in first.selector_map.items():
+		if node.xpath in {n.xpath for n in second.selector_map.values()}:
+			assert second.selector_map[index].xpath == node.xpath
+
+	full = await DomService(page).get_clickable_elements(highlight_elements=False, viewport_expansion=500)
+	assert {node.xpath for node in second.selector_map.values()} == {node.xpath for node in full.selector_map.values()}
+	assert first_xpaths < {node.xpath for node in second.selector_map.values()}
+	assert 'Saved!' in second.element_tree.clickable_elements_to_string()
@@ -0,0 +1,98 @@
+"""
+Tests for the packed transfer format of buildDomTree (DomService.get_clickable_elements(packed=True)).
+"""
+
+import pytest
+
+from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.dom.service import (
+	PACKED_IS_INTERACTIVE,
+	PACKED_IS_TOP_ELEMENT,
+	PACKED_IS_VISIBLE,
+	PACKED_TEXT_NODE,
+	DomService,
+)
+from browser_use.dom.views import DOMElementNode
+
+JSON_RESULT = {
+	'rootId': '4',
+	'map': {
+		'0': {'type': 'TEXT_NODE', 'text': 'Home', 'isVisible': True},
+		'1': {
+			'tagName': 'a',
+			'xpath': 'html/body/a',
+			'attributes': {'href': '/home', 'title': 'Home'},
+			'children': ['0'],
+			'isVisible': True,
+			'isTopElement': True,
+			'isInteractive': True,
+			'highlightIndex': 0,
+		},
+		'2': {'type': 'TEXT_NODE', 'text': 'Hidden', 'isVisible': False},
+		'3': {'tagName': 'div', 'xpath': 'html/body/div', 'attributes': {}, 'children': ['2'], 'isVisible': False},
+		'4': {'tagName': 'body', 'xpath': '/body', 'attributes': {}, 'children': ['1', '3']},
+	},
+}
+
+ELEMENT = PACKED_IS_VISIBLE | PACKED_IS_TOP_ELEMENT
+PACKED_RESULT = {
+	'rootId': '4',
+	'packed': {
+		'idOffset': 0,
+		'strings': ['Home', 'a', 'html/body/a', 'href', '/home', 'title', 'Hidden', 'div', 'html/body/div', 'body', '/body'],
+		'flags': [PACKED_TEXT_NODE | PACKED_IS_VISIBLE, ELEMENT | PACKED_IS_INTERACTIVE, PACKED_TEXT_NODE, 0, 0],
+		'values': [0, 1, 6, 7, 9],
+		'xpaths': [-1, 2, -1, 8, 10],
+		'parents': [1, 4, 3, 4, -1],
+		'highlights': [-1, 0, -1, -1, -1],
+		'attributes': [1, 2, 3, 4, 5, 0],
+	},
+}
+
+
+async def test_packed_result_decodes_to_the_same_tree():
+	json_tree, json_selector_map = await DomService(page=None)._construct_dom_tree(JSON_RESULT)  # type: ignore[arg-type]
+	packed_tree, packed_selector_map = await DomService(page=None)._construct_dom_tree(PACKED_RESULT)  # type: ignore[arg-type]
+
+	assert packed_tree.__json__() == json_tree.__json__()
+	assert packed_tree.clickable_elements_to_string() == json_tree.clickable_elements_to_string()
+	assert packed_selector_map.keys() == json_selector_map.keys()
+
+	def assert_parents_linked(node: DOMElementNode) -> None:
+		for child in node.children:
+			assert child.parent is node
+			if isinstance(child, DOMElementNode):
+				assert_parents_linked(child)
+
+	assert_parents_linked(packed_tree)
+
+
+@pytest.fixture
+async def browser_session():
+	session = BrowserSession(browser_profile=BrowserProfile(user_data_dir=None, headless=True))
+	async with session:
+		yield session
+
+
+async def test_packed_transfer_matches_json_transfer(browser_session, httpserver):
+	httpserver.expect_request('/').respond_with_data(
+		"""<html><body>
+			<h1>Catalogue</h1>
+			<ul>
+				<li><a href="/1" title="First item">First</a></li>
+				<li><a href="/2">Second</a> <button aria-label="Add to cart">+</button></li>
+			</ul>
+			<input type="text" placeholder="Search" />
+			<div style="display: none"><button>Hidden</button></div>
+		</body></html>""",
+		content_type='text/html',
+	)
+	page = await browser_session.get_current_page()
+	await page.goto(httpserver.url_for('/'))
+
+	dom_service = DomService(page)
+	json_state = await dom_service.get_clickable_elements(highlight_elements=False, viewport_expansion=-1)
+	packed_state = await dom_service.get_clickable_elements(highlight_elements=False, viewport_expansion=-1, packed=True)
+
+	assert packed_state.element_tree.__json__() == json_state.element_tree.__json__()
+	assert packed_state.selector_map.keys() == json_state.selector_map.keys()
@@ -0,0 +1,252 @@
+"""
+Tests for the DOMElementNode / DOMTextNode tree representation.
+"""
+
+import random
+import sys
+
+import pytest
+
+from browser_use.dom.utils import cap_text_length
+from browser_use.dom.views import DEFAULT_INCLUDE_ATTRIBUTES, DOMBaseNode, DOMElementNode, DOMTextNode
+
+
+def build_tree() -> DOMElementNode:
+	body = DOMElementNode(tag_name='body', xpath='/body', attributes={}, children=[], is_visible=True, parent=None)
+	button = DOMElementNode(
+		tag_name='button',
+		xpath='html/body/button',
+		attributes={'type': 'submit'},
+		children=[],
+		is_visible=True,
+		is_top_element=True,
+		is_interactive=True,
+		highlight_index=0,
+		parent=body,
+	)
+	label = DOMTextNode(text='Save', is_visible=True, parent=button)
+	button.children.append(label)
+	body.children.append(button)
+	return body
+
+
+def test_nodes_are_slotted():
+	body = build_tree()
+	button = body.children[0]
+	label = button.children[0]  # type: ignore[attr-defined]
+
+	for node in (body, button, label):
+		assert not hasattr(node, '__dict__')
+
+	# slotted nodes are much smaller than the dict-backed nodes we used to allocate
+	assert sys.getsizeof(label) < 100
+
+
+def test_hash_is_computed_once_and_cached():
+	button = build_tree().children[0]
+	assert isinstance(button, DOMElementNode)
+
+	first = button.hash
+	assert button.hash is first
+
+
+def test_public_api_is_unchanged():
+	body = build_tree()
+	button = body.children[0]
+	assert isinstance(button, DOMElementNode)
+	assert button.parent is body
+	assert button.children[0].parent is button
+	assert body.clickable_elements_to_string() == '[0]<button type=submit>Save />'
+
+
+def legacy_text_till_next_clickable_element(self: DOMElementNode, max_depth: int = -1) -> str:
+	text_parts = []
+
+	def collect_text(node: DOMBaseNode, current_depth: int) -> None:
+		if max_depth != -1 and current_depth > max_depth:
+			return
+
+		# Skip this branch if we hit a highlighted element (except for the current node)
+		if isinstance(node, DOMElementNode) and node != self and node.highlight_index is not None:
+			return
+
+		if isinstance(node, DOMTextNode):
+			text_parts.append(node.text)
+		elif isinstance(node, DOMElementNode):
+			for child in node.children:
+				collect_text(child, current_depth + 1)
+
+	collect_text(self, 0)
+	return '\n'.join(text_parts).strip()
+
+
+def legacy_clickable_elements_to_string(self: DOMElementNode, include_attributes: list[str] | None = None) -> str:
+	"""The original recursive serializer, kept as the reference the single-pass one must match byte for byte"""
+	formatted_text = []
+
+	if not include_attributes:
+		include_attributes = DEFAULT_INCLUDE_ATTRIBUTES
+
+	def process_node(node: DOMBaseNode, depth: int) -> None:
+		next_depth = int(depth)
+		depth_str = depth * '\t'
+
+		if isinstance(node, DOMElementNode):
+			# Add element with highlight_index
+			if node.highlight_index is not None:
+				next_depth += 1
+
+				text = legacy_text_till_next_clickable_element(node)
+				attributes_html_str = None
+				if include_attributes:
+					attributes_to_include = {
+						key: str(value).strip()
+						for key, value in node.attributes.items()
+						if key in include_attributes and str(value).strip() != ''
+					}
+
+					# If value of any of the attributes is the same as ANY other value attribute only include the one that appears first in include_attributes
+					# WARNING: heavy vibes, but it seems good enough for saving tokens (it kicks in hard when it's long text)
+
+					# Pre-compute ordered keys that exist in both lists (faster than repeated lookups)
+					ordered_keys = [key for key in include_attributes if key in attributes_to_include]
+
+					if len(ordered_keys) > 1:  # Only process if we have multiple attributes
+						keys_to_remove = set()  # Use set for O(1) lookups
+						seen_values = {}  # value -> first_key_with_this_value
+
+						for key in ordered_keys:
+							value = attributes_to_include[key]
+							if len(value) > 5:  # to not remove false, true, etc
+								if value in seen_values:
+									# This value was already seen with an earlier key, so remove this key
+									keys_to_remove.add(key)
+								else:
+									# First time seeing this value, record it
+									seen_values[value] = key
+
+						# Remove duplicate keys (no need to check existence since we know they exist)
+						for key in keys_to_remove:
+							del attributes_to_include[key]
+
+					# Easy LLM optimizations
+					# if tag == role attribute, don't include it
+					if node.tag_name == attributes_to_include.get('role'):
+						del attributes_to_include['role']
+
+					# Remove attributes that duplicate the node's text content
+					attrs_to_remove_if_text_matches = ['aria-label', 'placeholder', 'title']
+					for attr in attrs_to_remove_if_text_matches:
+						if (
+							attributes_to_include.get(attr)
+							and attributes_to_include.get(attr, '').strip().lower() == text.strip().lower()
+						):
+							del attributes_to_include[attr]
+
+					if attributes_to_include.items():
+						# Format as key1='value1' key2='value2'
+						attributes_html_str = ' '.join(
+							f'{key}={cap_text_length(value, 15)}' for key, value in attributes_to_include.items()
+						)
+
+				# Build the line
+				if node.is_new:
+					highlight_indicator = f'*[{node.highlight_index}]'
+
+				else:
+					highlight_indicator = f'[{node.highlight_index}]'
+
+				line = f'{depth_str}{highlight_indicator}<{node.tag_name}'
+
+				if attributes_html_str:
+					line += f' {attributes_html_str}'
+
+				if text:
+					# Add space before >text only if there were NO attributes added before
+					text = text.strip()
+					if not attributes_html_str:
+						line += ' '
+					line += f'>{text}'
+
+				# Add space before /> only if neither attributes NOR text were added
+				elif not attributes_html_str:
+					line += ' '
+
+				# makes sense to have if the website has lots of text -> so the LLM knows which things are part of the same clickable element and which are not
+				line += ' />'  # 1 token
+				formatted_text.append(line)
+
+			# Process children regardless
+			for child in node.children:
+				process_node(child, next_depth)
+
+		elif isinstance(node, DOMTextNode):
+			# Add text only if it doesn't have a highlighted parent
+			if node.has_parent_with_highlight_index():
+				return
+
+			if node.parent and node.parent.is_visible and node.parent.is_top_element:
+				formatted_text.append(f'{depth_str}{node.text}')
+
+	process_node(self, 0)
+	return '\n'.join(formatted_text)
+
+
+def build_random_tree(seed: int, size: int = 400) -> DOMElementNode:
+	"""Random tree mixing nested highlighted elements, hidden / non-top parents and duplicate attribute values"""
+	rng = random.Random(seed)
+	root = DOMElementNode(tag_name='body', xpath='/body', attributes={}, children=[], is_visible=True, parent=None)
+	elements = [root]
+	highlight_index = 0
+	words = ['Save', 'save', 'Cancel', 'Search products', 'button', '  padded  ', 'A much longer piece of text']
+
+	for i in range(size):
+		parent = rng.choice(elements)
+		if rng.random() < 0.35:
+			parent.children.append(DOMTextNode(text=rng.choice(words), is_visible=rng.random() < 0.9, parent=parent))
+			continue
+
+		attributes = {}
+		for key in rng.sample(DEFAULT_INCLUDE_ATTRIBUTES + ['id', 'class', 'href'], rng.randint(0, 4)):
+			attributes[key] = rng.choice(words + ['', 'true', 'button', 'div'])
+		highlighted = rng.random() < 0.4
+		element = DOMElementNode(
+			tag_name=rng.choice(['div', 'span', 'button', 'a', 'input']),
+			xpath=f'{parent.xpath}/node[{i}]',
+			attributes=attributes,
+			children=[],
+			is_visible=rng.random() < 0.9,
+			is_top_element=rng.random() < 0.8,
+			highlight_index=highlight_index if highlighted else None,
+			is_new=rng.choice([None, True, False]) if highlighted else None,
+			parent=parent,
+		)
+		highlight_index += highlighted
+		parent.children.append(element)
+		elements.append(element)
+
+	return root
+
+
+@pytest.mark.parametrize('seed', range(25))
+def test_clickable_elements_to_string_matches_recursive_serializer(seed):
+	root = build_random_tree(seed)
+	include_attributes = None if seed % 2 else ['title', 'aria-label', 'placeholder', 'role', 'id']
+
+	expected = legacy_clickable_elements_to_string(root, include_attributes)
+	assert root.clickable_elements_to_string(include_attributes) == expected
+
+	# serializing a subtree still accounts for highlighted ancestors above it
+	for subtree in root.children:
+		if isinstance(subtree, DOMElementNode):
+			assert subtree.clickable_elements_to_string(include_attributes) == legacy_clickable_elements_to_string(
+				subtree, include_attributes
+			)
+
+
+@pytest.mark.parametrize('max_length', [0, 1, 17, 100, 1000, 10**6])
+def test_clickable_elements_to_string_stops_at_budget(max_length):
+	root = build_random_tree(seed=7, size=1000)
+	full = legacy_clickable_elements_to_string(root)
+
+	assert root.clickable_elements_to_string(max_length=max_length) == full[:max_length]
@@ -0,0 +1,85 @@
+"""
+Tests for the process-wide LLM client cache (browser_use.llm.clients), no requests are made.
+"""
+
+import asyncio
+
+import httpx
+
+from browser_use.llm import ChatAnthropic, ChatGroq, ChatOpenAI, ChatOpenRouter, aclose_shared_clients
+from browser_use.llm.clients import _clients, get_shared_http_client, release_shared_clients, use_shared_clients
+
+
+async def test_clients_are_shared_between_chat_models_with_the_same_params():
+	first = ChatOpenAI(model='gpt-4.1-mini', api_key='sk-test')
+	second = ChatOpenAI(model='gpt-4.1', api_key='sk-test')
+
+	client = first.get_client()
+	assert client is first.get_client()
+	assert client is second.get_client()  # the model is a request param, not a client param
+
+	# different credentials or timeouts get their own client
+	assert ChatOpenAI(model='gpt-4.1-mini', api_key='sk-other').get_client() is not client
+	assert ChatOpenAI(model='gpt-4.1-mini', api_key='sk-test', timeout=5).get_client() is not client
+
+	await aclose_shared_clients()
+
+
+async def test_openai_based_providers_share_one_connection_pool():
+	http_client = get_shared_http_client()
+
+	assert ChatOpenAI(model='gpt-4.1-mini', api_key='sk-test').get_client()._client is http_client
+	assert ChatOpenRouter(model='openai/gpt-4.1-mini', api_key='sk-test').get_client()._client is http_client
+
+	# SDKs with their own http stack still get one cached client each
+	anthropic_client = ChatAnthropic(model='claude-sonnet-4-0', api_key='sk-test').get_client()
+	assert ChatAnthropic(model='claude-3-5-haiku-latest', api_key='sk-test').get_client() is anthropic_client
+	groq_client = ChatGroq(model='llama-3.3-70b-versatile', api_key='gsk-test').get_client()
+	assert ChatGroq(model='llama-3.3-70b-versatile', api_key='gsk-test').get_client() is groq_client
+
+	await aclose_shared_clients()
+	assert http_client.is_closed
+
+	# closed clients are transparently replaced
+	llm = ChatOpenAI(model='gpt-4.1-mini', api_key='sk-test')
+	assert not llm.get_client().is_closed()
+	assert llm.get_client()._client is get_shared_http_client() is not http_client
+
+	await aclose_shared_clients()
+
+
+async def test_clients_with_their_own_http_client_are_not_cached():
+	http_client = httpx.AsyncClient()
+	llm = ChatOpenAI(model='gpt-4.1-mini', api_key='sk-test', http_client=http_client)
+
+	client = llm.get_client()
+	assert client._client is http_client
+	assert llm.get_client() is not client
+	assert not _clients.get(asyncio.get_running_loop())
+
+	await http_client.aclose()
+
+
+async def test_last_user_closes_the_shared_clients():
+	use_shared_clients()
+	use_shared_clients()
+	http_client = get_shared_http_client()
+
+	await release_shared_clients()
+	assert not http_client.is_closed
+	await release_shared_clients()
+	assert http_client.is_closed
+
+	# releasing more than was used is harmless
+	await release_shared_clients()
+
+
+def test_clients_are_not_shared_across_event_loops():
+	llm = ChatOpenAI(model='gpt-4.1-mini', api_key='sk-test')
+
+	async def get_client():
+		client = llm.get_client()
+		await aclose_shared_clients()
+		return client
+
+	assert asyncio.run(get_client()) is not asyncio.run(get_client())
@@ -693,5 +693,80 @@ class TestMCPServerWithLLM:
 		await server.browser_session.kill()
 
 
+class TestMCPServerSessions:
+	"""Test MCP server browser sessions created with browser_create_session."""
+
+	@pytest.fixture
+	async def mcp_server(self):
+		"""Create an MCP server without a default browser session."""
+		server = BrowserUseServer(max_sessions=2, session_idle_timeout=60)
+		await server._init_browser_pool(headless=True)
+
+		yield server
+
+		# Cleanup
+		await server._close_sessions()
+
+	async def test_sessions_are_isolated_and_run_in_parallel(self, mcp_server, httpserver: HTTPServer):
+		"""Test that tool calls on different sessions use their own browser contexts."""
+		httpserver.expect_request('/page1').respond_with_data('<h1>Page 1</h1>', content_type='text/html')
+		httpserver.expect_request('/page2').respond_with_data('<h1>Page 2</h1>', content_type='text/html')
+
+		session1 = json.loads(await mcp_server._create_session())['session_id']
+		session2 = json.loads(await mcp_server._create_session())['session_id']
+		assert session1 != session2
+
+		await asyncio.gather(
+			mcp_server._execute_tool('browser_navigate', {'url': httpserver.url_for('/page1'), 'session_id': session1}),
+			mcp_server._execute_tool('browser_navigate', {'url': httpserver.url_for('/page2'), 'session_id': session2}),
+		)
+
+		state1 = json.loads(await mcp_server._execute_tool('browser_get_state', {'session_id': session1}))
+		state2 = json.loads(await mcp_server._execute_tool('browser_get_state', {'session_id': session2}))
+		assert '/page1' in state1['url']
+		assert '/page2' in state2['url']
+
+		# the default session was never started
+		assert mcp_server.browser_session is None
+
+		sessions = json.loads(mcp_server._list_sessions())
+		assert {session['session_id'] for session in sessions} == {session1, session2}
+
+	async def test_max_sessions_and_close_session(self, mcp_server):
+		"""Test that sessions can be closed to make room for new ones."""
+		session1 = json.loads(await mcp_server._create_session())['session_id']
+		await mcp_server._create_session()
+
+		result = await mcp_server._create_session()
+		assert result.startswith('Error: Too many browser sessions open (max 2)')
+
+		assert await mcp_server._close_session(session1) == f'Closed session {session1}'
+		assert await mcp_server._close_session(session1) == f'Unknown session_id: {session1}'
+		assert 'session_id' in json.loads(await mcp_server._create_session())
+
+	async def test_browser_close_with_session_id_closes_that_session(self, mcp_server):
+		"""Test that browser_close with a session_id closes that session and leaves the default browser alone."""
+		session_id = json.loads(await mcp_server._create_session())['session_id']
+
+		assert await mcp_server._execute_tool('browser_close', {'session_id': session_id}) == f'Closed session {session_id}'
+		assert session_id not in mcp_server.sessions
+		assert mcp_server.browser_session is None
+
+	async def test_unknown_session_id(self, mcp_server):
+		"""Test that tool calls with an unknown session_id fail."""
+		with pytest.raises(ValueError, match='Unknown session_id: missing'):
+			await mcp_server._execute_tool('browser_list_tabs', {'session_id': 'missing'})
+
+	async def test_idle_sessions_are_evicted(self, mcp_server):
+		"""Test that sessions without tool calls are closed after session_idle_timeout."""
+		session_id = json.loads(await mcp_server._create_session())['session_id']
+		await mcp_server._evict_idle_sessions()
+		assert session_id in mcp_server.sessions
+
+		mcp_server.sessions[session_id].last_used -= 61
+		await mcp_server._evict_idle_sessions()
+		assert session_id not in mcp_server.sessions
+
+
 if __name__ == '__main__':
 	pytest.main([__file__, '-v', '-s'])
@@ -3,6 +3,8 @@ Tests for the SchemaOptimizer to ensure it correctly processes and
 optimizes the schemas for agent actions without losing information.
 """
 
+import json
+
 from pydantic import BaseModel
 
 from browser_use.agent.views import AgentOutput
@@ -64,3 +66,49 @@ def test_optimizer_preserves_all_fields_in_structured_done_action():
 		f'Missing from optimized: {original_fields - optimized_fields}\n'
 		f'Unexpected in optimized: {optimized_fields - original_fields}'
 	)
+
+
+def test_action_models_and_schemas_are_reused_across_steps():
+	"""The same available actions must give the same models and a byte-stable schema, so provider prompt caching hits"""
+
+	controller = Controller()
+
+	action_model = controller.registry.create_action_model()
+	assert controller.registry.create_action_model() is action_model
+	done_action_model = controller.registry.create_action_model(include_actions=['done'])
+	assert done_action_model is not action_model
+	assert controller.registry.create_action_model(include_actions=['done']) is done_action_model
+
+	agent_output_model = AgentOutput.type_with_custom_actions(action_model)
+	assert AgentOutput.type_with_custom_actions(action_model) is agent_output_model
+	assert AgentOutput.type_with_custom_actions_no_thinking(action_model) is not agent_output_model
+	assert AgentOutput.type_with_custom_actions_flash_mode(action_model) is AgentOutput.type_with_custom_actions_flash_mode(
+		action_model
+	)
+
+	schema = SchemaOptimizer.create_optimized_json_schema(agent_output_model)
+	# callers modify the returned schema (e.g. to drop the title), that must not leak into the next step's schema
+	del schema['properties']
+	assert json.dumps(SchemaOptimizer.create_optimized_json_schema(agent_output_model)) == json.dumps(
+		SchemaOptimizer._create_optimized_json_schema(agent_output_model)
+	)
+
+
+def test_action_model_is_recreated_when_actions_change():
+	controller = Controller()
+	action_model = controller.registry.create_action_model()
+
+	@controller.action('A new action')
+	async def new_action():
+		pass
+
+	new_action_model = controller.registry.create_action_model()
+	assert new_action_model is not action_model
+	assert 'new_action' in json.dumps(new_action_model.model_json_schema())
+
+	# re-registering an action under the same name must not return the model of the old action
+	@controller.action('The new action, registered again')
+	async def new_action():  # noqa: F811
+		pass
+
+	assert controller.registry.create_action_model() is not new_action_model
@@ -0,0 +1,88 @@
+"""
+Tests for the content-addressed ScreenshotStore the agent history keeps its screenshots in.
+"""
+
+import base64
+
+from browser_use.agent.views import ActionResult, AgentHistory, AgentHistoryList, AgentOutput
+from browser_use.browser.views import BrowserStateHistory
+from browser_use.screenshots.service import MAX_CACHED_SCREENSHOTS, ScreenshotStore, load_screenshot
+
+PNG = base64.b64encode(b'\x89PNG\r\n\x1a\n' + b'first').decode()
+OTHER_PNG = base64.b64encode(b'\x89PNG\r\n\x1a\n' + b'second').decode()
+JPEG = base64.b64encode(b'\xff\xd8\xff\xe0' + b'third').decode()
+
+
+def history_item(store: ScreenshotStore, screenshot: str | None) -> AgentHistory:
+	return AgentHistory(
+		model_output=None,
+		result=[ActionResult()],
+		state=BrowserStateHistory(
+			url='',
+			title='',
+			tabs=[],
+			interacted_element=[],
+			screenshot_path=store.store(screenshot) if screenshot else None,
+			screenshot_store=store,
+		),
+	)
+
+
+def test_identical_screenshots_are_stored_once(tmp_path):
+	store = ScreenshotStore(tmp_path)
+
+	path = store.store(PNG)
+	assert store.store(PNG) == path
+	assert store.store(OTHER_PNG) != path
+	jpeg_path = store.store(JPEG)
+
+	assert sorted(file.suffix for file in tmp_path.iterdir()) == ['.jpg', '.png', '.png']
+	assert (tmp_path / path).read_bytes() == base64.b64decode(PNG)
+	assert store.load(path) == PNG
+	assert load_screenshot(jpeg_path) == JPEG
+
+
+def test_evicted_screenshots_are_loaded_from_disk(tmp_path):
+	store = ScreenshotStore(tmp_path)
+	path = store.store(PNG)
+	for i in range(MAX_CACHED_SCREENSHOTS):
+		store.store(base64.b64encode(f'filler {i}'.encode()).decode())
+
+	assert path not in store._cached_screenshots
+	assert store.load(path) == PNG
+	assert path in store._cached_screenshots
+
+	# each store has its own cache
+	assert path not in ScreenshotStore(tmp_path)._cached_screenshots
+
+	assert store.load(tmp_path / 'missing.png') is None
+
+
+def test_history_holds_screenshot_paths(tmp_path):
+	store = ScreenshotStore(tmp_path / 'screenshots')
+	history = AgentHistoryList(
+		history=[
+			history_item(store, PNG),
+			history_item(store, None),
+			history_item(store, PNG),
+			history_item(store, OTHER_PNG),
+		]
+	)
+
+	assert all(h.state.screenshot is None for h in history.history)
+	assert history.screenshots() == [PNG, None, PNG, OTHER_PNG]
+	assert history.screenshots(n_last=3, return_none_if_not_screenshot=False) == [PNG, OTHER_PNG]
+	assert history.screenshots(n_last=0) == []
+
+	# saved histories embed the images, so they still work once the stored files are gone
+	history_file = tmp_path / 'history.json'
+	history.save_to_file(history_file)
+	for file in (tmp_path / 'screenshots').iterdir():
+		file.unlink()
+
+	loaded = AgentHistoryList.load_from_file(history_file, AgentOutput)
+	assert loaded.screenshots() == [PNG, None, PNG, OTHER_PNG]
+
+	# histories saved before screenshots were stored on disk still work
+	legacy = BrowserStateHistory(url='', title='', tabs=[], interacted_element=[], screenshot=JPEG)
+	assert legacy.get_screenshot() == JPEG
@@ -1,7 +1,12 @@
 """Tests for CloudSync client machinery - retry logic, event handling, backend communication."""
 
+import asyncio
+import gzip
+import json
 import os
+import socket
 import tempfile
+import time
 from pathlib import Path
 
 import httpx
@@ -106,6 +111,7 @@ class TestCloudSyncEventHandling:
 				gif_url=None,
 			)
 		)
+		await authenticated_sync.flush()
 
 		# Verify forwarding
 		assert len(requests) == 1
@@ -137,6 +143,7 @@ class TestCloudSyncEventHandling:
 				gif_url=None,
 			)
 		)
+		await unauthenticated_sync.flush()
 
 		# Event should be queued
 		assert len(unauthenticated_sync.pending_events) == 1
@@ -171,6 +178,7 @@ class TestCloudSyncEventHandling:
 				gif_url=None,
 			)
 		)
+		await unauthenticated_sync.flush()
 
 		# Verify temp user ID was injected
 		assert len(requests) == 1
@@ -182,7 +190,7 @@ class TestCloudSyncRetryLogic:
 	"""Test CloudSync retry and error handling logic."""
 
 	@pytest.fixture
-	def sync_with_auth(self, httpserver: HTTPServer, http_client, temp_config_dir):
+	async def sync_with_auth(self, httpserver: HTTPServer, http_client, temp_config_dir):
 		"""Create CloudSync with auth."""
 		auth = DeviceAuthClient(base_url=httpserver.url_for(''), http_client=http_client)
 		auth.auth_config.api_token = 'test-api-key'
@@ -191,7 +199,9 @@ class TestCloudSyncRetryLogic:
 		service = CloudSync(base_url=httpserver.url_for(''), enable_auth=True)
 		service.auth_client = auth
 		service.session_id = 'test-session-id'
-		return service
+		yield service
+		# stop uploads still being retried, so they don't reach the next tests
+		await service.close(timeout=0)
 
 	async def test_pending_event_resending(self, httpserver: HTTPServer, sync_with_auth):
 		"""Test resending of pending events after authentication."""
@@ -236,10 +246,9 @@ class TestCloudSyncRetryLogic:
 		# Resend pending events
 		await sync_with_auth._resend_pending_events()
 
-		# Should send all pending events with updated user ID
-		assert len(requests) == 2
-		for i, request in enumerate(requests):
-			event = request['events'][0]
+		# Should send all pending events in one batch with updated user ID
+		assert len(requests) == 1
+		for i, event in enumerate(requests[0]['events']):
 			assert event['user_id'] == 'test-user-123'  # Updated from temp ID
 			assert f'Pending task {i + 1}' == event['task']
 
@@ -324,11 +333,12 @@ class TestCloudSyncRetryLogic:
 			tasks.append(task)
 
 		await asyncio.gather(*tasks)
+		await sync_with_auth.flush()
 
-		# All events should be sent
-		assert len(requests) == 5
+		# All events should be sent, batched into a single request
+		assert len(requests) == 1
 		# Just verify all events have task data - order may vary due to concurrency
-		task_values = [req['events'][0]['task'] for req in requests]
+		task_values = [event['task'] for req in requests for event in req['events']]
 		expected_tasks = [f'Concurrent task {i}' for i in range(5)]
 		assert sorted(task_values) == sorted(expected_tasks)
 
@@ -384,6 +394,7 @@ class TestCloudSyncBackendCommunication:
 				gif_url=None,
 			)
 		)
+		await service.flush()
 
 		assert len(requests) == 1
 
@@ -425,6 +436,7 @@ class TestCloudSyncBackendCommunication:
 				gif_url=None,
 			)
 		)
+		await service.flush()
 
 		# Check auth header was included
 		assert len(requests) == 1
@@ -449,6 +461,7 @@ class TestCloudSyncBackendCommunication:
 				gif_url=None,
 			)
 		)
+		await service.flush()
 
 		# Check no auth header
 		assert len(requests) == 1
@@ -460,9 +473,12 @@ class TestCloudSyncErrorHandling:
 	"""Test CloudSync error handling doesn't crash the agent."""
 
 	@pytest.fixture
-	def sync_service(self, httpserver: HTTPServer, temp_config_dir):
+	async def sync_service(self, httpserver: HTTPServer, temp_config_dir):
 		"""Create CloudSync service."""
-		return CloudSync(base_url=httpserver.url_for(''), enable_auth=False)
+		service = CloudSync(base_url=httpserver.url_for(''), enable_auth=False)
+		yield service
+		# stop uploads still being retried, so they don't reach the next tests
+		await service.close(timeout=0)
 
 	async def test_timeout_error_handling(self, sync_service):
 		"""Test that timeout errors are handled gracefully."""
@@ -601,6 +617,146 @@ class TestCloudSyncErrorHandling:
 
 		# All should complete without raising
 		await asyncio.gather(*tasks)
+		await sync_service.flush()
 
 		# ~7 should succeed (10 total, ~3 fail)
-		assert len(successful_requests) >= 6
+		assert sum(len(request['events']) for request in successful_requests) >= 6
+
+
+class TestCloudSyncBatching:
+	"""Test the background uploader batching events into few requests."""
+
+	@staticmethod
+	def make_event(i: int) -> CreateAgentTaskEvent:
+		return CreateAgentTaskEvent(
+			agent_session_id='test-session',
+			llm_model='test-model',
+			task=f'Batched task {i}',
+			user_id='test-user-123',
+			device_id='test-device-id',
+			done_output=None,
+			user_feedback_type=None,
+			user_comment=None,
+			gif_url=None,
+		)
+
+	async def test_events_are_batched_by_size(self, httpserver: HTTPServer, temp_config_dir):
+		"""Test that queued events are sent in batches of at most batch_size events."""
+		requests = []
+
+		def capture_request(request):
+			requests.append(request.get_json())
+			from werkzeug.wrappers import Response
+
+			return Response('{"processed": 1, "failed": 0}', status=200, mimetype='application/json')
+
+		httpserver.expect_request('/api/v1/events', method='POST').respond_with_handler(capture_request)
+
+		service = CloudSync(base_url=httpserver.url_for(''), enable_auth=False, batch_size=4, flush_interval=10.0)
+		for i in range(10):
+			await service.handle_event(self.make_event(i))
+
+		# handle_event only queues the events
+		assert requests == []
+
+		# the last batch isn't full, flush() doesn't wait for flush_interval to send it
+		await service.flush(timeout=5)
+		assert [len(request['events']) for request in requests] == [4, 4, 2]
+		assert [event['task'] for request in requests for event in request['events']] == [f'Batched task {i}' for i in range(10)]
+
+		await service.close()
+
+	async def test_batches_are_sent_after_flush_interval(self, httpserver: HTTPServer, temp_config_dir):
+		"""Test that a batch that isn't full is sent flush_interval seconds after its first event."""
+		requests = []
+
+		def capture_request(request):
+			requests.append(request.get_json())
+			from werkzeug.wrappers import Response
+
+			return Response('{"processed": 1, "failed": 0}', status=200, mimetype='application/json')
+
+		httpserver.expect_request('/api/v1/events', method='POST').respond_with_handler(capture_request)
+
+		service = CloudSync(base_url=httpserver.url_for(''), enable_auth=False, flush_interval=0.1)
+		await service.handle_event(self.make_event(0))
+
+		await asyncio.sleep(1)
+		assert len(requests) == 1
+
+		await service.close()
+
+	async def test_failed_batches_are_retried(self, httpserver: HTTPServer, temp_config_dir):
+		"""Test that a batch is retried with backoff while the backend returns 5xx errors."""
+		statuses = [503, 503, 200]
+		received = []
+
+		def handler(request):
+			received.append(request.get_json())
+			from werkzeug.wrappers import Response
+
+			return Response('{}', status=statuses[len(received) - 1], mimetype='application/json')
+
+		httpserver.expect_request('/api/v1/events', method='POST').respond_with_handler(handler)
+
+		service = CloudSync(base_url=httpserver.url_for(''), enable_auth=False, flush_interval=0)
+		await service.handle_event(self.make_event(0))
+		await service.flush(timeout=10)
+
+		assert len(received) == 3
+		assert all(request['events'][0]['task'] == 'Batched task 0' for request in received)
+
+		await service.close()
+
+	async def test_connect_errors_are_not_retried(self, temp_config_dir):
+		"""Test that a batch is dropped right away when nothing is listening at the backend URL."""
+		with socket.socket() as sock:
+			sock.bind(('127.0.0.1', 0))
+			port = sock.getsockname()[1]
+
+		service = CloudSync(base_url=f'http://127.0.0.1:{port}', enable_auth=False, flush_interval=0)
+		await service.handle_event(self.make_event(0))
+
+		start = time.monotonic()
+		await service.flush(timeout=10)
+		assert time.monotonic() - start < 0.5
+
+		await service.close()
+
+	async def test_gzip_compression(self, httpserver: HTTPServer, temp_config_dir):
+		"""Test that request bodies are gzipped when compress=True."""
+		bodies = []
+
+		def handler(request):
+			assert request.headers['Content-Encoding'] == 'gzip'
+			bodies.append(json.loads(gzip.decompress(request.get_data())))
+			from werkzeug.wrappers import Response
+
+			return Response('{}', status=200, mimetype='application/json')
+
+		httpserver.expect_request('/api/v1/events', method='POST').respond_with_handler(handler)
+
+		service = CloudSync(base_url=httpserver.url_for(''), enable_auth=False, compress=True)
+		await service.handle_event(self.make_event(0))
+		await service.flush(timeout=5)
+
+		assert bodies[0]['events'][0]['task'] == 'Batched task 0'
+
+		await service.close()
+
+	async def test_full_queue_drops_oldest_events(self, httpserver: HTTPServer, temp_config_dir):
+		"""Test that the queue is bounded and drops the oldest events when the backend can't keep up."""
+		service = CloudSync(base_url=httpserver.url_for(''), enable_auth=False, max_queue_size=3)
+		# fill the queue without giving the uploader a chance to run
+		for i in range(5):
+			await service.handle_event(self.make_event(i))
+
+		assert service._queue.qsize() == 3
+		assert [service._queue.get_nowait().task for _ in range(3)] == [  # type: ignore[attr-defined]
+			'Batched task 2',
+			'Batched task 3',
+			'Batched task 4',
+		]
+
+		assert service._uploader_task is not None
+		service._uploader_task.cancel()
@@ -369,6 +369,7 @@ class TestCloudSync:
 				device_id='test-device-id',
 			)
 		)
+		await service.flush()
 
 		# Check request was made
 		assert len(requests) == 1
@@ -424,6 +425,7 @@ class TestCloudSync:
 				device_id='test-device-id',
 			)
 		)
+		await service.flush()
 
 		# Check request was made without auth header
 		assert len(requests) == 1
@@ -486,6 +488,7 @@ class TestCloudSync:
 				device_id='test-device-id',
 			)
 		)
+		await service.flush()
 
 		# Event should be in pending_events since we got 401
 		assert len(service.pending_events) == 1
@@ -543,6 +546,7 @@ class TestCloudSync:
 		)
 
 		# Should handle error gracefully without crashing
+		await service.close(timeout=0)
 
 	async def test_update_wal_events(self, temp_config_dir):
 		"""Test updating WAL events with real user ID."""
@@ -610,6 +614,26 @@ class TestCloudSync:
 		assert updated_events[2]['event_type'] == 'CreateAgentStepEvent'
 		assert updated_events[2]['step'] == 1
 
+	async def test_update_wal_events_keeps_wal_on_error(self, temp_config_dir):
+		"""Test that a WAL that can't be rewritten is left untouched, without leftover temp files."""
+		auth = DeviceAuthClient(base_url='http://localhost:8000')
+		auth.auth_config.api_token = 'test-api-key'
+		auth.auth_config.user_id = 'test-user-123'
+
+		service = CloudSync(base_url='http://localhost:8000', enable_auth=True)
+		service.auth_client = auth
+
+		events_dir = temp_config_dir / 'events'
+		events_dir.mkdir(exist_ok=True)
+		wal_path = events_dir / 'test-session-id.jsonl'
+		content = json.dumps({'event_type': 'CreateAgentTaskEvent', 'user_id': TEMP_USER_ID}) + '\n{not json\n'
+		await anyio.Path(wal_path).write_text(content)
+
+		await service._update_wal_user_ids('test-session-id')
+
+		assert await anyio.Path(wal_path).read_text() == content
+		assert [path.name for path in events_dir.iterdir()] == ['test-session-id.jsonl']
+
 
 class TestIntegration:
 	"""Integration tests for OAuth2 and cloud sync."""
@@ -719,6 +743,8 @@ class TestIntegration:
 		assert saved_auth['api_token'] == 'test-api-key'
 		assert saved_auth['user_id'] == 'test-user-123'
 
+		await service.close(timeout=0)
+
 
 class TestAuthResilience:
 	"""Test auth resilience scenarios - agent should never break due to sync failures."""
@@ -787,6 +813,8 @@ class TestAuthResilience:
 		# Agent should continue functioning despite sync failure
 		assert True  # No exception raised
 
+		await service.close(timeout=0)
+
 	async def test_auth_failure_resilience(self, httpserver: HTTPServer, http_client, temp_config_dir):
 		"""Test that auth failures don't break the agent."""
 		# Set up auth endpoint to always fail
@@ -828,6 +856,8 @@ class TestAuthResilience:
 			)
 		)
 
+		await service.close(timeout=0)
+
 	async def test_server_downtime_resilience(self, httpserver: HTTPServer, http_client, temp_config_dir):
 		"""Test that server downtime doesn't break the agent."""
 		auth = DeviceAuthClient(base_url=httpserver.url_for(''), http_client=http_client)
@@ -859,6 +889,8 @@ class TestAuthResilience:
 			)
 		)
 
+		await service.close(timeout=0)
+
 	async def test_excessive_event_queue_handling(self, httpserver: HTTPServer, http_client, temp_config_dir):
 		"""Test that excessive event queuing doesn't break the agent."""
 		auth = DeviceAuthClient(base_url=httpserver.url_for(''), http_client=http_client)
@@ -887,6 +919,8 @@ class TestAuthResilience:
 		# Agent should still be functioning
 		assert True  # No memory issues or crashes
 
+		await service.close(timeout=0)
+
 	async def test_malformed_server_responses(self, httpserver: HTTPServer, http_client, temp_config_dir):
 		"""Test that malformed server responses don't break the agent."""
 		# Set up malformed JSON responses
@@ -928,3 +962,5 @@ class TestAuthResilience:
 				device_id='test-device-id',
 			)
 		)
+
+		await service.close(timeout=0)
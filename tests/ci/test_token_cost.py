@@ -0,0 +1,181 @@
+"""
+Tests for the running usage totals and the pricing data of TokenCost.
+"""
+
+import json
+import logging
+from datetime import datetime, timedelta
+
+import pytest
+
+from browser_use.llm.views import ChatInvokeUsage
+from browser_use.tokens import service as token_cost_service
+from browser_use.tokens.service import TokenCost
+
+PRICING_DATA = {
+	'model-a': {
+		'input_cost_per_token': 0.001,
+		'output_cost_per_token': 0.002,
+		'cache_read_input_token_cost': 0.0001,
+	},
+	'model-b': {
+		'input_cost_per_token': 0.01,
+		'output_cost_per_token': 0.02,
+	},
+}
+
+
+def make_usage(prompt_tokens: int, completion_tokens: int, prompt_cached_tokens: int | None = None) -> ChatInvokeUsage:
+	return ChatInvokeUsage(
+		prompt_tokens=prompt_tokens,
+		prompt_cached_tokens=prompt_cached_tokens,
+		prompt_cache_creation_tokens=None,
+		prompt_image_tokens=None,
+		completion_tokens=completion_tokens,
+		total_tokens=prompt_tokens + completion_tokens,
+	)
+
+
+def make_token_cost(include_cost: bool = True) -> TokenCost:
+	token_cost = TokenCost(include_cost=include_cost)
+	token_cost._pricing_data = PRICING_DATA
+	token_cost._initialized = True
+	return token_cost
+
+
+async def test_usage_summary_totals_per_model():
+	token_cost = make_token_cost()
+	token_cost.add_usage('model-a', make_usage(1000, 100, prompt_cached_tokens=400))
+	token_cost.add_usage('model-a', make_usage(2000, 200))
+	token_cost.add_usage('model-b', make_usage(500, 50))
+
+	summary = await token_cost.get_usage_summary()
+
+	assert summary.entry_count == 3
+	assert summary.total_prompt_tokens == 3500
+	assert summary.total_prompt_cached_tokens == 400
+	assert summary.total_completion_tokens == 350
+	assert summary.total_tokens == 3850
+	assert summary.total_prompt_cost == pytest.approx(600 * 0.001 + 400 * 0.0001 + 2000 * 0.001 + 500 * 0.01)
+	assert summary.total_prompt_cached_cost == pytest.approx(400 * 0.0001)
+	assert summary.total_completion_cost == pytest.approx(300 * 0.002 + 50 * 0.02)
+
+	assert summary.by_model['model-a'].invocations == 2
+	assert summary.by_model['model-a'].total_tokens == 3300
+	assert summary.by_model['model-a'].average_tokens_per_invocation == 1650
+	assert summary.by_model['model-b'].cost == pytest.approx(500 * 0.01 + 50 * 0.02)
+
+	model_summary = await token_cost.get_usage_summary(model='model-b')
+	assert model_summary.entry_count == 1
+	assert list(model_summary.by_model) == ['model-b']
+
+	tokens = token_cost.get_usage_tokens_for_model('model-a')
+	assert (tokens.prompt_tokens, tokens.prompt_cached_tokens, tokens.completion_tokens) == (3000, 400, 300)
+
+
+async def test_usage_summary_since(monkeypatch):
+	start = datetime(2026, 1, 1, 12, 0)
+	now = start
+
+	class FakeDatetime(datetime):
+		@classmethod
+		def now(cls, tz=None):
+			return now
+
+	monkeypatch.setattr(token_cost_service, 'datetime', FakeDatetime)
+
+	# entries one minute apart, alternating between two models
+	token_cost = make_token_cost(include_cost=False)
+	for i in range(10):
+		now = start + timedelta(minutes=i)
+		token_cost.add_usage('model-a' if i % 2 else 'model-b', make_usage(100 * (i + 1), 10))
+
+	for since_minute in (0, 3, 9, 10):
+		since = start + timedelta(minutes=since_minute)
+		summary = await token_cost.get_usage_summary(since=since)
+
+		expected = [entry for entry in token_cost.usage_history if entry.timestamp >= since]
+		assert summary.entry_count == len(expected) == 10 - since_minute
+		assert summary.total_prompt_tokens == sum(entry.usage.prompt_tokens for entry in expected)
+		assert set(summary.by_model) == {entry.model for entry in expected}
+		assert summary.total_cost == 0
+
+
+async def test_usage_added_before_pricing_is_loaded_is_costed():
+	token_cost = TokenCost(include_cost=True)
+	token_cost.add_usage('model-a', make_usage(1000, 100))
+
+	async def load_pricing_data():
+		token_cost._pricing_data = PRICING_DATA
+
+	token_cost._load_pricing_data = load_pricing_data
+	summary = await token_cost.get_usage_summary()
+
+	assert summary.total_cost == pytest.approx(1000 * 0.001 + 100 * 0.002)
+
+	token_cost.clear_history()
+	assert (await token_cost.get_usage_summary()).entry_count == 0
+
+
+async def test_pricing_works_offline_from_the_bundled_snapshot(tmp_path):
+	token_cost = TokenCost(include_cost=True)
+	token_cost._cache_dir = tmp_path
+	token_cost.PRICING_URL = 'http://127.0.0.1:9/unreachable.json'
+
+	pricing = await token_cost.get_model_pricing('gpt-4o')
+
+	assert pricing is not None and pricing.input_cost_per_token
+	assert token_cost._refresh_task is not None
+	await token_cost._refresh_task
+	# the failed refresh keeps the bundled prices
+	assert await token_cost.get_model_pricing('gpt-4o') == pricing
+
+
+async def test_models_without_pricing_are_logged_once(tmp_path, caplog):
+	token_cost = TokenCost(include_cost=True)
+	token_cost._cache_dir = tmp_path
+	token_cost.PRICING_URL = 'http://127.0.0.1:9/unreachable.json'
+
+	with caplog.at_level(logging.DEBUG, logger=token_cost_service.logger.name):
+		assert await token_cost.calculate_cost('unknown-model', make_usage(1000, 100)) is None
+		assert await token_cost.calculate_cost('unknown-model', make_usage(1000, 100)) is None
+
+	messages = [record.getMessage() for record in caplog.records if 'unknown-model' in record.getMessage()]
+	assert len(messages) == 1 and 'bundled pricing snapshot' in messages[0]
+	assert token_cost._refresh_task is not None
+	await token_cost._refresh_task
+
+
+async def test_stale_pricing_is_refreshed_in_the_background(tmp_path, httpserver):
+	httpserver.expect_request('/prices.json').respond_with_json(
+		{
+			'sample_spec': 'not a model',
+			'model-a': {'input_cost_per_token': 0.5, 'output_cost_per_token': 1.0, 'litellm_provider': 'openai', 'mode': 'chat'},
+		}
+	)
+	stale_timestamp = (datetime.now() - TokenCost.CACHE_DURATION - timedelta(hours=1)).strftime('%Y%m%d_%H%M%S')
+	(tmp_path / f'pricing_index_{stale_timestamp}.json').write_text(json.dumps({'models': PRICING_DATA}))
+
+	token_cost = TokenCost(include_cost=True)
+	token_cost._cache_dir = tmp_path
+	token_cost.PRICING_URL = httpserver.url_for('/prices.json')
+
+	# the stale prices are used right away, while fresh ones are fetched
+	pricing = await token_cost.get_model_pricing('model-a')
+	assert pricing is not None and pricing.input_cost_per_token == 0.001
+
+	assert token_cost._refresh_task is not None
+	await token_cost._refresh_task
+	pricing = await token_cost.get_model_pricing('model-a')
+	assert pricing is not None and pricing.input_cost_per_token == 0.5
+
+	# the fresh prices are cached with only the fields we use, and are used without refreshing by the next services
+	cache_file = token_cost._find_newest_cache()
+	assert cache_file is not None and cache_file.name != f'pricing_index_{stale_timestamp}.json'
+	assert json.loads(cache_file.read_text())['models']['model-a'] == {'input_cost_per_token': 0.5, 'output_cost_per_token': 1.0}
+
+	next_token_cost = TokenCost(include_cost=True)
+	next_token_cost._cache_dir = tmp_path
+	pricing = await next_token_cost.get_model_pricing('model-a')
+	assert pricing is not None and pricing.input_cost_per_token == 0.5
+	assert next_token_cost._refresh_task is None